@@ -3,7 +3,7 @@ from django.contrib.auth import admin as auth_admin
 from django.contrib.auth.forms import UserCreationForm
 from django.utils.translation import ugettext_lazy as _
 
-from account import models
+from account import models, pagination
 
 
 @admin.register(models.Email)
@@ -21,8 +21,11 @@ class EmailAdmin(admin.ModelAdmin):
     )
     list_display = ('address', 'user', 'is_verified')
     list_filter = ('is_verified',)
+    list_select_related = ('user',)
+    paginator = pagination.EstimatedCountPaginator
     readonly_fields = ('time_created', 'time_updated')
     search_fields = ('address', 'user__name')
+    show_full_result_count = False
 
 
 @admin.register(models.EmailVerification)
@@ -34,10 +37,33 @@ class EmailVerificationAdmin(admin.ModelAdmin):
     date_hierarchy = 'time_created'
     fields = ('email', 'time_created', 'token')
     list_display = ('id', 'email', 'time_created')
+    list_select_related = ('email',)
     readonly_fields = ('time_created', 'token')
     search_fields = ('email__address', 'token')
 
 
+@admin.register(models.OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """
+    Admin for the OutgoingEmail model.
+    """
+    fields = (
+        'subject',
+        'recipient_list',
+        'from_email',
+        'template_name',
+        'context',
+        'attempts',
+        'last_error',
+        'time_created',
+        'time_next_attempt',
+    )
+    list_display = ('subject', 'recipient_list', 'attempts', 'time_created')
+    list_filter = ('attempts',)
+    readonly_fields = ('time_created',)
+    search_fields = ('recipient_list',)
+
+
 class UserAddForm(UserCreationForm):
     class Meta:
         fields = ('name',)
@@ -53,7 +79,6 @@ class UserAdmin(auth_admin.UserAdmin):
     )
     add_form = UserAddForm
     autocomplete_fields = ('primary_email',)
-    date_hierarchy = 'time_created'
     fieldsets = (
         (None, {
             'fields': ('name', 'password'),
@@ -79,5 +104,11 @@ class UserAdmin(auth_admin.UserAdmin):
         'is_superuser',
         'time_created',
     )
+    # A date hierarchy would query the distinct dates of every user on
+    # each page load, while a date filter only adds a range condition.
+    list_filter = auth_admin.UserAdmin.list_filter + ('time_created',)
+    list_select_related = ('primary_email',)
     ordering = None
+    paginator = pagination.EstimatedCountPaginator
     search_fields = ('name',)
+    show_full_result_count = False
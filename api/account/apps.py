@@ -5,3 +5,12 @@ from django.utils.translation import ugettext_lazy as _
 class AccountConfig(AppConfig):
     name = 'account'
     verbose_name = _('Account Management')
+
+    def ready(self):
+        # Register signal handlers
+        from account import signals     # noqa
+
+        from account import caching
+        from api import metrics
+
+        metrics.register_collector(caching.collect_metrics)
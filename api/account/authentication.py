@@ -1,15 +1,28 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.utils.translation import ugettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
 
-from account import models
+from account import caching, models
 
 
 UserModel = get_user_model()
 
 
-class EmailBackend:
+class EmailBackend(ModelBackend):
     """
     Authentication backend that allows users to login with any verified
     email address that they own.
+
+    Permissions are resolved from the user's groups and permissions as
+    with Django's ``ModelBackend``, but are cached between requests.
     """
 
     @staticmethod
@@ -40,10 +53,18 @@ class EmailBackend:
                 credentials is not active.
         """
         email = email or username
+        if email is None:
+            # Django tries every backend, including with credentials
+            # meant for other backends that don't include an email.
+            return None
+
+        # The user is fetched along with the email so that logging in
+        # only requires a single query.
+        emails = models.Email.objects.select_related('user')
 
         try:
-            email_instance = models.Email.objects.get(
-                address=email,
+            email_instance = emails.get(
+                canonical_address=models.Email.canonicalize_address(email),
                 is_verified=True,
             )
         except models.Email.DoesNotExist:
@@ -56,6 +77,47 @@ class EmailBackend:
 
         return user
 
+    def get_all_permissions(self, user_obj, obj=None):
+        """
+        Get the names of every permission a user has.
+
+        The permissions are cached under a key containing the current
+        permissions version, which changes whenever a group or
+        permission assignment changes.
+
+        Args:
+            user_obj:
+                The user to get the permissions of.
+            obj:
+                The object to get permissions for. Object permissions
+                are not supported.
+
+        Returns:
+            A set of permission names in the form
+            ``"<app_label>.<codename>"``.
+        """
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        if not hasattr(user_obj, '_perm_cache'):
+            # Superusers have every permission, so the flag is part of
+            # the key rather than invalidating everyone's permissions
+            # when it changes.
+            key = 'account_permissions_{}_{}_{}'.format(
+                user_obj.pk,
+                int(user_obj.is_superuser),
+                caching.get_permissions_version(),
+            )
+
+            perms = cache.get(key)
+            if perms is None:
+                perms = super().get_all_permissions(user_obj)
+                cache.set(key, perms, timeout=settings.PERMISSION_CACHE_TTL)
+
+            user_obj._perm_cache = perms
+
+        return user_obj._perm_cache
+
     @staticmethod
     def get_user(user_id):
         """
@@ -67,9 +129,69 @@ class EmailBackend:
 
         Returns:
             The user with the provided ID. ``None`` is returned if no
-            user with the provided ID exists.
+            user with the provided ID exists. Users are fetched through
+            the user cache.
+        """
+        return caching.get_user_cache().get(user_id)
+
+    @staticmethod
+    def get_users(user_ids):
+        """
+        Get multiple users by their IDs with a single query.
+
+        Args:
+            user_ids:
+                The IDs of the users to fetch.
+
+        Returns:
+            A dictionary mapping the ID of each user that exists to the
+            user instance.
+        """
+        return UserModel.objects.in_bulk(user_ids)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that looks up the token's user through the user
+    cache rather than querying the database on every request.
+    """
+
+    def get_user(self, validated_token):
+        """
+        Get the user a token was issued for.
+
+        Args:
+            validated_token:
+                The validated token provided with the request.
+
+        Returns:
+            The user the token was issued for.
+
+        Raises:
+            AuthenticationFailed:
+                If the user does not exist or is inactive.
+            InvalidToken:
+                If the token does not identify a user.
         """
         try:
-            return UserModel.objects.get(id=user_id)
-        except UserModel.DoesNotExist:
-            return None
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification'),
+            )
+
+        user = caching.get_user_cache().get(user_id)
+
+        if user is None:
+            raise AuthenticationFailed(
+                _('User not found'),
+                code='user_not_found',
+            )
+
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'),
+                code='user_inactive',
+            )
+
+        return user
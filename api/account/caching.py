@@ -0,0 +1,331 @@
+"""
+Caching of user lookups and permissions for authentication.
+
+Users are cached in a small in-process LRU with a short time to live,
+and optionally in Django's default cache so that processes can share
+lookups. Cached users are invalidated whenever they are saved or
+deleted. Other processes' in-process caches can't be invalidated, which
+is why their entries only live for a short time.
+
+Users' permissions are cached in Django's default cache under a key
+containing a permissions version. Changing any group or permission
+assignment replaces the version, which invalidates every cached set of
+permissions at once.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+
+class LRUCache:
+    """
+    A thread safe, size bounded cache whose entries expire after a fixed
+    amount of time.
+    """
+
+    def __init__(self, max_size: int, ttl: float, timer=time.monotonic):
+        """
+        Args:
+            max_size:
+                The maximum number of entries to keep. When the cache is
+                full, the least recently used entry is evicted.
+            ttl:
+                The number of seconds an entry is valid for.
+            timer:
+                A function returning the current time in seconds.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.timer = timer
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def delete(self, key):
+        """
+        Remove an entry from the cache if it exists.
+
+        Args:
+            key:
+                The key of the entry to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get(self, key):
+        """
+        Get a value from the cache.
+
+        Args:
+            key:
+                The key of the value to get.
+
+        Returns:
+            The cached value, or ``None`` if the key is not cached or
+            has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= self.timer():
+                del self._entries[key]
+
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value):
+        """
+        Add a value to the cache, evicting the least recently used entry
+        if the cache is full.
+
+        Args:
+            key:
+                The key to store the value under.
+            value:
+                The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (self.timer() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class UserCache:
+    """
+    Cache for looking up users by their ID.
+
+    Rather than the user instances themselves, the values of the user's
+    fields are cached. Each lookup builds a new instance from those
+    values so requests can't see each other's modifications.
+
+    The password hash is never cached. It is loaded from the database
+    as a deferred field if a cached user's password is checked. The
+    session authentication hash derived from it is cached instead, so
+    that authenticating a session doesn't load the password.
+    """
+    excluded_fields = ('password',)
+    key_format = 'account_user_%s'
+
+    def __init__(self):
+        self.local = LRUCache(
+            max_size=settings.USER_CACHE_SIZE,
+            ttl=settings.USER_CACHE_TTL,
+        )
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'local_hits': 0,
+            'misses': 0,
+            'shared_hits': 0,
+        }
+
+    def _attnames(self):
+        """
+        Get the names of the cached fields.
+        """
+        return [
+            field.attname
+            for field in get_user_model()._meta.concrete_fields
+            if field.name not in self.excluded_fields
+        ]
+
+    def _increment(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def clear(self):
+        """
+        Remove every user from the in-process cache and reset the
+        statistics.
+        """
+        self.local.clear()
+
+        with self._lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+    def get(self, user_id):
+        """
+        Get a user by their ID.
+
+        Args:
+            user_id:
+                The ID of the user to fetch.
+
+        Returns:
+            The user with the given ID, or ``None`` if they don't exist.
+        """
+        user_model = get_user_model()
+        key = self.key_format % user_id
+
+        entry = self.local.get(key)
+        if entry is not None:
+            self._increment('local_hits')
+        elif settings.USER_CACHE_SHARED:
+            entry = cache.get(key)
+            if entry is not None:
+                self._increment('shared_hits')
+                self.local.set(key, entry)
+
+        if entry is None:
+            self._increment('misses')
+
+            try:
+                user = user_model.objects.get(pk=user_id)
+            except (user_model.DoesNotExist, ValidationError):
+                return None
+
+            values = tuple(
+                getattr(user, attname) for attname in self._attnames()
+            )
+            entry = (values, user.get_session_auth_hash())
+
+            self.local.set(key, entry)
+            if settings.USER_CACHE_SHARED:
+                cache.set(key, entry, timeout=settings.USER_CACHE_TTL)
+
+            return user
+
+        values, session_auth_hash = entry
+        user = user_model.from_db(None, self._attnames(), values)
+        user._cached_session_auth_hash = session_auth_hash
+
+        return user
+
+    def invalidate(self, user_id):
+        """
+        Remove a user from the cache.
+
+        Args:
+            user_id:
+                The ID of the user to remove.
+        """
+        key = self.key_format % user_id
+
+        self.local.delete(key)
+        if settings.USER_CACHE_SHARED:
+            cache.delete(key)
+
+    def stats(self):
+        """
+        Get statistics about the cache's usage.
+
+        Returns:
+            A dictionary containing the number of lookups served from
+            the in-process cache, served from the shared cache, and that
+            missed both caches.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_user_cache: UserCache = None
+_user_cache_lock = threading.Lock()
+
+
+def get_user_cache():
+    """
+    Get the process-wide user cache, creating it if necessary.
+
+    Returns:
+        The user cache.
+    """
+    global _user_cache
+
+    with _user_cache_lock:
+        if _user_cache is None:
+            _user_cache = UserCache()
+
+    return _user_cache
+
+
+def collect_metrics():
+    """
+    Get the user cache's statistics as metrics.
+
+    Returns:
+        A list of tuples containing the name, description, type, and
+        value of each statistic, as expected by
+        ``api.metrics.register_collector``.
+    """
+    stats = get_user_cache().stats()
+
+    return [
+        (
+            'account_user_cache_local_hits_total',
+            'Users found in the in-process cache.',
+            'counter',
+            stats['local_hits'],
+        ),
+        (
+            'account_user_cache_misses_total',
+            'Users that were not cached.',
+            'counter',
+            stats['misses'],
+        ),
+        (
+            'account_user_cache_shared_hits_total',
+            'Users found in the shared cache.',
+            'counter',
+            stats['shared_hits'],
+        ),
+    ]
+
+
+PERMISSIONS_VERSION_KEY = 'account_permissions_version'
+
+
+def get_permissions_version():
+    """
+    Get the current permissions version, creating one if necessary.
+
+    Returns:
+        A string identifying the current state of every group and
+        permission assignment.
+    """
+    version = cache.get(PERMISSIONS_VERSION_KEY)
+
+    if version is None:
+        version = uuid.uuid4().hex
+
+        # If another process created a version first, use theirs.
+        if not cache.add(PERMISSIONS_VERSION_KEY, version, timeout=None):
+            version = cache.get(PERMISSIONS_VERSION_KEY, version)
+
+    return version
+
+
+def invalidate_permissions():
+    """
+    Invalidate every user's cached permissions by replacing the
+    permissions version.
+
+    A random version is used rather than a counter so that a version
+    can't be reused if it is evicted from the cache.
+    """
+    cache.set(PERMISSIONS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
@@ -0,0 +1,159 @@
+"""
+Streaming export of users and their email addresses.
+
+Users are read through a server-side cursor and their emails are
+fetched one chunk of users at a time, so exporting every user uses a
+constant amount of memory no matter how many users there are.
+"""
+
+import csv
+import itertools
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import prefetch_related_objects
+
+from account import models
+
+
+CSV_FIELDS = (
+    'id',
+    'name',
+    'email',
+    'is_active',
+    'is_staff',
+    'is_superuser',
+    'time_created',
+    'emails',
+    'verified_emails',
+)
+
+
+class Echo:
+    """
+    File-like object that returns what is written to it instead of
+    storing it, so that ``csv.writer`` can be used to build lines one at
+    a time.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_users(chunk_size: int = 1000):
+    """
+    Iterate over every user with their emails prefetched.
+
+    Django ignores ``prefetch_related`` when iterating over a queryset
+    with ``iterator``, so emails are prefetched manually for each chunk
+    of users read from the cursor.
+
+    Args:
+        chunk_size:
+            The number of users to read from the database at once.
+
+    Yields:
+        Every user, in the order they were created.
+    """
+    users = models.User.objects.order_by('time_created', 'id').iterator(
+        chunk_size=chunk_size,
+    )
+
+    while True:
+        chunk = list(itertools.islice(users, chunk_size))
+        if not chunk:
+            break
+
+        prefetch_related_objects(chunk, 'emails')
+
+        yield from chunk
+
+
+def serialize_user(user):
+    """
+    Build a dictionary representing a user and their emails.
+
+    Args:
+        user:
+            The user to serialize. Their emails should already be
+            prefetched.
+
+    Returns:
+        A JSON serializable dictionary describing the user.
+    """
+    emails = sorted(user.emails.all(), key=lambda email: email.address)
+    primary = next(
+        (email for email in emails if email.id == user.primary_email_id),
+        None,
+    )
+
+    return {
+        'email': primary.address if primary else None,
+        'emails': [
+            {'address': email.address, 'is_verified': email.is_verified}
+            for email in emails
+        ],
+        'id': str(user.id),
+        'is_active': user.is_active,
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+        'name': user.name,
+        'time_created': user.time_created,
+    }
+
+
+def export_csv(users):
+    """
+    Export users as CSV.
+
+    Each user is written as a single row. Their addresses are listed in
+    the ``emails`` and ``verified_emails`` columns, separated by spaces.
+
+    Args:
+        users:
+            An iterable of users with their emails prefetched.
+
+    Yields:
+        The header row followed by a line for each user.
+    """
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(CSV_FIELDS)
+
+    for user in users:
+        row = serialize_user(user)
+        emails = row['emails']
+
+        row['emails'] = ' '.join(email['address'] for email in emails)
+        row['time_created'] = row['time_created'].isoformat()
+        row['verified_emails'] = ' '.join(
+            email['address'] for email in emails if email['is_verified']
+        )
+
+        yield writer.writerow([row[field] for field in CSV_FIELDS])
+
+
+def export_jsonl(users):
+    """
+    Export users as JSON Lines.
+
+    Args:
+        users:
+            An iterable of users with their emails prefetched.
+
+    Yields:
+        A line containing a JSON object for each user.
+    """
+    for user in users:
+        yield json.dumps(serialize_user(user), cls=DjangoJSONEncoder) + '\n'
+
+
+EXPORTERS = {
+    'csv': export_csv,
+    'jsonl': export_jsonl,
+}
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
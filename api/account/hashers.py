@@ -0,0 +1,149 @@
+"""
+Password hashers whose cost is configured through settings.
+
+Each hasher keeps the algorithm name of the Django hasher it extends, so
+existing password hashes remain valid. When the configured cost of the
+preferred hasher changes, Django transparently re-hashes a user's
+password the next time they log in.
+
+If the ``PASSWORD_HASHING_THREADS`` setting is non-zero, hashing is
+performed in a bounded, process-wide thread pool. Both PBKDF2 and argon2
+release the GIL while hashing, so this caps the number of CPU cores a
+burst of logins can consume without blocking other requests.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from api import metrics
+
+
+_executor: ThreadPoolExecutor = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_executor():
+    """
+    Get the thread pool used to hash passwords, creating it if
+    necessary.
+
+    Returns:
+        The process-wide password hashing thread pool.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_THREADS,
+                thread_name_prefix='password-hasher',
+            )
+
+    return _executor
+
+
+def _run_in_pool(func, *args, **kwargs):
+    """
+    Run a function inside the hashing pool and mark the thread so nested
+    calls run inline.
+    """
+    _local.in_pool = True
+
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.in_pool = False
+
+
+def run_hasher(func, *args, **kwargs):
+    """
+    Run a hashing function, offloading it to the hashing thread pool if
+    one is configured. The time taken is recorded in the current
+    request's ``hash`` timer.
+
+    Args:
+        func:
+            The function to run.
+        *args:
+            Positional arguments to pass to the function.
+        **kwargs:
+            Keyword arguments to pass to the function.
+
+    Returns:
+        The return value of the function.
+    """
+    # Hashers call each other (PBKDF2 verifies by encoding), so calls
+    # made from within the pool must not wait on the pool again, and
+    # nested calls must not be timed twice.
+    in_pool = getattr(_local, 'in_pool', False)
+    if in_pool or getattr(_local, 'timing', False):
+        return func(*args, **kwargs)
+
+    _local.timing = True
+
+    try:
+        with metrics.timer('hash'):
+            if not settings.PASSWORD_HASHING_THREADS:
+                return func(*args, **kwargs)
+
+            future = _get_executor().submit(
+                _run_in_pool,
+                func,
+                *args,
+                **kwargs,
+            )
+
+            return future.result()
+    finally:
+        _local.timing = False
+
+
+class OffloadedHasherMixin:
+    """
+    Mixin for password hashers that runs the expensive operations
+    through ``run_hasher``.
+    """
+
+    def encode(self, password, salt, *args, **kwargs):
+        return run_hasher(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return run_hasher(super().verify, password, encoded)
+
+
+class Argon2PasswordHasher(
+        OffloadedHasherMixin,
+        hashers.Argon2PasswordHasher):
+    """
+    Argon2 hasher with parameters taken from the ``ARGON2_TIME_COST``,
+    ``ARGON2_MEMORY_COST``, and ``ARGON2_PARALLELISM`` settings.
+    """
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+
+class PBKDF2PasswordHasher(
+        OffloadedHasherMixin,
+        hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher with the number of iterations taken from the
+    ``PBKDF2_ITERATIONS`` setting.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
@@ -0,0 +1,148 @@
+"""
+Utilities for delivering queued email efficiently.
+"""
+
+import threading
+import time
+
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class FakeEmailBackend(BaseEmailBackend):
+    """
+    Email backend that discards messages after simulating the latency
+    of a remote provider.
+
+    Opening a connection costs ``open_latency`` seconds, and each
+    message costs ``send_latency`` seconds. Sending a message without
+    an open connection opens and closes one around it, just like the
+    SMTP and SES backends do. This makes it possible to benchmark the
+    throughput of the outbox worker without network access.
+    """
+
+    def __init__(
+            self,
+            fail_silently: bool = False,
+            open_latency: float = 0.05,
+            send_latency: float = 0.01,
+            **kwargs):
+        super().__init__(fail_silently=fail_silently, **kwargs)
+
+        self.open_latency = open_latency
+        self.send_latency = send_latency
+
+        self.connections_opened = 0
+        self.is_open = False
+        self.messages_sent = 0
+
+    def close(self):
+        """
+        Close the simulated connection.
+        """
+        self.is_open = False
+
+    def open(self):
+        """
+        Open the simulated connection if it is not already open.
+
+        Returns:
+            A boolean indicating if a new connection was opened.
+        """
+        if self.is_open:
+            return False
+
+        time.sleep(self.open_latency)
+
+        self.connections_opened += 1
+        self.is_open = True
+
+        return True
+
+    def send_messages(self, email_messages):
+        """
+        Pretend to send the provided messages.
+
+        Args:
+            email_messages:
+                The messages to send.
+
+        Returns:
+            The number of messages sent.
+        """
+        if not email_messages:
+            return 0
+
+        new_connection = self.open()
+
+        try:
+            for _ in email_messages:
+                time.sleep(self.send_latency)
+                self.messages_sent += 1
+        finally:
+            if new_connection:
+                self.close()
+
+        return len(email_messages)
+
+
+class TokenBucket:
+    """
+    Rate limiter that allows bursts of up to ``capacity`` operations and
+    an average of ``rate`` operations per second.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: float = None,
+            clock=time.monotonic,
+            sleep=time.sleep):
+        """
+        Args:
+            rate:
+                The number of tokens added to the bucket every second.
+                A rate of zero disables limiting.
+            capacity:
+                The maximum number of tokens the bucket can hold.
+                Defaults to ``rate``, allowing one second worth of
+                burst.
+            clock:
+                A function returning the current time in seconds.
+            sleep:
+                A function used to wait for the given number of seconds.
+        """
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.clock = clock
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def consume(self, tokens: float = 1):
+        """
+        Take tokens from the bucket, waiting until enough are available.
+
+        Args:
+            tokens:
+                The number of tokens to take.
+        """
+        if not self.rate:
+            return
+
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+
+            self._tokens -= tokens
+            deficit = -self._tokens
+
+        # Tokens are reserved before waiting, so concurrent callers queue
+        # up behind each other instead of all waking at the same time.
+        if deficit > 0:
+            self.sleep(deficit / self.rate)
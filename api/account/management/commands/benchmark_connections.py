@@ -0,0 +1,116 @@
+import statistics
+import time
+
+from django.core import signals
+from django.core.management import BaseCommand
+from django.db import connections
+
+from account import models
+
+
+class Command(BaseCommand):
+    """
+    Command to compare request latency with different database
+    connection strategies.
+    """
+    help = 'Report the latency of simulated requests when opening a new ' \
+           'database connection for each request, reusing persistent ' \
+           'connections, and using a connection pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database to benchmark.',
+        )
+        parser.add_argument(
+            '--requests',
+            default=200,
+            help='The number of requests to simulate for each strategy.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+
+        strategies = [
+            ('new connections', {'CONN_MAX_AGE': 0, 'POOL_SIZE': 0}),
+            ('persistent connections', {'CONN_MAX_AGE': None, 'POOL_SIZE': 0}),
+        ]
+        # Only the PostgreSQL backend supports pooling.
+        if connection.vendor == 'postgresql':
+            strategies.append(
+                ('pooled connections', {'CONN_MAX_AGE': 0, 'POOL_SIZE': 1}),
+            )
+
+        original = {
+            key: connection.settings_dict.get(key)
+            for key in ('CONN_MAX_AGE', 'POOL_SIZE')
+        }
+
+        try:
+            for name, overrides in strategies:
+                connection.close()
+                connection.settings_dict.update(overrides)
+
+                latencies = self.benchmark(
+                    options['database'],
+                    options['requests'],
+                )
+                self.stdout.write(
+                    f'{name}: mean {statistics.mean(latencies):.2f}ms, '
+                    f'p95 {self.percentile(latencies, 95):.2f}ms'
+                )
+        finally:
+            connection.close()
+            connection.settings_dict.update(original)
+
+    @staticmethod
+    def benchmark(database: str, requests: int):
+        """
+        Simulate requests that each make a single query.
+
+        The request signals are sent around each query so that
+        connections are closed or reused exactly as they would be while
+        serving requests.
+
+        Args:
+            database:
+                The alias of the database to query.
+            requests:
+                The number of requests to simulate.
+
+        Returns:
+            The latency of each request in milliseconds.
+        """
+        latencies = []
+
+        for _ in range(requests):
+            start = time.perf_counter()
+
+            signals.request_started.send(sender=Command)
+            models.User.objects.using(database).exists()
+            signals.request_finished.send(sender=Command)
+
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        return latencies
+
+    @staticmethod
+    def percentile(values, percent: float):
+        """
+        Get a percentile of a list of values using the nearest rank.
+
+        Args:
+            values:
+                The values to get the percentile of.
+            percent:
+                The percentile to get, between 0 and 100.
+
+        Returns:
+            The value at the given percentile.
+        """
+        ordered = sorted(values)
+        index = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+
+        return ordered[index]
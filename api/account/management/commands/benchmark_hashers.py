@@ -0,0 +1,62 @@
+import time
+
+from django.contrib.auth import hashers
+from django.core.management import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Command to measure the throughput of the configured password
+    hashers.
+    """
+    help = 'Report the throughput of each configured password hasher'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--duration',
+            default=2,
+            help='The number of seconds to benchmark each hasher for.',
+            type=float,
+        )
+
+    def handle(self, *args, **options):
+        for hasher in hashers.get_hashers():
+            try:
+                rate = self.benchmark(hasher, options['duration'])
+            except ValueError as e:
+                # Raised by hashers whose library is not installed.
+                self.stdout.write(f'{hasher.algorithm}: skipped ({e})')
+
+                continue
+
+            self.stdout.write(
+                f'{hasher.algorithm}: {rate:.1f} hashes/s per core'
+            )
+
+    @staticmethod
+    def benchmark(hasher, duration: float):
+        """
+        Measure how many passwords a hasher can hash per second.
+
+        Hashing is done serially in the current thread, so the result is
+        the throughput of a single core.
+
+        Args:
+            hasher:
+                The hasher to benchmark.
+            duration:
+                The minimum number of seconds to hash passwords for.
+
+        Returns:
+            The number of hashes computed per second.
+        """
+        count = 0
+        start = time.perf_counter()
+        elapsed = 0
+
+        while elapsed < duration:
+            hasher.encode('benchmark-password', hasher.salt())
+            count += 1
+            elapsed = time.perf_counter() - start
+
+        return count / elapsed
@@ -0,0 +1,146 @@
+import time
+import uuid
+
+from django.core.management import BaseCommand
+from django.db import DatabaseError, connections, models as db_models
+
+from account import models
+
+
+class Command(BaseCommand):
+    """
+    Command to compare inserting random and time-ordered UUID primary
+    keys.
+    """
+    help = 'Report the insert throughput and primary key index size of ' \
+           'tables using random and time-ordered UUIDs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=500,
+            help='The number of rows to insert in each statement.',
+            type=int,
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='The database to benchmark.',
+        )
+        parser.add_argument(
+            '--rows',
+            default=2000000,
+            help='The number of rows to insert for each kind of ID.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        generators = [
+            ('uuid4', uuid.uuid4),
+            ('uuid7', models.uuid7),
+        ]
+
+        for name, generator in generators:
+            table = f'benchmark_ids_{name}'
+
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {table}')
+                cursor.execute(
+                    f'CREATE TABLE {table} '
+                    f'(id {connection.data_types["UUIDField"]} PRIMARY KEY)'
+                )
+
+            try:
+                rate = self.benchmark(
+                    connection,
+                    table,
+                    generator,
+                    options['rows'],
+                    options['batch_size'],
+                )
+                size = self.index_size(connection, table)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+            size = f'{size / 1024 / 1024:.1f}MiB' if size else 'unknown'
+            self.stdout.write(
+                f'{name}: {rate:.0f} rows/s, primary key index {size}'
+            )
+
+    @staticmethod
+    def benchmark(connection, table, generator, rows, batch_size):
+        """
+        Measure how quickly rows can be inserted into a table.
+
+        Args:
+            connection:
+                The database connection to use.
+            table:
+                The name of the table to insert into.
+            generator:
+                A function returning a new UUID.
+            rows:
+                The number of rows to insert.
+            batch_size:
+                The number of rows to insert in each statement.
+
+        Returns:
+            The number of rows inserted per second.
+        """
+        field = db_models.UUIDField()
+        elapsed = 0
+
+        for offset in range(0, rows, batch_size):
+            count = min(batch_size, rows - offset)
+            # IDs are generated while the clock is stopped so only the
+            # inserts are measured.
+            ids = [
+                field.get_db_prep_value(generator(), connection)
+                for _ in range(count)
+            ]
+            placeholders = ', '.join(['(%s)'] * count)
+
+            start = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'INSERT INTO {table} (id) VALUES {placeholders}',
+                    ids,
+                )
+            elapsed += time.perf_counter() - start
+
+        return rows / elapsed if elapsed else 0
+
+    @staticmethod
+    def index_size(connection, table):
+        """
+        Get the size of a table's primary key index.
+
+        Args:
+            connection:
+                The database connection to use.
+            table:
+                The name of the table.
+
+        Returns:
+            The size of the index in bytes, or ``None`` if the database
+            can't report it.
+        """
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT pg_relation_size(%s)'
+            params = [f'{table}_pkey']
+        elif connection.vendor == 'sqlite':
+            # Only available if SQLite was compiled with the "dbstat"
+            # virtual table.
+            sql = 'SELECT SUM(pgsize) FROM dbstat WHERE name = %s'
+            params = [f'sqlite_autoindex_{table}_1']
+        else:
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return cursor.fetchone()[0]
+        except DatabaseError:
+            return None
@@ -25,7 +25,9 @@ class Command(BaseCommand):
                 "The 'ADMIN_PASSWORD' environment variable must be set."
             )
 
-        email_query = models.Email.objects.filter(address=email)
+        email_query = models.Email.objects.filter(
+            canonical_address=models.Email.canonicalize_address(email),
+        )
         if email_query.exists():
             email_instance = email_query.get()
 
@@ -0,0 +1,39 @@
+from django.core.management import BaseCommand
+
+from account import export
+
+
+class Command(BaseCommand):
+    """
+    Command to export users and their email addresses.
+    """
+    help = 'Export users and their email addresses as CSV or JSON Lines'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            default=1000,
+            help='The number of users to read from the database at once.',
+            type=int,
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(export.EXPORTERS),
+            default='csv',
+            help='The format to export users in.',
+        )
+        parser.add_argument(
+            '--output',
+            help='The file to write to. Defaults to standard output.',
+        )
+
+    def handle(self, *args, **options):
+        users = export.iter_users(chunk_size=options['chunk_size'])
+        lines = export.EXPORTERS[options['format']](users)
+
+        if options['output'] is None:
+            for line in lines:
+                self.stdout.write(line, ending='')
+        else:
+            with open(options['output'], 'w', newline='') as file:
+                file.writelines(lines)
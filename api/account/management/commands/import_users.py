@@ -0,0 +1,341 @@
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from account import models, search, tokens
+
+
+def read_csv(file):
+    """
+    Read rows from a CSV file with a header row.
+
+    Args:
+        file:
+            The open file to read from.
+
+    Yields:
+        Tuples containing the line number and a dictionary for each row.
+    """
+    reader = csv.DictReader(file)
+
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl(file):
+    """
+    Read rows from a JSON Lines file.
+
+    Args:
+        file:
+            The open file to read from.
+
+    Yields:
+        Tuples containing the line number and a dictionary for each
+        non-blank line.
+    """
+    for line_num, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+
+        yield line_num, row if isinstance(row, dict) else {}
+
+
+READERS = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
+
+
+class Command(BaseCommand):
+    """
+    Command to import users from a file.
+    """
+    help = 'Import users and their email addresses from a CSV or JSON ' \
+           'Lines file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help="The file to import. Each row must contain 'email' and "
+                 "'name' fields, and may contain a 'password' field.",
+        )
+        parser.add_argument(
+            '--batch-size',
+            default=1000,
+            help='The number of users to insert in each transaction.',
+            type=int,
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(READERS),
+            help='The format of the file. Defaults to the file extension.',
+        )
+        parser.add_argument(
+            '--verified',
+            action='store_true',
+            help='Mark the imported email addresses as verified instead of '
+                 'sending verification emails.',
+        )
+        parser.add_argument(
+            '--workers',
+            default=os.cpu_count(),
+            help='The number of threads used to hash passwords.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        file_format = options['format']
+        if file_format is None:
+            file_format = os.path.splitext(options['path'])[1].lstrip('.')
+
+        if file_format not in READERS:
+            raise CommandError(
+                f"Could not determine the format of {options['path']}. Use "
+                f"the '--format' option to specify it."
+            )
+
+        self.imported = self.skipped = 0
+        self.verbosity = options['verbosity']
+        self.verified = options['verified']
+        self.workers = options['workers']
+        start = time.monotonic()
+
+        executor = None
+        if self.workers > 1:
+            # Both PBKDF2 and argon2 release the GIL while hashing, so
+            # threads can hash passwords in parallel.
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        try:
+            with open(options['path'], newline='') as file:
+                rows = READERS[file_format](file)
+
+                while True:
+                    batch = list(
+                        itertools.islice(rows, options['batch_size'])
+                    )
+                    if not batch:
+                        break
+
+                    self.import_batch(batch, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.monotonic() - start
+        rate = (self.imported + self.skipped) / elapsed if elapsed else 0
+
+        self.stdout.write(
+            f'Imported {self.imported} user(s) and skipped {self.skipped} '
+            f'row(s) in {elapsed:.2f}s ({rate:.1f} rows/s).'
+        )
+
+    def import_batch(self, batch, executor):
+        """
+        Import a single batch of rows.
+
+        Args:
+            batch:
+                A list of tuples containing the line number and contents
+                of each row.
+            executor:
+                The thread pool used to hash passwords, or ``None`` to
+                hash them in this thread.
+        """
+        rows = {}
+        for line_num, row in batch:
+            address = self.clean_row(line_num, row)
+            if address is None:
+                continue
+
+            canonical = models.Email.canonicalize_address(address)
+            if canonical in rows:
+                self.skip(line_num, f'{address} appears earlier in the file')
+
+                continue
+
+            row['address'] = address
+            rows[canonical] = row
+
+        if not rows:
+            return
+
+        passwords = [row.get('password') or None for row in rows.values()]
+        if executor is None:
+            hashes = [make_password(password) for password in passwords]
+        else:
+            hashes = list(executor.map(make_password, passwords))
+
+        hashes = dict(zip(rows, hashes))
+
+        try:
+            existing = self.insert_batch(rows, hashes)
+        except IntegrityError:
+            # An address was registered after we checked for existing
+            # addresses, so the whole batch was rolled back. Checking
+            # again will skip it.
+            existing = self.insert_batch(rows, hashes)
+
+        for canonical in sorted(existing):
+            address = rows[canonical]['address']
+            self.skip(None, f'{address} is already registered')
+
+        self.imported += len(rows) - len(existing)
+
+    @transaction.atomic
+    def insert_batch(self, rows, hashes):
+        """
+        Insert the users and email addresses for a batch of rows.
+
+        Args:
+            rows:
+                A dictionary mapping canonical addresses to their rows.
+            hashes:
+                A dictionary mapping canonical addresses to the hashed
+                passwords of their users.
+
+        Returns:
+            The set of canonical addresses that were skipped because
+            they are already registered.
+        """
+        existing = set(
+            models.Email.objects.filter(
+                canonical_address__in=list(rows),
+            ).values_list('canonical_address', flat=True)
+        )
+
+        users = []
+        emails = []
+        for canonical, row in rows.items():
+            if canonical in existing:
+                continue
+
+            user = models.User(name=row['name'], password=hashes[canonical])
+            # Bulk inserts skip ``Email.save``, so the canonical address
+            # is set here.
+            email = models.Email(
+                address=row['address'],
+                canonical_address=canonical,
+                is_verified=self.verified,
+                user=user,
+            )
+            # Foreign key constraints are checked when the transaction
+            # commits, so the user can reference their email before it
+            # is inserted.
+            user.primary_email_id = email.id
+
+            users.append(user)
+            emails.append(email)
+
+        models.User.objects.bulk_create(users)
+        models.Email.objects.bulk_create(emails)
+
+        # Bulk inserts don't send the signals that maintain the search
+        # index.
+        search.index_users(users, replace=False)
+        search.index_emails(emails, replace=False)
+
+        if not self.verified:
+            if settings.EMAIL_VERIFICATION_TOKENS == 'signed':
+                queued = [
+                    email.build_verification_email(tokens.make_token(email))
+                    for email in emails
+                ]
+            else:
+                verifications = models.EmailVerification.objects.bulk_create(
+                    models.EmailVerification(email=email) for email in emails
+                )
+                queued = [
+                    verification.build_queued_email()
+                    for verification in verifications
+                ]
+
+            models.OutgoingEmail.objects.bulk_create(queued)
+
+        return existing
+
+    def clean_row(self, line_num, row):
+        """
+        Validate a row and normalize its email address.
+
+        Args:
+            line_num:
+                The line number of the row.
+            row:
+                The contents of the row.
+
+        Returns:
+            The row's normalized email address, or ``None`` if the row
+            is invalid.
+        """
+        address = (row.get('email') or '').strip()
+        name = (row.get('name') or '').strip()
+
+        if not name:
+            self.skip(line_num, 'no name was provided')
+
+            return None
+
+        max_name_length = models.User._meta.get_field('name').max_length
+        if len(name) > max_name_length:
+            self.skip(
+                line_num,
+                f'the name is longer than {max_name_length} characters',
+            )
+
+            return None
+
+        max_address_length = (
+            models.Email._meta.get_field('address').max_length
+        )
+        if len(address) > max_address_length:
+            self.skip(
+                line_num,
+                f'the email address is longer than {max_address_length} '
+                f'characters',
+            )
+
+            return None
+
+        try:
+            validate_email(address)
+        except ValidationError:
+            self.skip(line_num, f'{address!r} is not a valid email address')
+
+            return None
+
+        row['name'] = name
+
+        return models.Email.normalize_address(address)
+
+    def skip(self, line_num, reason):
+        """
+        Record a skipped row.
+
+        Args:
+            line_num:
+                The line number of the skipped row, if known.
+            reason:
+                A description of why the row was skipped.
+        """
+        self.skipped += 1
+
+        if self.verbosity >= 2 or line_num is not None:
+            location = f'Line {line_num}: ' if line_num is not None else ''
+            self.stderr.write(f'{location}Skipped because {reason}.')
@@ -0,0 +1,70 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db.models import Q
+
+from account import models
+
+
+class Command(BaseCommand):
+    """
+    Command to delete expired email verifications.
+    """
+    help = 'Delete expired email verifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=1000,
+            help='The maximum number of verifications to delete in a '
+                 'single statement.',
+            type=int,
+        )
+        parser.add_argument(
+            '--sleep',
+            default=0,
+            help='The number of seconds to pause between batches to '
+                 'reduce load on the database.',
+            type=float,
+        )
+
+    def handle(self, *args, **options):
+        expired = models.EmailVerification.objects.expired()
+        expired = expired.order_by('time_created', 'id')
+
+        deleted = 0
+        last = None
+
+        # Walk the expired verifications in creation order, starting
+        # each batch after the last row of the previous one. Each batch
+        # is a short index range scan followed by a small delete, so no
+        # statement holds locks on a large portion of the table.
+        while True:
+            batch = expired
+            if last is not None:
+                last_time, last_id = last
+                batch = batch.filter(
+                    Q(time_created__gt=last_time) |
+                    Q(time_created=last_time, id__gt=last_id)
+                )
+
+            keys = list(
+                batch.values_list('time_created', 'id')[
+                    :options['batch_size']
+                ]
+            )
+            if not keys:
+                break
+
+            ids = [pk for _, pk in keys]
+            count, _ = models.EmailVerification.objects.filter(
+                id__in=ids,
+            ).delete()
+
+            deleted += count
+            last = keys[-1]
+
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(f'Deleted {deleted} expired verification(s).')
@@ -0,0 +1,51 @@
+import itertools
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+
+from account import export, models, search
+
+
+class Command(BaseCommand):
+    """
+    Command to rebuild the trigram table used to search for users on
+    databases without ``pg_trgm``.
+    """
+    help = 'Rebuild the search trigrams for every user and email address'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=1000,
+            help='The number of users to index at once.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'postgresql':
+            self.stdout.write(
+                'PostgreSQL searches use pg_trgm indexes, so there is '
+                'nothing to rebuild.'
+            )
+
+            return
+
+        count = 0
+        users = export.iter_users(chunk_size=options['batch_size'])
+
+        with transaction.atomic():
+            models.SearchNgram.objects.all().delete()
+
+            while True:
+                batch = list(itertools.islice(users, options['batch_size']))
+                if not batch:
+                    break
+
+                search.index_users(batch, replace=False)
+                search.index_emails(
+                    [email for user in batch for email in user.emails.all()],
+                    replace=False,
+                )
+                count += len(batch)
+
+        self.stdout.write(f'Indexed {count} user(s).')
@@ -0,0 +1,168 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import mail
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from account import models
+from account.mail import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to send the emails waiting in the outbox.
+    """
+    help = 'Send the emails waiting in the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend',
+            default=None,
+            help='The import path of the email backend to send with. '
+                 'Defaults to the EMAIL_BACKEND setting.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            default=100,
+            help='The number of emails to claim from the outbox at once.',
+            type=int,
+        )
+        parser.add_argument(
+            '--max-attempts',
+            default=5,
+            help='The number of attempts after which an email is no '
+                 'longer retried.',
+            type=int,
+        )
+        parser.add_argument(
+            '--poll-interval',
+            default=0,
+            help='If provided, keep running and check the outbox for new '
+                 'emails every this many seconds instead of exiting once '
+                 'it is empty.',
+            type=float,
+        )
+        parser.add_argument(
+            '--rate',
+            default=None,
+            help='The maximum number of emails to send per second. '
+                 'Defaults to the EMAIL_MAX_SEND_RATE setting.',
+            type=float,
+        )
+        parser.add_argument(
+            '--retry-delay',
+            default=60,
+            help='The number of seconds to wait before retrying a failed '
+                 'email. The delay doubles with each failed attempt.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        rate = options['rate']
+        if rate is None:
+            rate = settings.EMAIL_MAX_SEND_RATE
+
+        bucket = TokenBucket(rate)
+
+        # A single connection is shared by every email the worker sends
+        # so that we only pay for the connection setup once.
+        with mail.get_connection(backend=options['backend']) as connection:
+            while True:
+                start = time.monotonic()
+                sent = failed = 0
+
+                while True:
+                    batch_sent, batch_failed = self.send_batch(
+                        batch_size=options['batch_size'],
+                        bucket=bucket,
+                        connection=connection,
+                        max_attempts=options['max_attempts'],
+                        retry_delay=options['retry_delay'],
+                    )
+
+                    if not batch_sent and not batch_failed:
+                        break
+
+                    sent += batch_sent
+                    failed += batch_failed
+
+                if sent or failed:
+                    elapsed = time.monotonic() - start
+                    throughput = sent / elapsed if elapsed else 0
+
+                    self.stdout.write(
+                        f'Sent {sent} email(s), {failed} failed in '
+                        f'{elapsed:.2f}s ({throughput:.1f} emails/s).'
+                    )
+
+                if not options['poll_interval']:
+                    break
+
+                time.sleep(options['poll_interval'])
+
+    @staticmethod
+    def send_batch(
+            batch_size: int,
+            bucket: TokenBucket,
+            connection,
+            max_attempts: int,
+            retry_delay: int):
+        """
+        Send a single batch of emails from the outbox.
+
+        The batch is locked for the duration of the transaction, and
+        locked rows are skipped, so multiple workers can drain the
+        outbox concurrently without sending the same email twice.
+
+        Args:
+            batch_size:
+                The maximum number of emails to send.
+            bucket:
+                The token bucket used to limit the sending rate.
+            connection:
+                The open email backend connection to send with.
+            max_attempts:
+                The number of attempts after which an email is no
+                longer retried.
+            retry_delay:
+                The base number of seconds to wait before retrying a
+                failed email.
+
+        Returns:
+            A tuple containing the number of emails sent and the number
+            of emails that failed to send.
+        """
+        sent_ids = []
+        failed = 0
+
+        with transaction.atomic():
+            batch = models.OutgoingEmail.objects.pending(max_attempts)
+            batch = batch.select_for_update(skip_locked=True)[:batch_size]
+
+            for email in batch:
+                bucket.consume()
+
+                try:
+                    email.send(connection=connection)
+                except Exception as e:
+                    logger.exception("Failed to send queued email %r", email)
+
+                    email.record_failure(
+                        error=e,
+                        retry_delay=timedelta(
+                            seconds=retry_delay * 2 ** email.attempts,
+                        ),
+                    )
+                    failed += 1
+                else:
+                    sent_ids.append(email.id)
+
+            models.OutgoingEmail.objects.filter(id__in=sent_ids).delete()
+
+        return len(sent_ids), failed
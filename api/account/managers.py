@@ -1,4 +1,158 @@
+import json
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth.models import BaseUserManager
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.utils import timezone
+
+
+class EmailVerificationManager(models.Manager):
+    """
+    Manager for email verifications.
+    """
+
+    @staticmethod
+    def expiration_cutoff():
+        """
+        Get the creation time before which verifications are expired.
+
+        Returns:
+            The current time minus the lifetime of a verification as
+            given by the ``EMAIL_VERIFICATION_TTL`` setting.
+        """
+        ttl = timedelta(seconds=settings.EMAIL_VERIFICATION_TTL)
+
+        return timezone.now() - ttl
+
+    def active(self):
+        """
+        Get the verifications that have not expired.
+
+        Returns:
+            A queryset containing the verifications that can still be
+            used to verify an email.
+        """
+        return self.filter(time_created__gte=self.expiration_cutoff())
+
+    def expired(self):
+        """
+        Get the verifications that have expired.
+
+        Returns:
+            A queryset containing the verifications that can no longer
+            be used and may be deleted.
+        """
+        return self.filter(time_created__lt=self.expiration_cutoff())
+
+    def verify_email(self, email_id):
+        """
+        Mark an email as verified and delete all of its verifications.
+
+        The email is only updated if it is not already verified, so when
+        several requests verify the same email at once exactly one of
+        them succeeds.
+
+        Args:
+            email_id:
+                The ID of the email to verify.
+
+        Returns:
+            A boolean indicating if this call verified the email.
+        """
+        email_model = self.model._meta.get_field('email').related_model
+
+        with transaction.atomic():
+            verified = email_model.objects.filter(
+                id=email_id,
+                is_verified=False,
+            ).update(is_verified=True, time_updated=timezone.now())
+
+            self.filter(email_id=email_id).delete()
+
+        return bool(verified)
+
+
+class OutgoingEmailManager(models.Manager):
+    """
+    Manager for emails waiting in the outbox.
+    """
+
+    def build(
+            self,
+            template_name: str,
+            context: dict,
+            from_email: str,
+            recipient_list: list,
+            subject: str):
+        """
+        Build an unsaved outbox email.
+
+        The arguments mirror those accepted by ``email_utils.send_email``
+        so that the message can be sent later by a worker without
+        having to touch the objects it was generated from.
+
+        Args:
+            template_name:
+                The base name of the templates used to render the
+                email.
+            context:
+                The context to render the templates with. It must be
+                serializable as JSON.
+            from_email:
+                The address the email is sent from.
+            recipient_list:
+                A list of addresses to send the email to.
+            subject:
+                The subject of the email.
+
+        Returns:
+            A new outbox email that has not been saved. This allows
+            many emails to be added to the outbox with ``bulk_create``.
+        """
+        return self.model(
+            context=json.dumps(context, cls=DjangoJSONEncoder),
+            from_email=from_email,
+            recipient_list=json.dumps(list(recipient_list)),
+            subject=str(subject),
+            template_name=template_name,
+        )
+
+    def enqueue(self, **kwargs):
+        """
+        Add an email to the outbox.
+
+        Args:
+            **kwargs:
+                The arguments describing the email, as accepted by
+                ``build``.
+
+        Returns:
+            The newly queued email.
+        """
+        email = self.build(**kwargs)
+        email.save(force_insert=True)
+
+        return email
+
+    def pending(self, max_attempts: int):
+        """
+        Get the emails that are due to be sent.
+
+        Args:
+            max_attempts:
+                The number of attempts after which an email is
+                considered to have failed permanently.
+
+        Returns:
+            A queryset containing the emails whose next attempt is due,
+            ordered by the time they are due.
+        """
+        return self.filter(
+            attempts__lt=max_attempts,
+            time_next_attempt__lte=timezone.now(),
+        ).order_by('time_next_attempt')
 
 
 class UserManager(BaseUserManager):
@@ -29,7 +183,7 @@ class UserManager(BaseUserManager):
         user.is_staff = True
         user.is_superuser = True
 
-        user.save()
+        user.save(force_insert=True)
 
         return user
 
@@ -51,6 +205,9 @@ class UserManager(BaseUserManager):
         """
         user = self.model(name=name, **kwargs)
         user.set_password(password)
-        user.save()
+
+        # The primary key is generated client side, so without forcing
+        # an insert Django would first attempt an UPDATE of the row.
+        user.save(force_insert=True)
 
         return user
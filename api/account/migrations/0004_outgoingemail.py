@@ -0,0 +1,34 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:31
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_emailverification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='The number of failed attempts to send the email.', verbose_name='attempts')),
+                ('context', models.TextField(help_text='The JSON encoded context used to render the email.', verbose_name='context')),
+                ('from_email', models.CharField(help_text='The address the email is sent from.', max_length=255, verbose_name='from email')),
+                ('last_error', models.TextField(blank=True, help_text='The error raised by the most recent failed attempt.', verbose_name='last error')),
+                ('recipient_list', models.TextField(help_text='The JSON encoded list of addresses to send the email to.', verbose_name='recipient list')),
+                ('subject', models.CharField(help_text='The subject of the email.', max_length=255, verbose_name='subject')),
+                ('template_name', models.CharField(help_text='The base name of the templates used to render the email.', max_length=255, verbose_name='template name')),
+                ('time_created', models.DateTimeField(auto_now_add=True, help_text='The time the email was queued.', verbose_name='time created')),
+                ('time_next_attempt', models.DateTimeField(db_index=True, default=django.utils.timezone.now, help_text='The earliest time the email should be sent at.', verbose_name='time of next attempt')),
+            ],
+            options={
+                'verbose_name': 'outgoing email',
+                'verbose_name_plural': 'outgoing emails',
+                'ordering': ('time_created',),
+            },
+        ),
+    ]
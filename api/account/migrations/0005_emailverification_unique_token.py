@@ -0,0 +1,48 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:33
+
+import account.models
+from django.db import migrations, models
+
+
+def remove_duplicate_tokens(apps, schema_editor):
+    """
+    Delete verifications whose token is shared with another
+    verification, keeping only the most recent one.
+    """
+    EmailVerification = apps.get_model('account', 'EmailVerification')
+    db_alias = schema_editor.connection.alias
+
+    duplicates = (
+        EmailVerification.objects.using(db_alias)
+        .values('token')
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+        .values_list('token', flat=True)
+    )
+
+    for token in duplicates:
+        verifications = EmailVerification.objects.using(db_alias).filter(
+            token=token,
+        )
+        newest = verifications.order_by('-time_created', '-id').first()
+
+        verifications.exclude(id=newest.id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_tokens,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='emailverification',
+            name='token',
+            field=models.CharField(default=account.models.random_token, editable=False, help_text='The token used to verify the associated email.', max_length=32, unique=True, verbose_name='token'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_emailverification_unique_token'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailverification',
+            name='time_created',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, help_text='The time the instance was created at.', verbose_name='time created'),
+        ),
+    ]
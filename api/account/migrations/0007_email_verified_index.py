@@ -0,0 +1,17 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_emailverification_time_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='email',
+            index=models.Index(condition=models.Q(is_verified=True), fields=['address'], name='account_email_verified_idx'),
+        ),
+    ]
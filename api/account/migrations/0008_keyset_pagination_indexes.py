@@ -0,0 +1,21 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0007_email_verified_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='email',
+            index=models.Index(fields=['user', 'time_created', 'id'], name='account_email_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['time_created', 'id'], name='account_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations
+
+
+# The admin searches with case insensitive "contains" lookups, which
+# Django compiles to ``UPPER(column) LIKE UPPER('%term%')`` on
+# PostgreSQL. A trigram index over the upper-cased column lets those
+# searches use an index instead of scanning the whole table. Django
+# 2.2 can't declare indexes on expressions, so they are created with
+# raw SQL.
+#
+# The indexes are built concurrently so that writes to the tables
+# aren't blocked while they are built. Concurrent builds can't run in a
+# transaction, so the migration is not atomic.
+INDEXES = (
+    ('account_email_address_trgm_idx', 'account_email', 'address'),
+    ('account_user_name_trgm_idx', 'account_user', 'name'),
+)
+
+
+def create_indexes(apps, schema_editor):
+    """
+    Create the trigram search indexes when using PostgreSQL.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for name, table, column in INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY {name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    """
+    Drop the trigram search indexes when using PostgreSQL.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, _, _ in INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('account', '0008_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, reverse_code=drop_indexes),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 2.2.28 on 2026-10-17 12:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0009_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchNgram',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ngram', models.CharField(help_text='The lower-cased trigram.', max_length=3, verbose_name='trigram')),
+                ('email', models.ForeignKey(blank=True, help_text='The email address the trigram was taken from, if any.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='account.Email', verbose_name='email address')),
+                ('user', models.ForeignKey(help_text='The user the trigram identifies.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'search trigram',
+                'verbose_name_plural': 'search trigrams',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='searchngram',
+            index=models.Index(fields=['ngram', 'user'], name='account_search_ngram_idx'),
+        ),
+    ]
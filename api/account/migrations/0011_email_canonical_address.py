@@ -0,0 +1,95 @@
+# Generated by Django 2.2.28 on 2026-10-17 15:02
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+# Only a few colliding addresses are listed, as there may be many.
+MAX_REPORTED_COLLISIONS = 20
+
+
+def find_collisions(addresses):
+    """
+    Find addresses that only differ by case.
+
+    Args:
+        addresses:
+            An iterable of addresses.
+
+    Returns:
+        A list of lists of addresses sharing a canonical form.
+    """
+    groups = defaultdict(list)
+    for address in addresses:
+        groups[address.lower()].append(address)
+
+    return sorted(
+        sorted(group) for group in groups.values() if len(group) > 1
+    )
+
+
+def populate_canonical_addresses(apps, schema_editor):
+    """
+    Fill in the canonical address of every existing email, refusing to
+    continue if two addresses only differ by case.
+    """
+    Email = apps.get_model('account', 'Email')
+    db_alias = schema_editor.connection.alias
+    emails = Email.objects.using(db_alias).only('address').order_by()
+
+    collisions = find_collisions(
+        emails.values_list('address', flat=True).iterator()
+    )
+    if collisions:
+        listed = '\n'.join(
+            ', '.join(group)
+            for group in collisions[:MAX_REPORTED_COLLISIONS]
+        )
+
+        raise RuntimeError(
+            f'{len(collisions)} group(s) of email addresses only differ by '
+            f'case and must be merged or removed before migrating:\n{listed}'
+        )
+
+    batch = []
+    for email in emails.iterator():
+        email.canonical_address = email.address.lower()
+        batch.append(email)
+
+        if len(batch) >= 1000:
+            Email.objects.using(db_alias).bulk_update(
+                batch,
+                ['canonical_address'],
+            )
+            batch = []
+
+    Email.objects.using(db_alias).bulk_update(batch, ['canonical_address'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0010_searchngram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='email',
+            name='canonical_address',
+            field=models.CharField(editable=False, help_text='The lower-cased address, used to look up addresses regardless of their case.', max_length=254, null=True, verbose_name='canonical address'),
+        ),
+        migrations.RunPython(
+            populate_canonical_addresses,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='email',
+            name='canonical_address',
+            field=models.CharField(editable=False, help_text='The lower-cased address, used to look up addresses regardless of their case.', max_length=254, unique=True, verbose_name='canonical address'),
+        ),
+        migrations.RemoveIndex(
+            model_name='email',
+            name='account_email_verified_idx',
+        ),
+    ]
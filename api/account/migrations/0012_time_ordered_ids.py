@@ -0,0 +1,24 @@
+# Generated by Django 2.2.28 on 2026-10-17 13:11
+
+import account.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0011_email_canonical_address'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='email',
+            name='id',
+            field=models.UUIDField(db_index=True, default=account.models.generate_id, help_text='A unique identifier for the email.', primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(db_index=True, default=account.models.generate_id, help_text='A unique identifier for the user.', primary_key=True, serialize=False),
+        ),
+    ]
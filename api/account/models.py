@@ -1,20 +1,39 @@
+import json
 import logging
+import os
+import time
 import uuid
+from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
-from django.utils import crypto
+from django.utils import crypto, timezone
 from django.utils.translation import ugettext_lazy as _
 import email_utils
 
-from account import managers
+from account import managers, tokens
+from api import metrics
 
 
 logger = logging.getLogger(__name__)
 
 
+def generate_id():
+    """
+    Get a new primary key for a user or email.
+
+    Returns:
+        A time-ordered UUID if the ``TIME_ORDERED_IDS`` setting is
+        enabled, otherwise a random UUID.
+    """
+    if settings.TIME_ORDERED_IDS:
+        return uuid7()
+
+    return uuid.uuid4()
+
+
 def random_token():
     """
     Get a random token with 32 characters.
@@ -25,6 +44,40 @@ def random_token():
     return crypto.get_random_string(32)
 
 
+def uuid7(timestamp_ms: int = None):
+    """
+    Generate a time-ordered UUID as described for version 7 UUIDs in
+    RFC 9562.
+
+    The first 48 bits are the Unix timestamp in milliseconds and the
+    remaining bits, apart from the version and variant, are random. New
+    IDs are therefore inserted near the end of a primary key index
+    rather than at random positions within it, which keeps recently
+    used pages in memory and avoids page splits. They can be stored
+    alongside existing random UUIDs.
+
+    Args:
+        timestamp_ms:
+            The Unix timestamp in milliseconds to embed. Defaults to the
+            current time.
+
+    Returns:
+        The new UUID.
+    """
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+
+    random_bits = int.from_bytes(os.urandom(10), 'big')
+
+    value = (timestamp_ms & 0xffff_ffff_ffff) << 80
+    value |= 0x7 << 76
+    value |= (random_bits >> 68) << 64
+    value |= 0b10 << 62
+    value |= random_bits & 0x3fff_ffff_ffff_ffff
+
+    return uuid.UUID(int=value)
+
+
 class Email(models.Model):
     """
     An email address owned by a user.
@@ -34,9 +87,17 @@ class Email(models.Model):
         unique=True,
         verbose_name=_('address'),
     )
+    canonical_address = models.CharField(
+        editable=False,
+        help_text=_('The lower-cased address, used to look up addresses '
+                    'regardless of their case.'),
+        max_length=254,
+        unique=True,
+        verbose_name=_('canonical address'),
+    )
     id = models.UUIDField(
         db_index=True,
-        default=uuid.uuid4,
+        default=generate_id,
         help_text=_('A unique identifier for the email.'),
         primary_key=True,
     )
@@ -66,10 +127,37 @@ class Email(models.Model):
     )
 
     class Meta:
+        indexes = (
+            # Support keyset pagination over a user's emails in their
+            # default ordering.
+            models.Index(
+                fields=('user', 'time_created', 'id'),
+                name='account_email_user_created_idx',
+            ),
+        )
         ordering = ('time_created',)
         verbose_name = _('email address')
         verbose_name_plural = _('email addresses')
 
+    @staticmethod
+    def canonicalize_address(address: str):
+        """
+        Get the key used to look up an email address.
+
+        RFC 5321 allows the local part of an address to be case
+        sensitive, but in practice mail providers ignore its case. To
+        stop the same mailbox from being registered more than once,
+        addresses are compared with their whole address lower-cased.
+
+        Args:
+            address:
+                The email address to canonicalize.
+
+        Returns:
+            The canonical form of the address.
+        """
+        return address.lower()
+
     @staticmethod
     def normalize_address(address: str):
         """
@@ -103,33 +191,132 @@ class Email(models.Model):
         """
         Save the email address.
 
-        Before inserting into the database, the email is normalized.
+        Before inserting into the database, the email is normalized and
+        its canonical form is updated.
         """
         self.address = self.normalize_address(self.address)
+        self.canonical_address = self.canonicalize_address(self.address)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'address' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'canonical_address'}
 
         super().save(*args, **kwargs)
 
-    def send_duplicate_notification(self):
+    def _duplicate_notification_kwargs(self):
         """
-        Send a notification to the user who owns this address letting
-        them know a duplicate registration attempt was made.
+        Get the arguments used to send a duplicate registration
+        notification.
+
+        Returns:
+            A dictionary of keyword arguments accepted by
+            ``email_utils.send_email``.
         """
-        email_utils.send_email(
-            context={
+        return {
+            'context': {
                 'email': self.address,
                 'name': self.user.name,
             },
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.address],
-            subject=_('Duplicate Email Registration'),
-            template_name='account/emails/duplicate-email',
+            'from_email': settings.DEFAULT_FROM_EMAIL,
+            'recipient_list': [self.address],
+            'subject': _('Duplicate Email Registration'),
+            'template_name': 'account/emails/duplicate-email',
+        }
+
+    def _verification_email_kwargs(self, token: str):
+        """
+        Get the arguments used to send a verification email.
+
+        Args:
+            token:
+                The token the recipient can verify the address with.
+
+        Returns:
+            A dictionary of keyword arguments accepted by
+            ``email_utils.send_email``.
+        """
+        return {
+            'context': {
+                'name': self.user.name,
+                'token': token,
+            },
+            'from_email': settings.DEFAULT_FROM_EMAIL,
+            'recipient_list': [self.address],
+            'subject': _('Please Verify Your Email'),
+            'template_name': 'account/emails/verify-email',
+        }
+
+    def build_verification_email(self, token: str):
+        """
+        Build an unsaved outbox email containing a verification token
+        for this address.
+
+        Args:
+            token:
+                The token the recipient can verify the address with.
+
+        Returns:
+            The unsaved outbox email.
+        """
+        return OutgoingEmail.objects.build(
+            **self._verification_email_kwargs(token)
+        )
+
+    def queue_duplicate_notification(self):
+        """
+        Add a duplicate registration notification for this address to
+        the outbox.
+
+        Returns:
+            The queued email.
+        """
+        queued = OutgoingEmail.objects.enqueue(
+            **self._duplicate_notification_kwargs()
         )
 
         logger.info(
-            "Sent duplicate email registration notification to %r",
+            "Queued duplicate email registration notification to %r",
             self,
         )
 
+        return queued
+
+    def queue_verification(self):
+        """
+        Add a verification email for this address to the outbox.
+
+        If the ``EMAIL_VERIFICATION_TOKENS`` setting is ``'signed'``, the
+        email contains a signed token. Otherwise an
+        ``EmailVerification`` is created to hold the token.
+
+        Returns:
+            The queued email.
+        """
+        if settings.EMAIL_VERIFICATION_TOKENS != 'signed':
+            verification = EmailVerification.objects.create(email=self)
+
+            return verification.queue_email()
+
+        queued = self.build_verification_email(tokens.make_token(self))
+        queued.save(force_insert=True)
+
+        logger.info("Queued signed verification to email %r", self)
+
+        return queued
+
+    def verify(self):
+        """
+        Mark the address as verified and delete its verifications.
+
+        Returns:
+            A boolean indicating if this call verified the address, as
+            opposed to it already being verified.
+        """
+        verified = EmailVerification.objects.verify_email(self.id)
+        self.is_verified = True
+
+        return verified
+
 
 class EmailVerification(models.Model):
     """
@@ -145,6 +332,7 @@ class EmailVerification(models.Model):
     )
     time_created = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         help_text=_('The time the instance was created at.'),
         verbose_name=_('time created'),
     )
@@ -153,9 +341,12 @@ class EmailVerification(models.Model):
         editable=False,
         help_text=_('The token used to verify the associated email.'),
         max_length=32,
+        unique=True,
         verbose_name=_('token'),
     )
 
+    objects = managers.EmailVerificationManager()
+
     class Meta:
         ordering = ('time_created',)
         verbose_name = _('email verification')
@@ -182,31 +373,219 @@ class EmailVerification(models.Model):
         """
         return f'Email Verification for {self.email.address}'
 
-    def send_email(self):
+    def _email_kwargs(self):
         """
-        Send a verification email to the associated email address.
+        Get the arguments used to send the verification email.
+
+        Returns:
+            A dictionary of keyword arguments accepted by
+            ``email_utils.send_email``.
         """
-        email_utils.send_email(
-            context={
-                'name': self.email.user.name,
-                'token': self.token,
-            },
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.email.address],
-            subject=_('Please Verify Your Email'),
-            template_name='account/emails/verify-email',
-        )
+        return self.email._verification_email_kwargs(self.token)
+
+    def build_queued_email(self):
+        """
+        Build an unsaved outbox email containing the verification email
+        for the associated email address.
+
+        Returns:
+            The unsaved outbox email.
+        """
+        return OutgoingEmail.objects.build(**self._email_kwargs())
+
+    def queue_email(self):
+        """
+        Add a verification email for the associated email address to
+        the outbox.
+
+        Returns:
+            The queued email.
+        """
+        queued = self.build_queued_email()
+        queued.save(force_insert=True)
+
+        logger.info("Queued verification %r to email %r", self, self.email)
 
-        logger.info("Sent verification %r to email %r", self, self.email)
+        return queued
 
     def verify(self):
         """
-        Verify the associated email address.
+        Verify the associated email address and delete every
+        verification for it, including this one.
+
+        Returns:
+            A boolean indicating if this call verified the address, as
+            opposed to it already being verified.
+        """
+        verified = EmailVerification.objects.verify_email(self.email_id)
+
+        if EmailVerification.email.is_cached(self):
+            self.email.is_verified = True
+
+        return verified
+
+
+class OutgoingEmail(models.Model):
+    """
+    An email waiting in the outbox to be sent by a worker.
+
+    Emails are queued in the same transaction as the objects they
+    describe, so a message is only ever sent for data that was actually
+    committed. Once an email has been sent it is removed from the
+    outbox.
+    """
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text=_('The number of failed attempts to send the email.'),
+        verbose_name=_('attempts'),
+    )
+    context = models.TextField(
+        help_text=_('The JSON encoded context used to render the email.'),
+        verbose_name=_('context'),
+    )
+    from_email = models.CharField(
+        help_text=_('The address the email is sent from.'),
+        max_length=255,
+        verbose_name=_('from email'),
+    )
+    last_error = models.TextField(
+        blank=True,
+        help_text=_('The error raised by the most recent failed attempt.'),
+        verbose_name=_('last error'),
+    )
+    recipient_list = models.TextField(
+        help_text=_('The JSON encoded list of addresses to send the email '
+                    'to.'),
+        verbose_name=_('recipient list'),
+    )
+    subject = models.CharField(
+        help_text=_('The subject of the email.'),
+        max_length=255,
+        verbose_name=_('subject'),
+    )
+    template_name = models.CharField(
+        help_text=_('The base name of the templates used to render the '
+                    'email.'),
+        max_length=255,
+        verbose_name=_('template name'),
+    )
+    time_created = models.DateTimeField(
+        auto_now_add=True,
+        help_text=_('The time the email was queued.'),
+        verbose_name=_('time created'),
+    )
+    time_next_attempt = models.DateTimeField(
+        db_index=True,
+        default=timezone.now,
+        help_text=_('The earliest time the email should be sent at.'),
+        verbose_name=_('time of next attempt'),
+    )
+
+    objects = managers.OutgoingEmailManager()
+
+    class Meta:
+        ordering = ('time_created',)
+        verbose_name = _('outgoing email')
+        verbose_name_plural = _('outgoing emails')
+
+    def __str__(self):
+        """
+        Get a string describing the instance.
+
+        Returns:
+            A string containing the email's subject and recipients.
+        """
+        recipients = ', '.join(json.loads(self.recipient_list))
+
+        return f'{self.subject} to {recipients}'
+
+    def record_failure(self, error: Exception, retry_delay: timedelta):
+        """
+        Record a failed attempt to send the email.
+
+        Args:
+            error:
+                The exception raised while sending the email.
+            retry_delay:
+                How long to wait before the email should be retried.
+        """
+        self.attempts += 1
+        self.last_error = repr(error)
+        self.time_next_attempt = timezone.now() + retry_delay
+
+        self.save(
+            update_fields=('attempts', 'last_error', 'time_next_attempt'),
+        )
+
+    def send(self, connection=None):
+        """
+        Render and send the email.
+
+        Args:
+            connection:
+                An email backend instance to send the email with. If
+                the connection is already open it is reused. Defaults
+                to a new connection to the configured backend.
+        """
+        with metrics.timer('email'):
+            email_utils.send_email(
+                connection=connection,
+                context=json.loads(self.context),
+                from_email=self.from_email,
+                recipient_list=json.loads(self.recipient_list),
+                subject=self.subject,
+                template_name=self.template_name,
+            )
+
+
+class SearchNgram(models.Model):
+    """
+    A trigram of a user's name or of one of their email addresses.
+
+    These are only maintained on databases without the ``pg_trgm``
+    extension, where they allow users to be searched without scanning
+    every name and address.
+    """
+    email = models.ForeignKey(
+        'account.Email',
+        blank=True,
+        help_text=_('The email address the trigram was taken from, if any.'),
+        null=True,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('email address'),
+    )
+    ngram = models.CharField(
+        help_text=_('The lower-cased trigram.'),
+        max_length=3,
+        verbose_name=_('trigram'),
+    )
+    user = models.ForeignKey(
+        'account.User',
+        help_text=_('The user the trigram identifies.'),
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('user'),
+    )
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=('ngram', 'user'),
+                name='account_search_ngram_idx',
+            ),
+        )
+        verbose_name = _('search trigram')
+        verbose_name_plural = _('search trigrams')
+
+    def __str__(self):
         """
-        self.email.is_verified = True
-        self.email.save()
+        Get a string representation of the object.
 
-        self.delete()
+        Returns:
+            The trigram and the ID of the user it identifies.
+        """
+        return f'{self.ngram!r} ({self.user_id})'
 
 
 class User(PermissionsMixin, AbstractBaseUser):
@@ -217,7 +596,7 @@ class User(PermissionsMixin, AbstractBaseUser):
 
     id = models.UUIDField(
         db_index=True,
-        default=uuid.uuid4,
+        default=generate_id,
         help_text=_('A unique identifier for the user.'),
         primary_key=True,
     )
@@ -268,7 +647,38 @@ class User(PermissionsMixin, AbstractBaseUser):
     # Use our custom manager
     objects = managers.UserManager()
 
+    # Set on users built by the user cache.
+    _cached_session_auth_hash = None
+
     class Meta:
+        indexes = (
+            # Support keyset pagination over users in their default
+            # ordering.
+            models.Index(
+                fields=('time_created', 'id'),
+                name='account_user_created_idx',
+            ),
+        )
         ordering = ('time_created',)
         verbose_name = _('user')
         verbose_name_plural = _('users')
+
+    def get_session_auth_hash(self):
+        """
+        Get the hash used to invalidate the user's sessions when their
+        password changes.
+
+        Users served from the user cache are built without their
+        password hash, but carry the session hash computed when they
+        were cached. It is used as long as the password hasn't been
+        loaded or changed since, so session requests don't have to load
+        the password.
+
+        Returns:
+            The session authentication hash.
+        """
+        if ('password' not in self.__dict__ and
+                self._cached_session_auth_hash is not None):
+            return self._cached_session_auth_hash
+
+        return super().get_session_auth_hash()
@@ -0,0 +1,94 @@
+"""
+Pagination for the account list endpoints and admin changelists.
+
+API lists are paginated with an opaque cursor rather than a page number.
+Each page is fetched by filtering on the position of the last item seen,
+which the composite ``(time_created, id)`` indexes serve directly, so
+late pages are as cheap to fetch as the first.
+
+The admin needs page numbers, so it uses a paginator that avoids
+counting every row of large tables instead.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework import pagination
+
+
+def estimate_count(queryset):
+    """
+    Estimate the number of rows in a queryset using the database's
+    statistics rather than counting them.
+
+    Only unfiltered querysets on PostgreSQL can be estimated. The
+    estimate is taken from the table statistics maintained by
+    ``ANALYZE``, so it can be slightly out of date.
+
+    Args:
+        queryset:
+            The queryset to estimate the size of.
+
+    Returns:
+        The estimated number of rows, or ``None`` if no estimate is
+        available.
+    """
+    if not isinstance(queryset, QuerySet):
+        return None
+
+    query = queryset.query
+    if query.where or query.distinct or query.low_mark or query.high_mark:
+        return None
+
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    # Tables that have never been analyzed have no meaningful estimate.
+    if row is None or row[0] <= 0:
+        return None
+
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses an estimated count for large, unfiltered
+    querysets.
+
+    Counting every row of a table with millions of rows takes longer
+    than fetching a page of it. Once the estimated size of a table
+    exceeds ``estimate_threshold``, the estimate is used in place of an
+    exact count. Smaller or filtered querysets are counted exactly.
+    """
+    estimate_threshold = 100000
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+
+        return super().count
+
+
+class TimeCreatedCursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination over the ``time_created`` ordering shared by the
+    account models.
+
+    The ID is included in the ordering so that items created at the
+    same time are always returned in the same order.
+    """
+    max_page_size = 100
+    ordering = ('time_created', 'id')
+    page_size = 20
+    page_size_query_param = 'page_size'
@@ -0,0 +1,247 @@
+"""
+Search for users by their name or email addresses.
+
+On PostgreSQL, searches use the ``pg_trgm`` GIN indexes on the
+upper-cased ``name`` and ``address`` columns and rank users by word
+similarity. Other databases, such as the SQLite database used for local
+development and tests, fall back to a table of precomputed trigrams that
+is kept up to date as users and emails are saved.
+
+Results are cached briefly under a key derived from the normalized
+query, so repeated searches for the same player don't hit the database.
+"""
+
+import hashlib
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+
+from account import models
+
+
+# The minimum score a user must have to be included in results.
+MIN_SCORE = 0.3
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def ngrams(value: str):
+    """
+    Get the trigrams of a string.
+
+    Args:
+        value:
+            The string to split into trigrams.
+
+    Returns:
+        The set of lower-cased trigrams in the string. Strings shorter
+        than three characters are returned whole.
+    """
+    value = normalize_query(value)
+    if len(value) < 3:
+        return {value} if value else set()
+
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def normalize_query(query: str):
+    """
+    Normalize a search query so that equivalent queries share a cache
+    key.
+
+    Queries that look like an email address are normalized the same way
+    as stored addresses before being case folded.
+
+    Args:
+        query:
+            The query to normalize.
+
+    Returns:
+        The normalized query.
+    """
+    query = WHITESPACE_PATTERN.sub(' ', query).strip()
+    if query.count('@') == 1:
+        query = models.Email.normalize_address(query)
+
+    return query.casefold()
+
+
+def index_emails(emails, replace: bool = True):
+    """
+    Add email addresses to the trigram table used by databases without
+    ``pg_trgm``.
+
+    Args:
+        emails:
+            The emails to index.
+        replace:
+            A boolean indicating if existing trigrams for the emails
+            should be removed first. New emails have none, so this can
+            be disabled to save a query.
+    """
+    if connection.vendor == 'postgresql':
+        return
+
+    if replace:
+        models.SearchNgram.objects.filter(email__in=emails).delete()
+
+    models.SearchNgram.objects.bulk_create(
+        models.SearchNgram(email=email, ngram=ngram, user_id=email.user_id)
+        for email in emails
+        for ngram in ngrams(email.address)
+    )
+
+
+def index_users(users, replace: bool = True):
+    """
+    Add users' names to the trigram table used by databases without
+    ``pg_trgm``.
+
+    Args:
+        users:
+            The users to index.
+        replace:
+            A boolean indicating if existing trigrams for the users'
+            names should be removed first. New users have none, so this
+            can be disabled to save a query.
+    """
+    if connection.vendor == 'postgresql':
+        return
+
+    if replace:
+        models.SearchNgram.objects.filter(
+            email__isnull=True,
+            user__in=users,
+        ).delete()
+
+    models.SearchNgram.objects.bulk_create(
+        models.SearchNgram(ngram=ngram, user=user)
+        for user in users
+        for ngram in ngrams(user.name)
+    )
+
+
+def _search_ngrams(query: str, limit: int):
+    """
+    Rank users by the fraction of the query's trigrams found in their
+    name or one of their addresses.
+    """
+    query_ngrams = ngrams(query)
+    if not query_ngrams:
+        return []
+
+    matches = (
+        models.SearchNgram.objects
+        .filter(ngram__in=query_ngrams)
+        .values('user', 'email')
+        .annotate(count=Count('ngram', distinct=True))
+    )
+
+    scores = {}
+    for match in matches:
+        score = match['count'] / len(query_ngrams)
+        scores[match['user']] = max(scores.get(match['user'], 0), score)
+
+    ranked = sorted(
+        (
+            (user_id, score)
+            for user_id, score in scores.items()
+            if score >= MIN_SCORE
+        ),
+        key=lambda result: (-result[1], str(result[0])),
+    )
+
+    return ranked[:limit]
+
+
+def _search_trigrams(query: str, limit: int):
+    """
+    Rank users by the word similarity between the query and their name
+    or one of their addresses using ``pg_trgm``.
+    """
+    # The "<%" operator is only true for rows whose word similarity
+    # reaches "pg_trgm.word_similarity_threshold", and can be answered
+    # from the GIN indexes. The threshold defaults to 0.6, so it is
+    # lowered to our minimum score for the query's transaction.
+    sql = '''
+        SELECT user_id, MAX(score) AS score
+        FROM (
+            SELECT id AS user_id,
+                   word_similarity(UPPER(%(query)s), UPPER(name::text))
+                       AS score
+            FROM account_user
+            WHERE UPPER(%(query)s) <%% UPPER(name::text)
+            UNION ALL
+            SELECT user_id,
+                   word_similarity(UPPER(%(query)s), UPPER(address::text))
+                       AS score
+            FROM account_email
+            WHERE UPPER(%(query)s) <%% UPPER(address::text)
+        ) AS matches
+        GROUP BY user_id
+        HAVING MAX(score) >= %(min_score)s
+        ORDER BY score DESC, user_id
+        LIMIT %(limit)s
+    '''
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+            [str(MIN_SCORE)],
+        )
+        cursor.execute(sql, {
+            'limit': limit,
+            'min_score': MIN_SCORE,
+            'query': query,
+        })
+
+        return [(user_id, score) for user_id, score in cursor.fetchall()]
+
+
+def search_users(query: str, limit: int = 20):
+    """
+    Search for users whose name or email address resembles a query.
+
+    Args:
+        query:
+            The text to search for.
+        limit:
+            The maximum number of users to return.
+
+    Returns:
+        A list of tuples containing each matching user and their score
+        between 0 and 1, best match first. Each user's primary email is
+        fetched with them.
+    """
+    normalized = normalize_query(query)
+    if not normalized:
+        return []
+
+    digest = hashlib.sha256(normalized.encode()).hexdigest()
+    key = f'account_search_{limit}_{digest}'
+
+    results = cache.get(key)
+    if results is None:
+        if connection.vendor == 'postgresql':
+            results = _search_trigrams(normalized, limit)
+        else:
+            results = _search_ngrams(normalized, limit)
+
+        cache.set(key, results, timeout=settings.SEARCH_CACHE_TTL)
+
+    if not results:
+        return []
+
+    users = models.User.objects.select_related('primary_email').in_bulk(
+        [user_id for user_id, _ in results],
+    )
+
+    # Users deleted since the results were cached are left out.
+    return [
+        (users[user_id], score)
+        for user_id, score in results
+        if user_id in users
+    ]
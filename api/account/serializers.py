@@ -2,15 +2,27 @@ import logging
 
 from django.contrib.auth import password_validation
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.utils.translation import ugettext as _, ugettext_lazy
 from rest_framework import serializers
 
-from account import models
+from account import models, tokens
 
 
 logger = logging.getLogger(__name__)
 
 
+class EmailSerializer(serializers.ModelSerializer):
+    """
+    Serializer for listing email addresses.
+    """
+
+    class Meta:
+        fields = ('address', 'id', 'is_verified', 'time_created', 'user')
+        model = models.Email
+        read_only_fields = fields
+
+
 class EmailVerificationSerializer(serializers.Serializer):
     """
     Serializer for verifying an email address.
@@ -34,21 +46,41 @@ class EmailVerificationSerializer(serializers.Serializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self._email: models.Email = None
         self._verification: models.EmailVerification = None
 
     def save(self):
         """
         Verify the email address associated with the provided
         verification token.
+
+        Raises:
+            serializers.ValidationError:
+                If the email was verified by another request after the
+                token was validated.
         """
-        self._verification.verify()
+        if self._verification is not None:
+            verified = self._verification.verify()
+        else:
+            verified = self._email.verify()
+
+        if not verified:
+            raise serializers.ValidationError(
+                code='invalid_token',
+                detail={
+                    'token': (
+                        _('The provided token does not exist or has '
+                          'expired.'),
+                    ),
+                },
+            )
 
     def validate(self, data):
         """
         Validate the provided token and password.
 
-        At this point we have the verification object cached, so we use
-        it to look up the associated ``Email`` and ``User`` instances.
+        At this point we have the email the token verifies cached, so we
+        use it to look up the associated ``User`` instance.
         If the provided password does not match the user, a
         ``serializers.ValidationError`` is raised.
 
@@ -59,7 +91,7 @@ class EmailVerificationSerializer(serializers.Serializer):
         Returns:
             The validated data.
         """
-        if not self._verification.email.user.check_password(data['password']):
+        if not self._email.user.check_password(data['password']):
             raise serializers.ValidationError(
                 code='invalid_password',
                 detail={
@@ -88,17 +120,36 @@ class EmailVerificationSerializer(serializers.Serializer):
             serializers.ValidationError:
                 If the provided token does not exist or has expired.
         """
-        try:
-            self._verification = models.EmailVerification.objects.get(
-                token=token,
-            )
-        except models.EmailVerification.DoesNotExist:
-            raise serializers.ValidationError(
-                code='invalid_token',
-                detail=_('The provided token does not exist or has expired.'),
-            )
-
-        return token
+        email_id = tokens.get_email_id(token)
+        if email_id is not None:
+            # Signed tokens are checked against the email they verify,
+            # which is fetched along with its user to check the
+            # password.
+            email = models.Email.objects.select_related('user').filter(
+                id=email_id,
+                is_verified=False,
+            ).first()
+
+            if email is not None and tokens.check_token(email, token):
+                self._email = email
+
+                return token
+        else:
+            # The email and user are needed to check the password, so we
+            # fetch them along with the verification in a single query.
+            verifications = models.EmailVerification.objects.active()
+            verifications = verifications.select_related('email__user')
+
+            self._verification = verifications.filter(token=token).first()
+            if self._verification is not None:
+                self._email = self._verification.email
+
+                return token
+
+        raise serializers.ValidationError(
+            code='invalid_token',
+            detail=_('The provided token does not exist or has expired.'),
+        )
 
 
 class RegistrationSerializer(serializers.Serializer):
@@ -123,6 +174,7 @@ class RegistrationSerializer(serializers.Serializer):
         write_only=True,
     )
 
+    @transaction.atomic
     def save(self):
         """
         Register a new user with the provided information.
@@ -132,49 +184,82 @@ class RegistrationSerializer(serializers.Serializer):
         verified, a new verification email is sent. If the email does
         not exist, a new user and email are created, and a verification
         email is sent to the new email.
+
+        Emails are not sent directly. Instead they are added to the
+        outbox in the same transaction as the rest of the registration
+        and delivered by the ``send_queued_emails`` command.
         """
         email = self.validated_data['email']
         name = self.validated_data['name']
         password = self.validated_data['password']
 
-        email_query = models.Email.objects.filter(address=email)
-        if email_query.exists():
-            email_instance = email_query.get()
-
-            # If the email is already verified, we send a duplicate
-            # notification and exit.
-            if email_instance.is_verified:
+        # Addresses are looked up by their canonical form so that the
+        # same mailbox can't be registered with a different case.
+        canonical = models.Email.canonicalize_address(email)
+        emails = models.Email.objects.select_related('user')
+        email_instance = emails.filter(canonical_address=canonical).first()
+
+        if email_instance is None:
+            # The email doesn't exist, so we create a new user and
+            # email. The creation happens in a savepoint so that if a
+            # concurrent request registers the same address first, we
+            # can roll back the new user and treat the address as a
+            # duplicate instead of failing.
+            try:
+                with transaction.atomic():
+                    user = models.User.objects.create_user(name, password)
+                    email_instance = models.Email.objects.create(
+                        address=email,
+                        user=user,
+                    )
+            except IntegrityError:
                 logger.info(
-                    "Not registering a new user because the email address %r "
-                    "is already verified.",
-                    email_instance,
+                    "The email address %r was registered by a concurrent "
+                    "request.",
+                    email,
                 )
-                email_instance.send_duplicate_notification()
+                email_instance = emails.get(canonical_address=canonical)
+            else:
+                self._register_new_email(email_instance)
 
                 return
 
-            # If the email is not verified, we send a new verification
-            # token to the address.
+        # If the email is already verified, we send a duplicate
+        # notification and exit.
+        if email_instance.is_verified:
             logger.info(
                 "Not registering a new user because the email address %r "
-                "already exists. Sending a new verification token instead."
-            )
-            verification = models.EmailVerification.objects.create(
-                email=email_instance,
+                "is already verified.",
+                email_instance,
             )
-            verification.send_email()
+            email_instance.queue_duplicate_notification()
 
             return
 
-        # The email doesn't exist, so we create a new user and email,
-        # then send a verification token to the email.
-        user = models.User.objects.create_user(name, password)
-        email_instance = models.Email.objects.create(address=email, user=user)
+        # If the email is not verified, we send a new verification
+        # token to the address.
+        logger.info(
+            "Not registering a new user because the email address %r "
+            "already exists. Sending a new verification token instead.",
+            email_instance,
+        )
+        email_instance.queue_verification()
+
+    @staticmethod
+    def _register_new_email(email_instance: models.Email):
+        """
+        Finish registering a newly created user and email.
+
+        Args:
+            email_instance:
+                The email that was just created along with its user.
+        """
+        user = email_instance.user
 
         # The user's primary email is their only email. This is the only
         # time the primary email can be unverified.
         user.primary_email = email_instance
-        user.save()
+        user.save(update_fields=('primary_email',))
 
         logger.info(
             "Registered new user %r with email address %r",
@@ -182,10 +267,7 @@ class RegistrationSerializer(serializers.Serializer):
             email_instance,
         )
 
-        verification = models.EmailVerification.objects.create(
-            email=email_instance,
-        )
-        verification.send_email()
+        email_instance.queue_verification()
 
     def validate_email(self, email):
         """
@@ -223,3 +305,49 @@ class RegistrationSerializer(serializers.Serializer):
             )
 
         return password
+
+
+class UserSearchResultSerializer(serializers.Serializer):
+    """
+    Serializer for a user found by a search.
+
+    Email addresses are deliberately left out so searches can't be used
+    to discover a user's address.
+    """
+    id = serializers.UUIDField(
+        help_text=ugettext_lazy("The user's ID."),
+        read_only=True,
+    )
+    name = serializers.CharField(
+        help_text=ugettext_lazy("The user's name."),
+        read_only=True,
+    )
+    score = serializers.FloatField(
+        help_text=ugettext_lazy(
+            "How closely the user matches the query, from 0 to 1."
+        ),
+        read_only=True,
+    )
+
+
+class UserSerializer(serializers.ModelSerializer):
+    """
+    Serializer for listing users.
+    """
+    primary_email = serializers.SlugRelatedField(
+        help_text=ugettext_lazy("The address of the user's primary email."),
+        read_only=True,
+        slug_field='address',
+    )
+
+    class Meta:
+        fields = (
+            'id',
+            'is_active',
+            'is_staff',
+            'name',
+            'primary_email',
+            'time_created',
+        )
+        model = models.User
+        read_only_fields = fields
@@ -0,0 +1,109 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+)
+from django.dispatch import receiver
+
+from account import caching, models, search
+from auth import denylist
+
+
+@receiver(post_save, sender=models.Email)
+def index_email(sender, instance, created, update_fields, **kwargs):
+    """
+    Update the search trigrams for an email address when it changes.
+    """
+    if update_fields is None or 'address' in update_fields:
+        search.index_emails([instance], replace=not created)
+
+
+@receiver(post_save, sender=get_user_model())
+def index_user(sender, instance, created, update_fields, **kwargs):
+    """
+    Update the search trigrams for a user's name when it changes.
+    """
+    if update_fields is None or 'name' in update_fields:
+        search.index_users([instance], replace=not created)
+
+
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_save, sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Remove a user from the user cache when they are modified or deleted.
+
+    The user is removed once the transaction commits. Removing them
+    earlier would let a concurrent lookup cache the old row again.
+    """
+    user_id = instance.pk
+
+    transaction.on_commit(
+        lambda: caching.get_user_cache().invalidate(user_id),
+    )
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+@receiver(m2m_changed, sender=get_user_model().user_permissions.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+@receiver(post_save, sender=Permission)
+def invalidate_permissions(sender, action=None, **kwargs):
+    """
+    Invalidate every user's cached permissions when group memberships or
+    permission assignments change.
+
+    The permissions are invalidated once the transaction commits.
+    Invalidating them earlier would let a concurrent request cache the
+    old permissions under the new version.
+    """
+    if action in (None, 'post_add', 'post_clear', 'post_remove'):
+        transaction.on_commit(caching.invalidate_permissions)
+
+
+@receiver(post_init, sender=get_user_model())
+def remember_token_claims(sender, instance, **kwargs):
+    """
+    Record the user attributes embedded in their tokens as claims, so
+    that changes to them can be detected when the user is saved.
+    """
+    instance._token_claims = get_token_claims(instance)
+
+
+@receiver(post_save, sender=get_user_model())
+def revoke_stale_user_tokens(sender, instance, created, **kwargs):
+    """
+    Revoke every token issued to a user when the claims embedded in
+    their tokens about whether they are active or staff change.
+    """
+    claims = get_token_claims(instance)
+
+    if not created and claims != instance._token_claims:
+        denylist.revoke_user(instance.pk)
+
+    instance._token_claims = claims
+
+
+def get_token_claims(user):
+    """
+    Get the privilege related attributes of a user that are embedded in
+    their tokens.
+
+    Deferred fields are left unloaded and reported as ``None``.
+
+    Args:
+        user:
+            The user to get the attributes of.
+
+    Returns:
+        A tuple of the user's ``is_active`` and ``is_staff`` attributes.
+    """
+    return (
+        user.__dict__.get('is_active'),
+        user.__dict__.get('is_staff'),
+    )
@@ -0,0 +1,64 @@
+import pytest
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account import authentication
+
+
+@pytest.fixture
+def jwt_auth() -> authentication.CachedJWTAuthentication:
+    """
+    Fixture to get an instance of the authentication class.
+    """
+    return authentication.CachedJWTAuthentication()
+
+
+def test_get_user(django_assert_num_queries, jwt_auth, user_factory):
+    """
+    The user the token was issued for should be returned, and repeated
+    lookups should be served from the cache.
+    """
+    user = user_factory()
+    token = AccessToken.for_user(user)
+
+    assert jwt_auth.get_user(token) == user
+
+    with django_assert_num_queries(0):
+        assert jwt_auth.get_user(token) == user
+
+
+def test_get_user_inactive(jwt_auth, user_factory):
+    """
+    If the user is inactive, authentication should fail.
+    """
+    user = user_factory(is_active=False)
+    token = AccessToken.for_user(user)
+
+    with pytest.raises(AuthenticationFailed):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_missing(jwt_auth, user_factory):
+    """
+    If the user no longer exists, authentication should fail.
+    """
+    user = user_factory()
+    token = AccessToken.for_user(user)
+    user.delete()
+
+    with pytest.raises(AuthenticationFailed):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_no_claim(jwt_auth, user_factory):
+    """
+    If the token does not identify a user, it should be rejected.
+    """
+    token = AccessToken.for_user(user_factory())
+    del token['user_id']
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
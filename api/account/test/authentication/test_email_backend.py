@@ -1,6 +1,7 @@
 import pytest
+from django.contrib.auth.models import Group, Permission
 
-from account import authentication
+from account import authentication, models
 
 PASSWORD = 'password'
 
@@ -33,6 +34,25 @@ def test_authenticate_inactive_user(
     assert result is None
 
 
+def test_authenticate_different_case(
+        auth_backend,
+        email_factory,
+        user_factory):
+    """
+    Email addresses should be matched regardless of their case.
+    """
+    user = user_factory(password=PASSWORD)
+    email_factory(address='John@Example.com', is_verified=True, user=user)
+
+    result = auth_backend.authenticate(
+        None,
+        email='jOHN@example.COM',
+        password=PASSWORD,
+    )
+
+    assert result == user
+
+
 def test_authenticate_missing_email(auth_backend, db):
     """
     If the provided email address does not exist in the system, ``None``
@@ -47,6 +67,40 @@ def test_authenticate_missing_email(auth_backend, db):
     assert result is None
 
 
+def test_authenticate_no_email(auth_backend, db):
+    """
+    If no email address is provided, ``None`` should be returned.
+    """
+    result = auth_backend.authenticate(None, password=PASSWORD)
+
+    assert result is None
+
+
+def test_authenticate_rehash_password(
+        auth_backend,
+        email_factory,
+        settings,
+        user_factory):
+    """
+    If the password hashing parameters have changed since the user's
+    password was hashed, it should be re-hashed on login.
+    """
+    settings.PBKDF2_ITERATIONS = 1000
+    user = user_factory(password=PASSWORD)
+    email = email_factory(is_verified=True, user=user)
+
+    settings.PBKDF2_ITERATIONS = 2000
+    result = auth_backend.authenticate(
+        None,
+        email=email.address,
+        password=PASSWORD,
+    )
+    user.refresh_from_db()
+
+    assert result == user
+    assert user.password.startswith('pbkdf2_sha256$2000$')
+
+
 def test_authenticate_unverified_email(
         auth_backend,
         email_factory,
@@ -87,6 +141,28 @@ def test_authenticate_valid_credentials(
     assert result == user
 
 
+def test_authenticate_single_query(
+        auth_backend,
+        django_assert_num_queries,
+        email_factory,
+        user_factory):
+    """
+    Authenticating should fetch the email and its user in a single
+    query.
+    """
+    user = user_factory(password=PASSWORD)
+    email = email_factory(is_verified=True, user=user)
+
+    with django_assert_num_queries(1):
+        result = auth_backend.authenticate(
+            None,
+            email=email.address,
+            password=PASSWORD,
+        )
+
+    assert result == user
+
+
 def test_authenticate_valid_credentials_alias(
         auth_backend,
         email_factory,
@@ -126,6 +202,125 @@ def test_authenticate_wrong_password(
     assert result is None
 
 
+@pytest.fixture
+def group_permission(db):
+    """
+    Fixture to get a group and a permission granted to it.
+    """
+    permission = Permission.objects.get(codename='change_email')
+    group = Group.objects.create(name='Support')
+    group.permissions.add(permission)
+
+    return group, permission
+
+
+def test_get_all_permissions(auth_backend, group_permission, user_factory):
+    """
+    The permissions of a user's groups should be resolved.
+    """
+    group, _ = group_permission
+    user = user_factory()
+    user.groups.add(group)
+
+    assert auth_backend.get_all_permissions(user) == {'account.change_email'}
+    assert user.has_perm('account.change_email')
+    assert not user.has_perm('account.delete_email')
+
+
+def test_get_all_permissions_cached(
+        auth_backend,
+        django_assert_num_queries,
+        group_permission,
+        user_factory):
+    """
+    Once a user's permissions have been resolved, they should be reused
+    by other instances of the user without querying the database.
+    """
+    group, _ = group_permission
+    user = user_factory()
+    user.groups.add(group)
+    auth_backend.get_all_permissions(user)
+
+    other = models.User.objects.get(id=user.id)
+
+    with django_assert_num_queries(0):
+        perms = auth_backend.get_all_permissions(other)
+
+    assert perms == {'account.change_email'}
+
+
+def test_get_all_permissions_group_changed(
+        auth_backend,
+        group_permission,
+        transactional_db,
+        user_factory):
+    """
+    Changing the permissions of a user's group should invalidate their
+    cached permissions.
+    """
+    group, _ = group_permission
+    user = user_factory()
+    user.groups.add(group)
+    auth_backend.get_all_permissions(user)
+
+    group.permissions.add(Permission.objects.get(codename='delete_email'))
+    other = models.User.objects.get(id=user.id)
+
+    assert auth_backend.get_all_permissions(other) == {
+        'account.change_email',
+        'account.delete_email',
+    }
+
+
+def test_get_all_permissions_inactive(
+        auth_backend,
+        group_permission,
+        user_factory):
+    """
+    Inactive users should have no permissions.
+    """
+    group, _ = group_permission
+    user = user_factory(is_active=False)
+    user.groups.add(group)
+
+    assert auth_backend.get_all_permissions(user) == set()
+
+
+def test_get_all_permissions_membership_removed(
+        auth_backend,
+        group_permission,
+        transactional_db,
+        user_factory):
+    """
+    Removing a user from a group should invalidate their cached
+    permissions.
+    """
+    group, _ = group_permission
+    user = user_factory()
+    user.groups.add(group)
+    auth_backend.get_all_permissions(user)
+
+    group.user_set.remove(user)
+    other = models.User.objects.get(id=user.id)
+
+    assert auth_backend.get_all_permissions(other) == set()
+
+
+def test_get_all_permissions_superuser(auth_backend, user_factory):
+    """
+    Promoting a user to a superuser should give them every permission
+    despite their previous permissions being cached.
+    """
+    user = user_factory()
+    assert auth_backend.get_all_permissions(user) == set()
+
+    user.is_superuser = True
+    user.save()
+    other = models.User.objects.get(id=user.id)
+
+    assert 'account.delete_user' in auth_backend.get_all_permissions(other)
+
+
 def test_get_user(auth_backend, user_factory):
     """
     The user with the given ID should be returned if they exist.
@@ -140,3 +335,16 @@ def test_get_user_invalid_id(auth_backend, db):
     If there is no user with the given ID, ``None`` should be returned.
     """
     assert auth_backend.get_user(None) is None
+
+
+def test_get_users(auth_backend, django_assert_num_queries, user_factory):
+    """
+    Fetching multiple users should return them keyed by ID using a
+    single query.
+    """
+    users = user_factory.create_batch(3)
+
+    with django_assert_num_queries(1):
+        result = auth_backend.get_users([user.id for user in users])
+
+    assert result == {user.id: user for user in users}
@@ -0,0 +1,208 @@
+"""
+Helpers for benchmarking requests made through the WSGI application.
+
+Requests are passed straight to the WSGI handler, so the full middleware
+stack runs without any network overhead.
+"""
+
+import io
+import json
+import queue
+import statistics
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+from django.db import connection
+
+
+def call_wsgi(application, method: str, path: str, data=None):
+    """
+    Make a request to a WSGI application.
+
+    Args:
+        application:
+            The WSGI application to call.
+        method:
+            The HTTP method of the request.
+        path:
+            The path to request.
+        data:
+            Data to send as the JSON body of the request.
+
+    Returns:
+        The status code of the response.
+    """
+    body = json.dumps(data).encode() if data is not None else b''
+    environ = {
+        'CONTENT_LENGTH': str(len(body)),
+        'CONTENT_TYPE': 'application/json',
+        'HTTP_HOST': 'testserver',
+        'PATH_INFO': path,
+        'REQUEST_METHOD': method,
+        'SERVER_NAME': 'testserver',
+        'wsgi.input': io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+
+    status = []
+
+    def start_response(status_line, headers, exc_info=None):
+        status.append(int(status_line.split(' ', 1)[0]))
+
+    response = application(environ, start_response)
+    try:
+        for _ in response:
+            pass
+    finally:
+        if hasattr(response, 'close'):
+            response.close()
+
+    return status[0]
+
+
+def percentile(values, percent: float):
+    """
+    Get a percentile of a list of values using the nearest rank.
+
+    Args:
+        values:
+            The values to get the percentile of.
+        percent:
+            The percentile to get, between 0 and 100.
+
+    Returns:
+        The value at the given percentile.
+    """
+    ordered = sorted(values)
+    index = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+
+    return ordered[index]
+
+
+def run_flow(application, requests, concurrency: int):
+    """
+    Make a series of POST requests concurrently and measure them.
+
+    Args:
+        application:
+            The WSGI application to call.
+        requests:
+            A list of tuples containing the path and data of each
+            request.
+        concurrency:
+            The number of requests to make at once.
+
+    Returns:
+        A dictionary containing the latency percentiles in milliseconds,
+        the throughput in requests per second, the mean number of
+        queries per request, and the status code of each response.
+    """
+    local = threading.local()
+    pending = queue.Queue()
+    results = []
+
+    for request in requests:
+        pending.put(request)
+
+    def count_query(execute, sql, params, many, context):
+        local.queries += 1
+
+        return execute(sql, params, many, context)
+
+    def work():
+        try:
+            while True:
+                try:
+                    path, data = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                local.queries = 0
+                start = time.perf_counter()
+                with connection.execute_wrapper(count_query):
+                    status = call_wsgi(application, 'POST', path, data)
+
+                results.append(
+                    (status, time.perf_counter() - start, local.queries),
+                )
+        finally:
+            # Each thread has its own connection, which would otherwise
+            # stay open after the thread exits.
+            connection.close()
+
+    workers = [threading.Thread(target=work) for _ in range(concurrency)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = [duration * 1000 for _, duration, _ in results]
+
+    return {
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'queries_per_request': statistics.mean(
+            queries for _, _, queries in results
+        ),
+        'statuses': [status for status, _, _ in results],
+        'throughput': len(results) / elapsed,
+    }
+
+
+def check_regressions(
+        name: str,
+        result: dict,
+        baseline: dict,
+        tolerance,
+        check_timings: bool = True):
+    """
+    Compare a flow's results to its baseline.
+
+    Args:
+        name:
+            The name of the flow.
+        result:
+            The flow's results, as returned by ``run_flow``.
+        baseline:
+            The stored results for the flow.
+        tolerance:
+            The factor by which the 95th percentile latency and the
+            throughput may be worse than the baseline. Timings vary
+            between machines, so this should be generous.
+        check_timings:
+            A boolean indicating if latency and throughput should be
+            checked in addition to the number of queries per request.
+
+    Returns:
+        A list of messages describing each regression.
+    """
+    regressions = []
+
+    if result['queries_per_request'] > baseline['queries_per_request']:
+        regressions.append(
+            f"{name}: {result['queries_per_request']:g} queries per request, "
+            f"up from {baseline['queries_per_request']:g}"
+        )
+
+    if not check_timings:
+        return regressions
+
+    if result['p95_ms'] > baseline['p95_ms'] * tolerance:
+        regressions.append(
+            f"{name}: p95 latency of {result['p95_ms']:.1f}ms exceeds "
+            f"{tolerance:g}x the baseline of {baseline['p95_ms']:.1f}ms"
+        )
+
+    if result['throughput'] < baseline['throughput'] / tolerance:
+        regressions.append(
+            f"{name}: throughput of {result['throughput']:.1f} requests/s "
+            f"is below 1/{tolerance:g} of the baseline of "
+            f"{baseline['throughput']:.1f} requests/s"
+        )
+
+    return regressions
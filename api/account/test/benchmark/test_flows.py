@@ -0,0 +1,224 @@
+"""
+Benchmarks for the account and authentication flows.
+
+These are excluded from the default test run. Run them with::
+
+    pytest -m benchmark
+
+Each flow is driven concurrently through the WSGI application and its
+results are compared to ``baseline.json``. The following environment
+variables control the run:
+
+``BENCHMARK_CHECK_TIMINGS``
+    If set to "1", the benchmark also fails if latency or throughput
+    regressed. Timings depend on the machine running the benchmark, so
+    by default only the number of queries per request is checked.
+
+``BENCHMARK_CONCURRENCY``
+    The number of requests to make at once. SQLite can't handle
+    concurrent writes to the in-memory test database, so requests are
+    always made one at a time there. Defaults to 4.
+
+``BENCHMARK_REQUESTS``
+    The number of requests to make for each flow. Defaults to 20.
+
+``BENCHMARK_TOLERANCE``
+    The factor by which latency and throughput may be worse than the
+    baseline before the benchmark fails when timings are checked.
+    Defaults to 2.
+
+``BENCHMARK_UPDATE_BASELINE``
+    If set to "1", the baseline is replaced with the new results instead
+    of being compared to them.
+"""
+
+import json
+import os
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection
+from rest_framework.reverse import reverse
+
+from account import models, throttling
+from account.test.benchmark import harness
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+PASSWORD = 'C0rrectH0rseBatteryStaple'
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def application(monkeypatch, transactional_db):
+    """
+    Fixture to get the WSGI application with rate limiting disabled.
+
+    The worker threads use their own database connections, so the data
+    used by the benchmarks has to be committed rather than wrapped in a
+    transaction.
+    """
+    monkeypatch.setattr(
+        throttling.SlidingWindowRateThrottle,
+        'THROTTLE_RATES',
+        {
+            'email-verification': None,
+            'registration': None,
+            'registration-email': None,
+            'token': None,
+            'token-email': None,
+        },
+    )
+
+    return WSGIHandler()
+
+
+@pytest.fixture
+def benchmark(application, capsys):
+    """
+    Fixture to get a function that runs a flow, reports its results,
+    and fails if they regressed from the baseline.
+    """
+    check_timings = os.environ.get('BENCHMARK_CHECK_TIMINGS') == '1'
+    concurrency = int(os.environ.get('BENCHMARK_CONCURRENCY', '4'))
+    if connection.vendor == 'sqlite':
+        concurrency = 1
+
+    tolerance = float(os.environ.get('BENCHMARK_TOLERANCE', '2'))
+    update = os.environ.get('BENCHMARK_UPDATE_BASELINE') == '1'
+
+    def run(name, requests, expected_status):
+        result = harness.run_flow(application, requests, concurrency)
+
+        with capsys.disabled():
+            print(
+                f"\n{name}: {len(requests)} requests, concurrency "
+                f"{concurrency}, p50 {result['p50_ms']:.1f}ms, "
+                f"p95 {result['p95_ms']:.1f}ms, "
+                f"p99 {result['p99_ms']:.1f}ms, "
+                f"{result['throughput']:.1f} requests/s, "
+                f"{result['queries_per_request']:g} queries/request"
+            )
+
+        assert set(result.pop('statuses')) == {expected_status}
+
+        with open(BASELINE_PATH) as f:
+            baselines = json.load(f)
+
+        # Query counts differ between databases, so each has its own
+        # baseline.
+        vendor_baselines = baselines.setdefault(connection.vendor, {})
+
+        if update:
+            vendor_baselines[name] = {
+                key: round(value, 2) for key, value in result.items()
+            }
+            with open(BASELINE_PATH, 'w') as f:
+                json.dump(baselines, f, indent=2, sort_keys=True)
+                f.write('\n')
+        elif name in vendor_baselines:
+            regressions = harness.check_regressions(
+                name,
+                result,
+                vendor_baselines[name],
+                tolerance,
+                check_timings=check_timings,
+            )
+            assert not regressions, '\n'.join(regressions)
+
+    return run
+
+
+@pytest.fixture
+def request_count():
+    """
+    Fixture to get the number of requests to make for each flow.
+    """
+    return int(os.environ.get('BENCHMARK_REQUESTS', '20'))
+
+
+@pytest.fixture
+def seed_emails(email_factory, request_count):
+    """
+    Fixture to get a function that creates a user and email for each
+    request.
+
+    Hashing a password is deliberately slow, so it is hashed once and
+    shared by every user.
+    """
+    def seed(is_verified):
+        emails = email_factory.create_batch(
+            request_count,
+            is_verified=is_verified,
+            user__password=None,
+        )
+        models.User.objects.update(password=make_password(PASSWORD))
+
+        return emails
+
+    return seed
+
+
+def test_email_verification(
+        benchmark,
+        email_verification_factory,
+        seed_emails):
+    """
+    Benchmark verifying email addresses.
+    """
+    verifications = [
+        email_verification_factory(email=email)
+        for email in seed_emails(is_verified=False)
+    ]
+    url = reverse('account:email-verification')
+
+    benchmark(
+        'email-verification',
+        [
+            (url, {'password': PASSWORD, 'token': verification.token})
+            for verification in verifications
+        ],
+        200,
+    )
+
+
+def test_registration(benchmark, request_count, seed_emails):
+    """
+    Benchmark registering new users alongside existing ones.
+    """
+    seed_emails(is_verified=True)
+    url = reverse('account:registration')
+
+    benchmark(
+        'registration',
+        [
+            (
+                url,
+                {
+                    'email': f'new{n}@example.com',
+                    'name': f'New User {n}',
+                    'password': PASSWORD,
+                },
+            )
+            for n in range(request_count)
+        ],
+        201,
+    )
+
+
+def test_token_obtain(benchmark, seed_emails):
+    """
+    Benchmark obtaining access tokens with an email and password.
+    """
+    url = reverse('auth:token-obtain')
+
+    benchmark(
+        'token-obtain',
+        [
+            (url, {'email': email.address, 'password': PASSWORD})
+            for email in seed_emails(is_verified=True)
+        ],
+        200,
+    )
@@ -0,0 +1,60 @@
+from account.caching import LRUCache
+
+
+class FakeTimer:
+    """
+    Timer whose time is set manually.
+    """
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_expired():
+    """
+    Entries should not be returned once their TTL has passed.
+    """
+    timer = FakeTimer()
+    cache = LRUCache(max_size=2, ttl=10, timer=timer)
+    cache.set('key', 'value')
+
+    timer.now = 9
+    assert cache.get('key') == 'value'
+
+    timer.now = 10
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used():
+    """
+    If the cache is full, the least recently used entry should be
+    evicted.
+    """
+    cache = LRUCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    # Using 'a' makes 'b' the least recently used entry.
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_delete():
+    """
+    Deleting a key should remove it from the cache.
+    """
+    cache = LRUCache(max_size=2, ttl=10)
+    cache.set('key', 'value')
+
+    cache.delete('key')
+    cache.delete('missing')
+
+    assert cache.get('key') is None
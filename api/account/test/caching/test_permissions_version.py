@@ -0,0 +1,41 @@
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+
+from account import caching
+
+
+def test_get_permissions_version():
+    """
+    The same version should be returned until it is invalidated.
+    """
+    version = caching.get_permissions_version()
+
+    assert caching.get_permissions_version() == version
+
+
+def test_invalidate_permissions():
+    """
+    Invalidating permissions should replace the version.
+    """
+    version = caching.get_permissions_version()
+
+    caching.invalidate_permissions()
+
+    assert caching.get_permissions_version() != version
+
+
+def test_invalidate_permissions_after_commit(transactional_db):
+    """
+    Permissions changed inside a transaction should only be invalidated
+    once the transaction commits, so a concurrent request can't cache
+    the old permissions under the new version.
+    """
+    group = Group.objects.create(name='Support')
+    version = caching.get_permissions_version()
+
+    with transaction.atomic():
+        group.permissions.add(Permission.objects.get(codename='change_email'))
+
+        assert caching.get_permissions_version() == version
+
+    assert caching.get_permissions_version() != version
@@ -0,0 +1,186 @@
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from account import caching
+
+
+def test_get_cached(django_assert_num_queries, user_factory):
+    """
+    After a user has been fetched once, further lookups should not query
+    the database.
+    """
+    user = user_factory()
+    user_cache = caching.get_user_cache()
+
+    assert user_cache.get(user.id) == user
+
+    with django_assert_num_queries(0):
+        cached = user_cache.get(user.id)
+
+    assert cached == user
+    assert cached is not user
+    assert cached.name == user.name
+    assert user_cache.stats() == {
+        'local_hits': 1,
+        'misses': 1,
+        'shared_hits': 0,
+    }
+
+
+def test_get_missing(db):
+    """
+    If the user does not exist, ``None`` should be returned.
+    """
+    user_cache = caching.get_user_cache()
+
+    assert user_cache.get('bb2de7ef-04b5-4b62-9b7e-e5da5d1a6e5c') is None
+    assert user_cache.get('not-a-uuid') is None
+
+
+def test_get_shared(django_assert_num_queries, settings, user_factory):
+    """
+    If shared caching is enabled, users cached by another process should
+    be used.
+    """
+    settings.USER_CACHE_SHARED = True
+    user = user_factory()
+    user_cache = caching.get_user_cache()
+
+    user_cache.get(user.id)
+    # Simulate a different process with an empty local cache.
+    user_cache.local.clear()
+
+    with django_assert_num_queries(0):
+        assert user_cache.get(user.id) == user
+
+    assert user_cache.stats()['shared_hits'] == 1
+
+
+def test_invalidate_on_save(settings, transactional_db, user_factory):
+    """
+    Saving a user should remove them from the cache.
+    """
+    settings.USER_CACHE_SHARED = True
+    user = user_factory(is_active=True)
+    user_cache = caching.get_user_cache()
+    user_cache.get(user.id)
+
+    user.is_active = False
+    user.save()
+
+    assert cache.get(user_cache.key_format % user.id) is None
+    assert not user_cache.get(user.id).is_active
+
+
+def test_invalidate_on_delete(transactional_db, user_factory):
+    """
+    Deleting a user should remove them from the cache.
+    """
+    user = user_factory()
+    user_cache = caching.get_user_cache()
+    user_cache.get(user.id)
+
+    user_id = user.id
+    user.delete()
+
+    assert user_cache.get(user_id) is None
+
+
+def test_invalidate_after_commit(transactional_db, user_factory):
+    """
+    A user saved inside a transaction should only be removed from the
+    cache once the transaction commits, so a concurrent lookup can't
+    cache the old row again.
+    """
+    user = user_factory(name='Old Name')
+    user_cache = caching.get_user_cache()
+    user_cache.get(user.id)
+
+    with transaction.atomic():
+        user.name = 'New Name'
+        user.save()
+
+        assert user_cache.local.get(user_cache.key_format % user.id)
+
+    assert user_cache.get(user.id).name == 'New Name'
+
+
+def test_password_not_cached(
+        django_assert_num_queries,
+        settings,
+        user_factory):
+    """
+    The password hash should not be stored in the cache, but should
+    still be loaded if a cached user's password is checked.
+    """
+    settings.USER_CACHE_SHARED = True
+    user = user_factory(password='password')
+    user_cache = caching.get_user_cache()
+    user_cache.get(user.id)
+
+    values, _ = cache.get(user_cache.key_format % user.id)
+    assert user.password not in values
+
+    cached = user_cache.get(user.id)
+    with django_assert_num_queries(1):
+        assert cached.check_password('password')
+
+
+def test_session_auth_hash(django_assert_num_queries, user_factory):
+    """
+    Cached users should provide their session hash without loading
+    their password, until their password is changed.
+    """
+    user = user_factory(password='password')
+    user_cache = caching.get_user_cache()
+    user_cache.get(user.id)
+
+    cached = user_cache.get(user.id)
+    with django_assert_num_queries(0):
+        assert cached.get_session_auth_hash() == user.get_session_auth_hash()
+
+    cached.set_password('new-password')
+
+    assert cached.get_session_auth_hash() != user.get_session_auth_hash()
+
+
+def test_session_request(
+        api_client,
+        django_assert_num_queries,
+        user_factory):
+    """
+    Authenticating a session for a cached user should only query the
+    session.
+    """
+    api_client.force_login(user_factory())
+    url = reverse('account:user-search')
+    api_client.get(url)
+
+    with django_assert_num_queries(1) as captured:
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'django_session' in captured[0]['sql']
+
+
+def test_collect_metrics(user_factory):
+    """
+    The cache's statistics should be reported as counters.
+    """
+    user = user_factory()
+    cache = caching.get_user_cache()
+    cache.get(user.pk)
+    cache.get(user.pk)
+
+    collected = {
+        name: (metric_type, value)
+        for name, _, metric_type, value in caching.collect_metrics()
+    }
+
+    assert collected == {
+        'account_user_cache_local_hits_total': ('counter', 1),
+        'account_user_cache_misses_total': ('counter', 1),
+        'account_user_cache_shared_hits_total': ('counter', 0),
+    }
@@ -25,6 +25,20 @@ class EmailVerificationFactory(factory.django.DjangoModelFactory):
         model = 'account.EmailVerification'
 
 
+class OutgoingEmailFactory(factory.django.DjangoModelFactory):
+    """
+    Factory for generating test outgoing emails.
+    """
+    context = '{"name": "John Smith"}'
+    from_email = 'no-reply@example.com'
+    recipient_list = factory.Sequence(lambda n: f'["test{n}@example.com"]')
+    subject = 'Test Email'
+    template_name = 'account/emails/verify-email'
+
+    class Meta:
+        model = 'account.OutgoingEmail'
+
+
 @pytest.fixture
 def email_factory(db) -> Type[EmailFactory]:
     """
@@ -39,3 +53,11 @@ def email_verification_factory(db) -> Type[EmailVerificationFactory]:
     Fixture to get the factory used to create email verifications.
     """
     return EmailVerificationFactory
+
+
+@pytest.fixture
+def outgoing_email_factory(db) -> Type[OutgoingEmailFactory]:
+    """
+    Fixture to get the factory used to create outgoing emails.
+    """
+    return OutgoingEmailFactory
@@ -0,0 +1,51 @@
+import csv
+import json
+
+from account import export
+
+
+def test_export_csv(email_factory, user_factory):
+    """
+    Each user should be written as a single CSV row listing all of their
+    addresses.
+    """
+    user = user_factory(name='Alice')
+    primary = email_factory(
+        address='alice@example.com',
+        is_verified=True,
+        user=user,
+    )
+    email_factory(address='alice@work.example.com', user=user)
+    user.primary_email = primary
+    user.save()
+
+    lines = list(export.export_csv(export.iter_users()))
+    rows = list(csv.DictReader(lines))
+
+    assert len(rows) == 1
+    assert rows[0]['email'] == 'alice@example.com'
+    assert rows[0]['emails'] == 'alice@example.com alice@work.example.com'
+    assert rows[0]['id'] == str(user.id)
+    assert rows[0]['name'] == 'Alice'
+    assert rows[0]['verified_emails'] == 'alice@example.com'
+
+
+def test_export_jsonl(email_factory, user_factory):
+    """
+    Each user should be written as a JSON object on its own line.
+    """
+    user = user_factory(name='Alice')
+    email_factory(address='alice@example.com', user=user)
+
+    lines = list(export.export_jsonl(export.iter_users()))
+
+    assert len(lines) == 1
+    assert lines[0].endswith('\n')
+
+    data = json.loads(lines[0])
+    assert data['email'] is None
+    assert data['emails'] == [
+        {'address': 'alice@example.com', 'is_verified': False},
+    ]
+    assert data['id'] == str(user.id)
+    assert data['is_staff'] is False
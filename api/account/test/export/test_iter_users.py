@@ -0,0 +1,27 @@
+from account import export
+
+
+def test_iter_users(django_assert_num_queries, email_factory, user_factory):
+    """
+    Users should be returned in the order they were created, with their
+    emails fetched in one query per chunk. The users themselves are read
+    with a single query.
+    """
+    users = user_factory.create_batch(5)
+    for user in users:
+        email_factory(user=user)
+
+    with django_assert_num_queries(4):
+        result = list(export.iter_users(chunk_size=2))
+
+        for user in result:
+            list(user.emails.all())
+
+    assert result == users
+
+
+def test_iter_users_none(db):
+    """
+    If there are no users, nothing should be returned.
+    """
+    assert list(export.iter_users()) == []
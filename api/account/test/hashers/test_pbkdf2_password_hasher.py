@@ -0,0 +1,29 @@
+from account import hashers
+
+
+def test_iterations(settings):
+    """
+    The number of iterations should come from the project's settings.
+    """
+    settings.PBKDF2_ITERATIONS = 1234
+    hasher = hashers.PBKDF2PasswordHasher()
+
+    encoded = hasher.encode('password', hasher.salt())
+
+    assert hasher.iterations == 1234
+    assert encoded.split('$')[1] == '1234'
+
+
+def test_must_update(settings):
+    """
+    Hashes created with a different number of iterations than the
+    current setting should be updated.
+    """
+    settings.PBKDF2_ITERATIONS = 1000
+    hasher = hashers.PBKDF2PasswordHasher()
+    encoded = hasher.encode('password', hasher.salt())
+
+    settings.PBKDF2_ITERATIONS = 2000
+
+    assert hasher.must_update(encoded)
+    assert hasher.verify('password', encoded)
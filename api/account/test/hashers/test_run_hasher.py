@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest import mock
+
+from account import hashers
+from api import metrics
+
+
+def current_thread_name():
+    """
+    Get the name of the thread the function is called from.
+    """
+    return threading.current_thread().name
+
+
+def test_run_hasher_inline(settings):
+    """
+    If no hashing threads are configured, the function should run in
+    the calling thread.
+    """
+    settings.PASSWORD_HASHING_THREADS = 0
+
+    assert hashers.run_hasher(current_thread_name) == current_thread_name()
+
+
+def test_run_hasher_offloaded(settings):
+    """
+    If hashing threads are configured, the function should run in the
+    hashing thread pool.
+    """
+    settings.PASSWORD_HASHING_THREADS = 2
+
+    result = hashers.run_hasher(current_thread_name)
+
+    assert result.startswith('password-hasher')
+
+
+def test_run_hasher_nested(settings):
+    """
+    Calls made from within the hashing pool should run inline rather
+    than waiting on the pool again.
+    """
+    settings.PASSWORD_HASHING_THREADS = 2
+
+    outer, inner = hashers.run_hasher(
+        lambda: (current_thread_name(), hashers.run_hasher(
+            current_thread_name,
+        )),
+    )
+
+    assert outer == inner
+
+
+def test_verify_offloaded(settings):
+    """
+    Passwords hashed and verified through the pool should behave the
+    same as inline hashing.
+    """
+    settings.PASSWORD_HASHING_THREADS = 2
+    settings.PBKDF2_ITERATIONS = 1000
+    hasher = hashers.PBKDF2PasswordHasher()
+
+    encoded = hasher.encode('password', hasher.salt())
+
+    assert hasher.verify('password', encoded)
+    assert not hasher.verify('wrong', encoded)
+
+
+def test_run_hasher_timed(settings):
+    """
+    The time spent hashing should be recorded once for the current
+    request, even if hashing functions call each other.
+    """
+    settings.PASSWORD_HASHING_THREADS = 0
+
+    def nested():
+        return hashers.run_hasher(lambda: time.sleep(0.01))
+
+    with mock.patch('account.hashers.metrics.record') as mock_record:
+        with metrics.measure_request():
+            hashers.run_hasher(nested)
+
+    assert mock_record.call_count == 1
+    assert mock_record.call_args[0][0] == 'hash'
+    assert mock_record.call_args[0][1] >= 0.01
@@ -0,0 +1,34 @@
+from django.core import mail
+
+from account.mail import FakeEmailBackend
+
+
+def test_send_messages_open_connection():
+    """
+    Sending messages over an open connection should reuse it.
+    """
+    backend = FakeEmailBackend(open_latency=0, send_latency=0)
+    message = mail.EmailMessage(to=['test@example.com'])
+
+    with backend:
+        backend.send_messages([message])
+        backend.send_messages([message])
+
+    assert backend.connections_opened == 1
+    assert backend.messages_sent == 2
+
+
+def test_send_messages_without_connection():
+    """
+    Sending messages without an open connection should open and close a
+    connection for each call.
+    """
+    backend = FakeEmailBackend(open_latency=0, send_latency=0)
+    message = mail.EmailMessage(to=['test@example.com'])
+
+    backend.send_messages([message])
+    backend.send_messages([message])
+
+    assert backend.connections_opened == 2
+    assert backend.messages_sent == 2
+    assert not backend.is_open
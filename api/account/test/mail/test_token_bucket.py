@@ -0,0 +1,59 @@
+from account.mail import TokenBucket
+
+
+class FakeClock:
+    """
+    Clock that only advances when told to sleep.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_consume_burst():
+    """
+    Consuming up to the bucket's capacity should not wait.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        bucket.consume()
+
+    assert clock.sleeps == []
+
+
+def test_consume_throttled():
+    """
+    Once the bucket is empty, consumers should wait for tokens to be
+    replenished at the configured rate.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=1, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        bucket.consume()
+
+    assert clock.sleeps == [0.5] * 4
+    assert clock.now == 2
+
+
+def test_consume_unlimited():
+    """
+    A rate of zero should disable throttling.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(100):
+        bucket.consume()
+
+    assert clock.sleeps == []
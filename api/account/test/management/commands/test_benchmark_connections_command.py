@@ -0,0 +1,34 @@
+from io import StringIO
+
+from django.core import management
+from django.db import connection
+
+from account.management.commands import benchmark_connections
+
+
+def test_benchmark_connections(transactional_db):
+    """
+    The latency of each supported strategy should be reported and the
+    connection settings restored afterwards.
+    """
+    original = connection.settings_dict.get('CONN_MAX_AGE')
+    stdout = StringIO()
+
+    management.call_command('benchmark_connections', requests=3, stdout=stdout)
+
+    lines = stdout.getvalue().splitlines()
+    assert [line.split(':')[0] for line in lines] == [
+        'new connections',
+        'persistent connections',
+    ]
+    assert connection.settings_dict.get('CONN_MAX_AGE') == original
+
+
+def test_percentile():
+    """
+    The nearest rank percentile should be returned.
+    """
+    values = list(range(1, 101))
+
+    assert benchmark_connections.Command.percentile(values, 95) == 95
+    assert benchmark_connections.Command.percentile([5], 95) == 5
@@ -0,0 +1,17 @@
+from io import StringIO
+
+from django.core import management
+
+
+def test_benchmark_hashers(settings):
+    """
+    The command should report the throughput of each configured hasher.
+    """
+    settings.PASSWORD_HASHERS = ['account.hashers.PBKDF2PasswordHasher']
+    settings.PBKDF2_ITERATIONS = 1000
+    out = StringIO()
+
+    management.call_command('benchmark_hashers', duration=0.01, stdout=out)
+
+    assert out.getvalue().startswith('pbkdf2_sha256: ')
+    assert 'hashes/s per core' in out.getvalue()
@@ -0,0 +1,26 @@
+from io import StringIO
+
+from django.core import management
+from django.db import connection
+
+
+def test_benchmark_ids(db):
+    """
+    The insert rate and index size should be reported for each kind of
+    ID, and the benchmark tables removed afterwards.
+    """
+    stdout = StringIO()
+
+    management.call_command(
+        'benchmark_ids',
+        batch_size=40,
+        rows=100,
+        stdout=stdout,
+    )
+
+    lines = stdout.getvalue().splitlines()
+    assert [line.split(':')[0] for line in lines] == ['uuid4', 'uuid7']
+    assert all('rows/s' in line for line in lines)
+
+    tables = connection.introspection.table_names()
+    assert not [table for table in tables if table.startswith('benchmark')]
@@ -52,6 +52,24 @@ def test_create_admin_email_exists_verified(
     assert user.name == 'Admin'
 
 
+def test_create_admin_email_exists_different_case(
+        admin_env,
+        email_factory,
+        user_factory):
+    """
+    An existing email should be found even if its case differs from the
+    provided address.
+    """
+    user = user_factory(is_staff=False, is_superuser=False)
+    email_factory(address=EMAIL.upper(), is_verified=True, user=user)
+
+    management.call_command('createadmin')
+    user.refresh_from_db()
+
+    assert user.is_superuser
+    assert models.Email.objects.count() == 1
+
+
 def test_create_admin_new(admin_env, db):
     """
     If the email specified doesn't exist, it should be created along
@@ -0,0 +1,36 @@
+import json
+from io import StringIO
+
+from django.core import management
+
+
+def test_export_users_file(tmp_path, user_factory):
+    """
+    Passing an output path should write the export to that file.
+    """
+    user_factory.create_batch(3)
+    path = tmp_path / 'users.csv'
+
+    management.call_command('export_users', output=str(path))
+
+    assert len(path.read_text().splitlines()) == 4
+
+
+def test_export_users_stdout(user_factory):
+    """
+    By default, the export should be written to standard output.
+    """
+    users = user_factory.create_batch(3)
+    stdout = StringIO()
+
+    management.call_command(
+        'export_users',
+        chunk_size=2,
+        format='jsonl',
+        stdout=stdout,
+    )
+
+    lines = stdout.getvalue().splitlines()
+    assert [json.loads(line)['id'] for line in lines] == [
+        str(user.id) for user in users
+    ]
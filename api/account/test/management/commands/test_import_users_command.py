@@ -0,0 +1,176 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core import management
+from django.core.management import CommandError
+
+from account import models
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(settings):
+    """
+    Use a cheap password hash so the tests stay fast.
+    """
+    settings.PBKDF2_ITERATIONS = 1
+
+
+def write_csv(tmp_path, *lines):
+    path = tmp_path / 'users.csv'
+    path.write_text('\n'.join(('email,name,password',) + lines) + '\n')
+
+    return str(path)
+
+
+def test_import_users_csv(db, mailoutbox, tmp_path):
+    """
+    Users from a CSV file should be created with an unverified primary
+    email and a queued verification email.
+    """
+    path = write_csv(
+        tmp_path,
+        'alice@EXAMPLE.com,Alice,password',
+        'bob@example.com,Bob,',
+    )
+    stdout = StringIO()
+
+    management.call_command('import_users', path, stdout=stdout, workers=1)
+
+    alice = models.User.objects.get(name='Alice')
+    assert alice.primary_email.address == 'alice@example.com'
+    assert not alice.primary_email.is_verified
+    assert alice.check_password('password')
+    assert not models.User.objects.get(name='Bob').has_usable_password()
+
+    assert models.EmailVerification.objects.count() == 2
+    assert models.OutgoingEmail.objects.count() == 2
+    assert len(mailoutbox) == 0
+    assert stdout.getvalue().startswith(
+        'Imported 2 user(s) and skipped 0 row(s)'
+    )
+
+
+def test_import_users_jsonl(db, tmp_path):
+    """
+    Users can be imported from a JSON Lines file.
+    """
+    path = tmp_path / 'users.jsonl'
+    path.write_text(
+        json.dumps({'email': 'alice@example.com', 'name': 'Alice'}) +
+        '\n\n' +
+        json.dumps({'email': 'bob@example.com', 'name': 'Bob'}) + '\n'
+    )
+
+    management.call_command('import_users', str(path), workers=1)
+
+    assert models.User.objects.count() == 2
+
+
+def test_import_users_skip_invalid(email_factory, tmp_path):
+    """
+    Invalid rows, addresses repeated in the file in any case, and
+    addresses that are already registered should be skipped.
+    """
+    email_factory(address='existing@example.com')
+    path = write_csv(
+        tmp_path,
+        'not-an-email,Invalid,',
+        'alice@example.com,,',
+        'bob@example.com,Bob,',
+        'bob@EXAMPLE.COM,Robert,',
+        'BOB@example.com,Bobby,',
+        'existing@example.com,Existing,',
+    )
+    stderr = StringIO()
+    stdout = StringIO()
+
+    management.call_command(
+        'import_users',
+        path,
+        batch_size=2,
+        stderr=stderr,
+        stdout=stdout,
+        verbosity=2,
+        workers=1,
+    )
+
+    bob = models.User.objects.get(primary_email__address='bob@example.com')
+    assert bob.name == 'Bob'
+    assert models.User.objects.count() == 2
+    assert stdout.getvalue().startswith(
+        'Imported 1 user(s) and skipped 5 row(s)'
+    )
+    assert 'existing@example.com is already registered' in stderr.getvalue()
+
+
+def test_import_users_skip_too_long(db, tmp_path):
+    """
+    Rows with values longer than their columns allow should be skipped
+    rather than aborting the import.
+    """
+    long_address = 'a' * 64 + '@' + ('b' * 62 + '.') * 3 + 'example.com'
+    long_name = 'N' * 128
+    path = write_csv(
+        tmp_path,
+        f'{long_address},Long Address,',
+        f'long-name@example.com,{long_name},',
+        'valid@example.com,Valid,',
+    )
+    stderr = StringIO()
+
+    management.call_command(
+        'import_users',
+        path,
+        stderr=stderr,
+        stdout=StringIO(),
+        verbosity=2,
+        workers=1,
+    )
+
+    assert list(models.User.objects.values_list('name', flat=True)) == [
+        'Valid',
+    ]
+    assert 'longer than 254 characters' in stderr.getvalue()
+    assert 'longer than 127 characters' in stderr.getvalue()
+
+
+def test_import_users_unknown_format(tmp_path):
+    """
+    A file whose format can't be determined should be rejected.
+    """
+    path = tmp_path / 'users.txt'
+    path.write_text('')
+
+    with pytest.raises(CommandError):
+        management.call_command('import_users', str(path))
+
+
+def test_import_users_verified(db, tmp_path):
+    """
+    Passing the verified flag should mark addresses as verified without
+    queuing verification emails.
+    """
+    path = write_csv(tmp_path, 'alice@example.com,Alice,password')
+
+    management.call_command('import_users', path, verified=True, workers=1)
+
+    assert models.Email.objects.get().is_verified
+    assert not models.EmailVerification.objects.exists()
+    assert not models.OutgoingEmail.objects.exists()
+
+
+def test_import_users_worker_threads(db, tmp_path):
+    """
+    Passwords should be hashed correctly when using worker threads.
+    """
+    path = write_csv(
+        tmp_path,
+        *(f'user{i}@example.com,User {i},password{i}' for i in range(4))
+    )
+
+    management.call_command('import_users', path, batch_size=3, workers=2)
+
+    for i in range(4):
+        user = models.User.objects.get(name=f'User {i}')
+        assert user.check_password(f'password{i}')
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core import management
+from django.utils import timezone
+
+from account import models
+
+
+def test_purge_verifications(email_verification_factory, settings):
+    """
+    Expired verifications should be deleted in batches while active
+    verifications are kept.
+    """
+    settings.EMAIL_VERIFICATION_TTL = 60
+    expired = email_verification_factory.create_batch(5)
+    active = email_verification_factory()
+
+    models.EmailVerification.objects.filter(
+        id__in=[verification.id for verification in expired],
+    ).update(time_created=timezone.now() - timedelta(minutes=5))
+
+    management.call_command('purge_verifications', batch_size=2)
+
+    assert list(models.EmailVerification.objects.all()) == [active]
+
+
+def test_purge_verifications_none_expired(email_verification_factory):
+    """
+    If no verifications have expired, nothing should be deleted.
+    """
+    email_verification_factory.create_batch(2)
+
+    management.call_command('purge_verifications')
+
+    assert models.EmailVerification.objects.count() == 2
@@ -0,0 +1,25 @@
+from io import StringIO
+
+from django.core import management
+
+from account import models, search
+
+
+def test_rebuild_search_index(email_factory, user_factory):
+    """
+    Rebuilding the index should index every user's name and addresses.
+    """
+    user = user_factory(name='Jonathan')
+    email_factory(address='alice@example.com', user=user)
+    models.SearchNgram.objects.all().delete()
+    stdout = StringIO()
+
+    management.call_command(
+        'rebuild_search_index',
+        batch_size=1,
+        stdout=stdout,
+    )
+
+    assert stdout.getvalue() == 'Indexed 1 user(s).\n'
+    assert [u for u, _ in search.search_users('jonathan')] == [user]
+    assert [u for u, _ in search.search_users('alice@example')] == [user]
@@ -0,0 +1,70 @@
+from unittest import mock
+
+from django.core import management
+from django.utils import timezone
+
+from account import models
+from account.mail import FakeEmailBackend
+
+
+def test_send_queued_emails(outgoing_email_factory):
+    """
+    Every pending email should be sent and removed from the outbox.
+    """
+    outgoing_email_factory.create_batch(3)
+
+    with mock.patch('account.models.email_utils.send_email') as mock_email:
+        management.call_command('send_queued_emails', batch_size=2)
+
+    assert mock_email.call_count == 3
+    assert not models.OutgoingEmail.objects.exists()
+
+
+def test_send_queued_emails_failure(outgoing_email_factory):
+    """
+    If an email fails to send, it should stay in the outbox and be
+    scheduled for a later retry.
+    """
+    email = outgoing_email_factory()
+
+    with mock.patch(
+        'account.models.email_utils.send_email',
+        side_effect=ConnectionError,
+    ):
+        management.call_command('send_queued_emails', retry_delay=60)
+
+    email.refresh_from_db()
+
+    assert email.attempts == 1
+    assert email.time_next_attempt > timezone.now()
+
+
+def test_send_queued_emails_max_attempts(outgoing_email_factory):
+    """
+    Emails that have exhausted their attempts should not be retried.
+    """
+    outgoing_email_factory(attempts=5)
+
+    with mock.patch('account.models.email_utils.send_email') as mock_email:
+        management.call_command('send_queued_emails', max_attempts=5)
+
+    assert mock_email.call_count == 0
+    assert models.OutgoingEmail.objects.count() == 1
+
+
+def test_send_queued_emails_reuses_connection(outgoing_email_factory):
+    """
+    All emails should be sent through a single backend connection.
+    """
+    outgoing_email_factory.create_batch(5)
+    backend = FakeEmailBackend(open_latency=0, send_latency=0)
+
+    with mock.patch(
+        'account.management.commands.send_queued_emails.mail.get_connection',
+        return_value=backend,
+    ):
+        management.call_command('send_queued_emails', batch_size=2, rate=0)
+
+    assert backend.connections_opened == 1
+    assert backend.messages_sent == 5
+    assert not models.OutgoingEmail.objects.exists()
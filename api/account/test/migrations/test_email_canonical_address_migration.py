@@ -0,0 +1,29 @@
+import importlib
+
+migration = importlib.import_module(
+    'account.migrations.0011_email_canonical_address',
+)
+
+
+def test_find_collisions():
+    """
+    Addresses that only differ by case should be grouped together.
+    """
+    addresses = [
+        'alice@example.com',
+        'Bob@example.com',
+        'bob@example.com',
+        'BOB@example.com',
+        'carol@example.com',
+    ]
+
+    assert migration.find_collisions(addresses) == [
+        ['BOB@example.com', 'Bob@example.com', 'bob@example.com'],
+    ]
+
+
+def test_find_collisions_none():
+    """
+    No groups should be returned if every address is unique.
+    """
+    assert migration.find_collisions(['a@example.com', 'b@example.com']) == []
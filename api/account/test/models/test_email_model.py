@@ -1,8 +1,11 @@
+import json
 from unittest import mock
 
+import pytest
 from django.conf import settings
+from django.db import IntegrityError
 
-from account import models
+from account import models, tokens
 
 
 def test_create(db, user_factory):
@@ -16,6 +19,25 @@ def test_create(db, user_factory):
     )
 
 
+def test_canonicalize_address():
+    """
+    The canonical form of an address should be lower-cased entirely.
+    """
+    address = 'MixedCaseLocalPart@funkyDomain.coM'
+
+    assert models.Email.canonicalize_address(address) == address.lower()
+
+
+def test_create_duplicate_different_case(email_factory):
+    """
+    Addresses that only differ by case should not both be stored.
+    """
+    email_factory(address='john@example.com')
+
+    with pytest.raises(IntegrityError):
+        email_factory(address='John@example.com')
+
+
 def test_normalize_address():
     """
     Normalizing the email address should lowercase the domain portion of
@@ -38,29 +60,83 @@ def test_save_normalize(email_factory):
     email.save()
 
     assert email.address == models.Email.normalize_address(address)
+    assert email.canonical_address == address.lower()
 
 
-def test_send_duplicate_notification(email_factory):
+def test_save_update_fields_address(email_factory):
     """
-    This method should send a notification to the owner of the email
-    that another user attempted to add the email to their account.
+    Saving only the address should also update its canonical form.
+    """
+    email = email_factory(address='old@example.com')
+    email.address = 'New@example.com'
+
+    email.save(update_fields=('address',))
+    email.refresh_from_db()
+
+    assert email.canonical_address == 'new@example.com'
+
+
+def test_queue_duplicate_notification(email_factory):
+    """
+    This method should add the duplicate registration notification to
+    the outbox without sending it.
     """
     email = email_factory()
 
     with mock.patch('account.models.email_utils.send_email') as mock_email:
-        email.send_duplicate_notification()
-
-    assert mock_email.call_count == 1
-    assert mock_email.call_args[1] == {
-        'context': {
-            'email': email.address,
-            'name': email.user.name,
-        },
-        'from_email': settings.DEFAULT_FROM_EMAIL,
-        'recipient_list': [email.address],
-        'subject': 'Duplicate Email Registration',
-        'template_name': 'account/emails/duplicate-email',
+        queued = email.queue_duplicate_notification()
+
+    assert mock_email.call_count == 0
+    assert json.loads(queued.context) == {
+        'email': email.address,
+        'name': email.user.name,
     }
+    assert queued.from_email == settings.DEFAULT_FROM_EMAIL
+    assert json.loads(queued.recipient_list) == [email.address]
+    assert queued.subject == 'Duplicate Email Registration'
+    assert queued.template_name == 'account/emails/duplicate-email'
+
+
+def test_queue_verification_signed(email_factory, settings):
+    """
+    If signed tokens are enabled, a verification email containing a
+    valid signed token should be queued without storing the token.
+    """
+    settings.EMAIL_VERIFICATION_TOKENS = 'signed'
+    email = email_factory()
+
+    queued = email.queue_verification()
+
+    token = json.loads(queued.context)['token']
+    assert tokens.check_token(email, token)
+    assert json.loads(queued.recipient_list) == [email.address]
+    assert not models.EmailVerification.objects.exists()
+
+
+def test_queue_verification_stored(email_factory, settings):
+    """
+    If stored tokens are enabled, a verification should be created and
+    its token emailed.
+    """
+    settings.EMAIL_VERIFICATION_TOKENS = 'stored'
+    email = email_factory()
+
+    queued = email.queue_verification()
+
+    verification = email.verifications.get()
+    assert json.loads(queued.context)['token'] == verification.token
+
+
+def test_verify(email_factory):
+    """
+    Verifying an email should mark it as verified.
+    """
+    email = email_factory(is_verified=False)
+
+    email.verify()
+    email.refresh_from_db()
+
+    assert email.is_verified
 
 
 def test_string_conversion(email_factory):
@@ -1,6 +1,11 @@
+import json
+from datetime import timedelta
 from unittest import mock
 
+import pytest
 from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
 
 from account import models
 
@@ -14,6 +19,32 @@ def test_create(email_factory):
     )
 
 
+def test_manager_active_expired(email_verification_factory, settings):
+    """
+    Verifications older than the configured lifetime should be expired
+    and all others active.
+    """
+    settings.EMAIL_VERIFICATION_TTL = 60
+    active = email_verification_factory()
+    expired = email_verification_factory()
+    models.EmailVerification.objects.filter(id=expired.id).update(
+        time_created=timezone.now() - timedelta(minutes=5),
+    )
+
+    assert list(models.EmailVerification.objects.active()) == [active]
+    assert list(models.EmailVerification.objects.expired()) == [expired]
+
+
+def test_create_duplicate_token(email_verification_factory):
+    """
+    Tokens must be unique so they can be looked up with an index.
+    """
+    verification = email_verification_factory()
+
+    with pytest.raises(IntegrityError):
+        email_verification_factory(token=verification.token)
+
+
 def test_repr(email_verification_factory):
     """
     Test the repr of the instance.
@@ -25,27 +56,25 @@ def test_repr(email_verification_factory):
     assert repr(verification) == expected
 
 
-def test_send_email(email_verification_factory):
+def test_queue_email(email_verification_factory):
     """
-    This method should send a verification email to the associated email
-    address.
+    This method should add the verification email to the outbox without
+    sending it.
     """
     verification = email_verification_factory()
 
     with mock.patch('account.models.email_utils.send_email') as mock_email:
-        verification.send_email()
-
-    assert mock_email.call_count == 1
-    assert mock_email.call_args[1] == {
-        'context': {
-            'name': verification.email.user.name,
-            'token': verification.token,
-        },
-        'from_email': settings.DEFAULT_FROM_EMAIL,
-        'recipient_list': [verification.email.address],
-        'subject': 'Please Verify Your Email',
-        'template_name': 'account/emails/verify-email',
+        queued = verification.queue_email()
+
+    assert mock_email.call_count == 0
+    assert json.loads(queued.context) == {
+        'name': verification.email.user.name,
+        'token': verification.token,
     }
+    assert queued.from_email == settings.DEFAULT_FROM_EMAIL
+    assert json.loads(queued.recipient_list) == [verification.email.address]
+    assert queued.subject == 'Please Verify Your Email'
+    assert queued.template_name == 'account/emails/verify-email'
 
 
 def test_string_conversion(email_verification_factory):
@@ -62,13 +91,48 @@ def test_string_conversion(email_verification_factory):
 def test_verify(email_factory, email_verification_factory):
     """
     The verify method should mark the associated email as verified and
-    delete the verification instance.
+    delete every verification for the email.
     """
     email = email_factory(is_verified=False)
     verification = email_verification_factory(email=email)
+    email_verification_factory(email=email)
+    other = email_verification_factory()
 
-    verification.verify()
+    assert verification.verify()
     email.refresh_from_db()
 
     assert email.is_verified
-    assert models.EmailVerification.objects.count() == 0
+    assert list(models.EmailVerification.objects.all()) == [other]
+
+
+def test_verify_already_verified(email_factory, email_verification_factory):
+    """
+    If the email was already verified, for example by a concurrent
+    request using the same token, verifying should report that this
+    call did not verify it.
+    """
+    email = email_factory(is_verified=False)
+    verification = email_verification_factory(email=email)
+    duplicate = models.EmailVerification.objects.get(id=verification.id)
+
+    assert verification.verify()
+    assert not duplicate.verify()
+
+
+def test_verify_num_queries(
+        django_assert_num_queries,
+        email_factory,
+        email_verification_factory):
+    """
+    Verifying should update the email and delete its verifications
+    without loading the email.
+    """
+    verification = email_verification_factory(
+        email=email_factory(is_verified=False),
+    )
+    verification = models.EmailVerification.objects.get(id=verification.id)
+
+    # The update and delete are wrapped in a savepoint by the test's
+    # transaction.
+    with django_assert_num_queries(4):
+        verification.verify()
@@ -0,0 +1,73 @@
+import uuid
+
+from account import models
+
+
+def test_generate_id_random(settings):
+    """
+    If time-ordered IDs are disabled, random UUIDs should be generated.
+    """
+    settings.TIME_ORDERED_IDS = False
+
+    assert models.generate_id().version == 4
+
+
+def test_generate_id_time_ordered(settings):
+    """
+    If time-ordered IDs are enabled, version 7 UUIDs should be
+    generated.
+    """
+    settings.TIME_ORDERED_IDS = True
+
+    assert models.generate_id().version == 7
+
+
+def test_uuid7():
+    """
+    The UUID should embed the timestamp and have the version 7 and RFC
+    variant bits set.
+    """
+    timestamp_ms = 1_700_000_000_000
+
+    value = models.uuid7(timestamp_ms)
+
+    assert value.int >> 80 == timestamp_ms
+    assert value.variant == uuid.RFC_4122
+    assert value.version == 7
+
+
+def test_uuid7_ordered():
+    """
+    UUIDs generated at later times should sort after earlier ones, both
+    as UUIDs and in their string form.
+    """
+    ids = [models.uuid7(timestamp_ms) for timestamp_ms in range(1000, 1100)]
+
+    assert sorted(ids) == ids
+    assert sorted(str(value) for value in ids) == [str(value) for value in ids]
+
+
+def test_uuid7_unique():
+    """
+    UUIDs generated in the same millisecond should still be unique.
+    """
+    ids = {models.uuid7(1000) for _ in range(1000)}
+
+    assert len(ids) == 1000
+
+
+def test_user_and_email_ids(email_factory, settings):
+    """
+    New users and emails should use time-ordered IDs alongside existing
+    random ones.
+    """
+    settings.TIME_ORDERED_IDS = False
+    old = email_factory()
+
+    settings.TIME_ORDERED_IDS = True
+    new = email_factory()
+
+    assert old.id.version == 4
+    assert new.id.version == 7
+    assert new.user.id.version == 7
+    assert models.Email.objects.count() == 2
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+
+from account import models
+
+
+def test_enqueue(db):
+    """
+    Enqueueing an email should store its arguments so it can be sent
+    later.
+    """
+    email = models.OutgoingEmail.objects.enqueue(
+        context={'name': 'John Smith'},
+        from_email='no-reply@example.com',
+        recipient_list=['test@example.com'],
+        subject='Subject',
+        template_name='account/emails/verify-email',
+    )
+
+    assert email.attempts == 0
+    assert email.time_next_attempt <= timezone.now()
+    assert models.OutgoingEmail.objects.get() == email
+
+
+def test_pending(outgoing_email_factory):
+    """
+    Only emails that are due and have not exhausted their attempts
+    should be pending.
+    """
+    due = outgoing_email_factory()
+    outgoing_email_factory(attempts=5)
+    outgoing_email_factory(
+        time_next_attempt=timezone.now() + timedelta(hours=1),
+    )
+
+    assert list(models.OutgoingEmail.objects.pending(max_attempts=5)) == [
+        due,
+    ]
+
+
+def test_record_failure(outgoing_email_factory):
+    """
+    Recording a failure should increment the number of attempts and
+    push back the next attempt.
+    """
+    email = outgoing_email_factory()
+    delay = timedelta(minutes=5)
+
+    email.record_failure(ValueError('boom'), retry_delay=delay)
+    email.refresh_from_db()
+
+    assert email.attempts == 1
+    assert email.last_error == repr(ValueError('boom'))
+    assert email.time_next_attempt > timezone.now() + delay / 2
+
+
+def test_send(outgoing_email_factory):
+    """
+    Sending the email should render it with the stored arguments.
+    """
+    email = outgoing_email_factory(
+        context='{"name": "John Smith"}',
+        recipient_list='["test@example.com"]',
+    )
+
+    with mock.patch('account.models.email_utils.send_email') as mock_email:
+        email.send()
+
+    assert mock_email.call_count == 1
+    assert mock_email.call_args[1] == {
+        'connection': None,
+        'context': {'name': 'John Smith'},
+        'from_email': email.from_email,
+        'recipient_list': ['test@example.com'],
+        'subject': email.subject,
+        'template_name': email.template_name,
+    }
+
+
+def test_string_conversion(outgoing_email_factory):
+    """
+    Converting an outgoing email to a string should return its subject
+    and recipients.
+    """
+    email = outgoing_email_factory(
+        recipient_list='["a@example.com", "b@example.com"]',
+        subject='Hello',
+    )
+
+    assert str(email) == 'Hello to a@example.com, b@example.com'
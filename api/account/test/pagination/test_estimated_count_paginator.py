@@ -0,0 +1,61 @@
+from unittest import mock
+
+from account import models, pagination
+
+
+def test_count_exact(user_factory):
+    """
+    If the table is small, the exact count should be used.
+    """
+    user_factory.create_batch(3)
+    paginator = pagination.EstimatedCountPaginator(
+        models.User.objects.all(),
+        per_page=2,
+    )
+
+    with mock.patch(
+            'account.pagination.estimate_count',
+            return_value=10,
+            autospec=True):
+        assert paginator.count == 3
+
+
+def test_count_estimated(db):
+    """
+    If the table is estimated to be large, the estimate should be used
+    without counting the rows.
+    """
+    paginator = pagination.EstimatedCountPaginator(
+        models.User.objects.all(),
+        per_page=2,
+    )
+
+    with mock.patch(
+            'account.pagination.estimate_count',
+            return_value=paginator.estimate_threshold,
+            autospec=True):
+        assert paginator.count == paginator.estimate_threshold
+        assert paginator.num_pages == paginator.estimate_threshold // 2
+
+
+def test_estimate_count_filtered(db):
+    """
+    Filtered querysets can't be estimated from table statistics.
+    """
+    queryset = models.User.objects.filter(is_staff=True)
+
+    assert pagination.estimate_count(queryset) is None
+
+
+def test_estimate_count_list():
+    """
+    Only querysets can be estimated.
+    """
+    assert pagination.estimate_count([1, 2, 3]) is None
+
+
+def test_estimate_count_unsupported_database(db):
+    """
+    Databases other than PostgreSQL don't provide an estimate.
+    """
+    assert pagination.estimate_count(models.User.objects.all()) is None
@@ -0,0 +1,22 @@
+from account import search
+
+
+def test_ngrams():
+    """
+    The trigrams of a string should be lower-cased.
+    """
+    assert search.ngrams('Bobby') == {'bob', 'obb', 'bby'}
+
+
+def test_ngrams_empty():
+    """
+    An empty string has no trigrams.
+    """
+    assert search.ngrams('   ') == set()
+
+
+def test_ngrams_short():
+    """
+    Strings shorter than a trigram should be returned whole.
+    """
+    assert search.ngrams('Al') == {'al'}
@@ -0,0 +1,15 @@
+from account import search
+
+
+def test_normalize_query_email():
+    """
+    Queries that look like addresses should match their stored form.
+    """
+    assert search.normalize_query(' Bob@EXAMPLE.com ') == 'bob@example.com'
+
+
+def test_normalize_query_whitespace():
+    """
+    Whitespace should be collapsed and the query case folded.
+    """
+    assert search.normalize_query('  John \t SMITH ') == 'john smith'
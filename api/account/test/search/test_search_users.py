@@ -0,0 +1,93 @@
+import pytest
+from django.db import connection
+
+from account import models, search
+
+
+def test_search_users_by_address(email_factory, user_factory):
+    """
+    Users should be found by any of their addresses.
+    """
+    user = user_factory(name='Alice')
+    email_factory(address='bob.smith@example.com', user=user)
+    user_factory(name='Carol')
+
+    results = search.search_users('bob.smith')
+
+    assert [result_user for result_user, _ in results] == [user]
+
+
+def test_search_users_by_name(user_factory):
+    """
+    Users should be found by their name, with the closest match first.
+    """
+    exact = user_factory(name='Jonathan')
+    partial = user_factory(name='Jon Snow')
+    user_factory(name='Alice')
+
+    results = search.search_users('jona')
+
+    assert results == [(exact, 1), (partial, 0.5)]
+
+
+def test_search_users_cached(django_assert_num_queries, user_factory):
+    """
+    Repeating an equivalent query should reuse the cached results,
+    leaving only the query that fetches the users.
+    """
+    user = user_factory(name='Jonathan')
+    search.search_users('Jonathan')
+
+    with django_assert_num_queries(1):
+        results = search.search_users('  JONATHAN ')
+
+    assert results == [(user, 1)]
+
+
+def test_search_users_deleted(user_factory):
+    """
+    Users deleted after the results were cached should be left out.
+    """
+    user = user_factory(name='Jonathan')
+    search.search_users('jonathan')
+
+    user.delete()
+
+    assert search.search_users('jonathan') == []
+
+
+def test_search_users_empty(db):
+    """
+    An empty query should not match anyone.
+    """
+    assert search.search_users('  ') == []
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'postgresql',
+    reason='Word similarity thresholds only apply to pg_trgm searches.',
+)
+def test_search_users_min_score(user_factory):
+    """
+    Users scoring just above the minimum score should be found, even
+    though they are below ``pg_trgm``'s default similarity threshold.
+    """
+    user = user_factory(name='Jon Snow')
+
+    results = search.search_users('jonathan')
+
+    assert [result_user for result_user, _ in results] == [user]
+    assert search.MIN_SCORE < results[0][1] < 0.6
+
+
+def test_search_users_renamed(user_factory):
+    """
+    Renaming a user should update the trigrams they are found by.
+    """
+    user = user_factory(name='Alice')
+    user.name = 'Jonathan'
+    user.save()
+
+    assert search.search_users('alice') == []
+    assert search.search_users('jonathan') == [(user, 1)]
+    assert not models.SearchNgram.objects.filter(ngram='ali').exists()
@@ -1,9 +1,11 @@
+from datetime import timedelta
 from unittest import mock
 
 import pytest
+from django.utils import timezone
 from rest_framework import serializers as drf_serializers
 
-from account import serializers
+from account import models, serializers, tokens
 
 
 PASSWORD = 'password'
@@ -34,6 +36,34 @@ def test_save_valid(email_verification_factory, user_factory):
     assert mock_verify.call_count == 1
 
 
+def test_save_verified_concurrently(
+        email_verification_factory,
+        user_factory):
+    """
+    If the email is verified by another request after the token was
+    validated, saving should fail rather than report success twice.
+    """
+    user = user_factory(password=PASSWORD)
+    verification = email_verification_factory(
+        email__is_verified=False,
+        email__user=user,
+    )
+
+    data = {
+        'password': PASSWORD,
+        'token': verification.token,
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+    assert serializer.is_valid()
+
+    models.EmailVerification.objects.verify_email(verification.email_id)
+
+    with pytest.raises(drf_serializers.ValidationError) as ex_info:
+        serializer.save()
+
+    assert ex_info.value.detail['token'][0].code == 'invalid_token'
+
+
 def test_validate_invalid_password(email_verification_factory, user_factory):
     """
     If the provided password does not match the user who created the
@@ -54,6 +84,50 @@ def test_validate_invalid_password(email_verification_factory, user_factory):
     assert ex_info.value.detail['password'][0].code == 'invalid_password'
 
 
+def test_validate_single_query(
+        django_assert_num_queries,
+        email_verification_factory,
+        user_factory):
+    """
+    Validating the serializer should fetch the verification, email, and
+    user in a single query.
+    """
+    user = user_factory(password=PASSWORD)
+    verification = email_verification_factory(email__user=user)
+
+    data = {
+        'password': PASSWORD,
+        'token': verification.token,
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+
+    with django_assert_num_queries(1):
+        assert serializer.is_valid()
+
+
+def test_validate_expired_token(email_verification_factory, settings):
+    """
+    If the provided token has expired, the serializer should fail to
+    validate.
+    """
+    settings.EMAIL_VERIFICATION_TTL = 60
+    verification = email_verification_factory()
+    models.EmailVerification.objects.filter(id=verification.id).update(
+        time_created=timezone.now() - timedelta(minutes=5),
+    )
+
+    data = {
+        'password': PASSWORD,
+        'token': verification.token,
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+
+    with pytest.raises(drf_serializers.ValidationError) as ex_info:
+        serializer.is_valid(raise_exception=True)
+
+    assert ex_info.value.detail['token'][0].code == 'invalid_token'
+
+
 def test_validate_invalid_token(db):
     """
     If the provided token does not exist, the serializer should fail to
@@ -69,3 +143,66 @@ def test_validate_invalid_token(db):
         serializer.is_valid(raise_exception=True)
 
     assert ex_info.value.detail['token'][0].code == 'invalid_token'
+
+
+def test_save_signed_token(email_factory, user_factory):
+    """
+    Given a valid signed token, saving the serializer should verify the
+    email without needing a stored verification.
+    """
+    user = user_factory(password=PASSWORD)
+    email = email_factory(is_verified=False, user=user)
+
+    data = {
+        'password': PASSWORD,
+        'token': tokens.make_token(email),
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+    assert serializer.is_valid()
+
+    serializer.save()
+    email.refresh_from_db()
+
+    assert email.is_verified
+
+
+def test_validate_signed_token_single_query(
+        django_assert_num_queries,
+        email_factory,
+        user_factory):
+    """
+    Validating a signed token should fetch the email and user in a
+    single query.
+    """
+    user = user_factory(password=PASSWORD)
+    email = email_factory(is_verified=False, user=user)
+
+    data = {
+        'password': PASSWORD,
+        'token': tokens.make_token(email),
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+
+    with django_assert_num_queries(1):
+        assert serializer.is_valid()
+
+
+def test_validate_signed_token_used(email_factory):
+    """
+    A signed token should not be accepted once the email it verifies
+    has been verified.
+    """
+    email = email_factory(is_verified=False)
+    token = tokens.make_token(email)
+    email.verify()
+
+    data = {
+        'password': PASSWORD,
+        'token': token,
+    }
+    serializer = serializers.EmailVerificationSerializer(data=data)
+
+    with pytest.raises(drf_serializers.ValidationError) as ex_info:
+        serializer.is_valid(raise_exception=True)
+
+    assert ex_info.value.detail['token'][0].code == 'invalid_token'
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -12,7 +13,7 @@ PASSWORD = 'C0rrectH0rseBatteryStaple'
 
 
 @mock.patch(
-    'account.serializers.models.Email.send_duplicate_notification',
+    'account.serializers.models.Email.queue_duplicate_notification',
     autospec=True,
 )
 def test_save_duplicate_email(_, email_factory):
@@ -35,12 +36,36 @@ def test_save_duplicate_email(_, email_factory):
     assert models.User.objects.get() == email.user
     # No new email address should have been created
     assert models.Email.objects.get() == email
-    # A duplicate notification should have been sent
-    assert email.send_duplicate_notification.call_count == 1
+    # A duplicate notification should have been queued
+    assert email.queue_duplicate_notification.call_count == 1
 
 
 @mock.patch(
-    'account.serializers.models.EmailVerification.send_email',
+    'account.serializers.models.Email.queue_duplicate_notification',
+    autospec=True,
+)
+def test_save_duplicate_email_different_case(_, email_factory):
+    """
+    Registering an existing address with a different case should be
+    treated as a duplicate registration.
+    """
+    email = email_factory(address='john@example.com', is_verified=True)
+    data = {
+        'email': 'John@example.com',
+        'name': NAME,
+        'password': PASSWORD,
+    }
+    serializer = serializers.RegistrationSerializer(data=data)
+
+    assert serializer.is_valid()
+    serializer.save()
+
+    assert models.Email.objects.get() == email
+    assert email.queue_duplicate_notification.call_count == 1
+
+
+@mock.patch(
+    'account.serializers.models.EmailVerification.queue_email',
     autospec=True,
 )
 def test_save_duplicate_email_unverified(_, email_factory):
@@ -63,13 +88,13 @@ def test_save_duplicate_email_unverified(_, email_factory):
     assert models.User.objects.get() == email.user
     # No new email should be created
     assert models.Email.objects.get() == email
-    # There should be a new email verification sent
+    # There should be a new email verification queued
     verification = email.verifications.get()
-    assert verification.send_email.call_count == 1
+    assert verification.queue_email.call_count == 1
 
 
 @mock.patch(
-    'account.serializers.models.EmailVerification.send_email',
+    'account.serializers.models.EmailVerification.queue_email',
     autospec=True,
 )
 def test_save_valid_data(_, db):
@@ -98,7 +123,7 @@ def test_save_valid_data(_, db):
     assert email.user == user
 
     verification = email.verifications.get()
-    assert verification.send_email.call_count == 1
+    assert verification.queue_email.call_count == 1
 
     assert serializer.data == {
         'email': EMAIL,
@@ -106,6 +131,29 @@ def test_save_valid_data(_, db):
     }
 
 
+def test_save_valid_data_queues_email(db):
+    """
+    Registering a new user should add the verification email to the
+    outbox rather than sending it during the request.
+    """
+    data = {
+        'email': EMAIL,
+        'name': NAME,
+        'password': PASSWORD,
+    }
+    serializer = serializers.RegistrationSerializer(data=data)
+
+    assert serializer.is_valid()
+    with mock.patch('account.models.email_utils.send_email') as mock_email:
+        serializer.save()
+
+    assert mock_email.call_count == 0
+
+    queued = models.OutgoingEmail.objects.get()
+    assert json.loads(queued.recipient_list) == [EMAIL]
+    assert queued.template_name == 'account/emails/verify-email'
+
+
 def test_validate_email():
     """
     Validating the email address should return its normalized version.
@@ -151,3 +199,57 @@ def test_validate_password_valid():
     assert result == PASSWORD
     assert mock_validate.call_count == 1
     assert mock_validate.call_args[0] == (PASSWORD,)
+
+
+def test_save_concurrent_registration(email_factory):
+    """
+    If another request registers the same address between our lookup
+    and insert, the registration should be treated as a duplicate
+    instead of failing.
+    """
+    email = email_factory(is_verified=True)
+    data = {
+        'email': email.address,
+        'name': NAME,
+        'password': PASSWORD,
+    }
+    serializer = serializers.RegistrationSerializer(data=data)
+    assert serializer.is_valid()
+
+    # Pretend the address did not exist when it was first looked up.
+    with mock.patch(
+        'account.serializers.models.Email.objects.select_related',
+        return_value=mock.Mock(**{
+            'filter.return_value.first.return_value': None,
+            'get.return_value': email,
+        }),
+    ):
+        serializer.save()
+
+    assert models.User.objects.get() == email.user
+    assert models.Email.objects.get() == email
+    assert json.loads(models.OutgoingEmail.objects.get().recipient_list) == [
+        email.address,
+    ]
+
+
+def test_save_valid_data_num_queries(django_assert_num_queries, db):
+    """
+    Registering a new user should use a fixed number of queries.
+
+    The queries are a lookup of the address, inserts for the user,
+    email, verification, and outgoing email, an update of the user's
+    primary email, and the savepoints wrapping the registration. The
+    test database also lacks ``pg_trgm``, so the user's name and address
+    are inserted into the search trigram table.
+    """
+    data = {
+        'email': EMAIL,
+        'name': NAME,
+        'password': PASSWORD,
+    }
+    serializer = serializers.RegistrationSerializer(data=data)
+    assert serializer.is_valid()
+
+    with django_assert_num_queries(12):
+        serializer.save()
@@ -0,0 +1,88 @@
+from unittest import mock
+
+import pytest
+from rest_framework.request import Request
+from rest_framework.parsers import JSONParser
+from rest_framework.test import APIRequestFactory
+
+from account import throttling
+
+
+@pytest.fixture(autouse=True)
+def rates(monkeypatch):
+    """
+    Fixture to configure the rates used by the throttle.
+    """
+    monkeypatch.setattr(
+        throttling.SlidingWindowRateThrottle,
+        'THROTTLE_RATES',
+        {'test-email': '1/min'},
+    )
+
+
+def make_request(data):
+    """
+    Build a DRF request with the given JSON body.
+    """
+    request = APIRequestFactory().post('/', data, format='json')
+
+    return Request(request, parsers=[JSONParser()])
+
+
+def test_allow_request_normalized_address():
+    """
+    Addresses that normalize to the same value should share a limit.
+    """
+    view = mock.Mock(throttle_scope='test')
+
+    first = make_request({'email': 'john@example.com'})
+    second = make_request({'email': 'john@EXAMPLE.com'})
+
+    assert throttling.EmailRateThrottle().allow_request(first, view)
+    assert not throttling.EmailRateThrottle().allow_request(second, view)
+
+
+def test_allow_request_different_case():
+    """
+    Addresses that only differ by case should share a limit.
+    """
+    view = mock.Mock(throttle_scope='test')
+
+    first = make_request({'email': 'john@example.com'})
+    second = make_request({'email': 'JOHN@example.com'})
+
+    assert throttling.EmailRateThrottle().allow_request(first, view)
+    assert not throttling.EmailRateThrottle().allow_request(second, view)
+
+
+def test_get_cache_key_no_email():
+    """
+    Requests without an email address should not be throttled.
+    """
+    view = mock.Mock(throttle_scope='test')
+    throttle = throttling.EmailRateThrottle()
+    throttle.scope = 'test-email'
+
+    assert throttle.get_cache_key(make_request({}), view) is None
+    assert throttle.get_cache_key(make_request([]), view) is None
+    assert throttle.get_cache_key(
+        make_request({'email': 'not-an-email'}),
+        view,
+    ) is None
+
+
+def test_get_cache_key_hashes_address():
+    """
+    The address should not appear in the cache key.
+    """
+    view = mock.Mock(throttle_scope='test')
+    throttle = throttling.EmailRateThrottle()
+    throttle.scope = 'test-email'
+
+    key = throttle.get_cache_key(
+        make_request({'email': 'john@example.com'}),
+        view,
+    )
+
+    assert key.startswith('throttle_test-email_')
+    assert 'john' not in key
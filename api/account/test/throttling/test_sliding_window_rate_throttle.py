@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from account import throttling
+
+
+@pytest.fixture
+def clock():
+    """
+    Fixture to control the time seen by throttles.
+    """
+    with mock.patch.object(
+        throttling.SlidingWindowRateThrottle,
+        'timer',
+        return_value=600.0,
+    ) as mock_timer:
+        yield mock_timer
+
+
+@pytest.fixture(autouse=True)
+def rates(monkeypatch):
+    """
+    Fixture to configure the rates used by the throttles under test.
+    """
+    rates = {'test': '3/min'}
+    monkeypatch.setattr(
+        throttling.SlidingWindowRateThrottle,
+        'THROTTLE_RATES',
+        rates,
+    )
+
+    return rates
+
+
+def make_request(throttle_class, ip='10.0.0.1'):
+    """
+    Make a request through a new throttle instance.
+
+    Returns:
+        A tuple containing the result of the throttle check and the
+        throttle instance.
+    """
+    request = APIRequestFactory().post('/', REMOTE_ADDR=ip)
+    view = mock.Mock(throttle_scope='test')
+    throttle = throttle_class()
+
+    return throttle.allow_request(request, view), throttle
+
+
+def test_allow_request_limit(clock):
+    """
+    Requests beyond the limit within a window should be throttled.
+    """
+    results = [
+        make_request(throttling.IPRateThrottle)[0] for _ in range(4)
+    ]
+
+    assert results == [True, True, True, False]
+
+
+def test_allow_request_other_client(clock):
+    """
+    Each client should be limited separately.
+    """
+    for _ in range(3):
+        make_request(throttling.IPRateThrottle)
+
+    assert make_request(throttling.IPRateThrottle, ip='10.0.0.2')[0]
+
+
+def test_allow_request_sliding(clock, rates):
+    """
+    Requests from the previous window should count towards the limit in
+    proportion to how much of the previous window is still within the
+    trailing window.
+    """
+    rates['test'] = '4/min'
+    for _ in range(4):
+        make_request(throttling.IPRateThrottle)
+
+    # An eighth of the way into the next window, 3.5 of the previous
+    # window's requests are still counted.
+    clock.return_value = 667.5
+    assert make_request(throttling.IPRateThrottle)[0]
+
+    allowed, throttle = make_request(throttling.IPRateThrottle)
+    assert not allowed
+    # The next request is allowed once only 2.5 old requests count.
+    assert throttle.wait() == pytest.approx(7.5)
+
+    clock.return_value = 682.5
+    assert make_request(throttling.IPRateThrottle)[0]
+
+
+def test_allow_request_no_scope():
+    """
+    Views without a throttle scope should not be throttled.
+    """
+    request = APIRequestFactory().post('/')
+    view = mock.Mock(spec=[])
+
+    assert throttling.IPRateThrottle().allow_request(request, view)
+
+
+def test_wait_current_window_full(clock):
+    """
+    If the current window is full, the client must wait for it to slide
+    far enough out of the trailing window.
+    """
+    for _ in range(3):
+        make_request(throttling.IPRateThrottle)
+
+    allowed, throttle = make_request(throttling.IPRateThrottle)
+
+    assert not allowed
+    # Once the window ends, its requests start sliding out of the
+    # trailing window, so the next request is allowed.
+    assert throttle.wait() == pytest.approx(60)
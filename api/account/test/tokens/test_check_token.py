@@ -0,0 +1,78 @@
+from unittest import mock
+
+from account import tokens
+
+
+def test_check_token(email_factory):
+    """
+    A token should be valid for the email it was created for.
+    """
+    email = email_factory()
+
+    assert tokens.check_token(email, tokens.make_token(email))
+
+
+def test_check_token_expired(email_factory, settings):
+    """
+    Tokens older than the verification TTL should be rejected.
+    """
+    settings.EMAIL_VERIFICATION_TTL = 60
+    email = email_factory()
+    token = tokens.make_token(email)
+
+    with mock.patch('account.tokens._now', return_value=tokens._now() + 61):
+        assert not tokens.check_token(email, token)
+
+
+def test_check_token_malformed(email_factory):
+    """
+    Tokens that aren't in the signed format should be rejected.
+    """
+    email = email_factory()
+
+    assert not tokens.check_token(email, 'not-a-token')
+    assert not tokens.check_token(email, 'abc')
+
+
+def test_check_token_other_email(email_factory):
+    """
+    A token should not be valid for a different email.
+    """
+    email = email_factory()
+    other = email_factory()
+
+    assert not tokens.check_token(other, tokens.make_token(email))
+
+
+def test_check_token_secret_key_changed(email_factory, settings):
+    """
+    Tokens should be rejected once the secret key changes.
+    """
+    email = email_factory()
+    token = tokens.make_token(email)
+
+    settings.SECRET_KEY = 'a-different-secret-key'
+
+    assert not tokens.check_token(email, token)
+
+
+def test_check_token_tampered(email_factory):
+    """
+    Changing the timestamp of a token should invalidate it.
+    """
+    email = email_factory()
+    email_id, _, signature = tokens.make_token(email).split('-')
+
+    assert not tokens.check_token(email, f'{email_id}-zzzzzz-{signature}')
+
+
+def test_check_token_verified(email_factory):
+    """
+    A token should stop working once the email has been verified.
+    """
+    email = email_factory(is_verified=False)
+    token = tokens.make_token(email)
+
+    email.is_verified = True
+
+    assert not tokens.check_token(email, token)
@@ -0,0 +1,20 @@
+from account import models, tokens
+
+
+def test_get_email_id(email_factory):
+    """
+    The ID of the email a signed token was created for should be
+    returned.
+    """
+    email = email_factory()
+
+    assert tokens.get_email_id(tokens.make_token(email)) == email.id
+
+
+def test_get_email_id_stored_token():
+    """
+    Tokens stored as email verifications are not signed, so no ID
+    should be returned.
+    """
+    assert tokens.get_email_id(models.random_token()) is None
+    assert tokens.get_email_id('made-up-token') is None
@@ -0,0 +1,28 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+
+def test_get_anonymous(api_client, db):
+    """
+    Anonymous users should not be able to list emails.
+    """
+    response = api_client.get(reverse('account:email-list'))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_own_emails(api_client, email_factory, user_factory):
+    """
+    Users should only see their own email addresses, oldest first.
+    """
+    user = user_factory()
+    emails = email_factory.create_batch(3, user=user)
+    email_factory()
+    api_client.force_authenticate(user=user)
+
+    response = api_client.get(reverse('account:email-list'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.data['results']] == [
+        str(email.id) for email in emails
+    ]
@@ -1,4 +1,69 @@
-from account import serializers, views
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from account import serializers, throttling, views
+
+
+def test_get_etag(api_client, user_factory):
+    """
+    Repeating a request with the returned ETag should return a 304
+    response if the page has not changed.
+    """
+    api_client.force_authenticate(user=user_factory(is_staff=True))
+    url = reverse('account:registration')
+
+    first = api_client.get(url)
+    second = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_get_non_staff(api_client, user_factory):
+    """
+    Users who are not staff should not be able to list users.
+    """
+    api_client.force_authenticate(user=user_factory())
+
+    response = api_client.get(reverse('account:registration'))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_pages(
+        api_client,
+        django_assert_num_queries,
+        email_factory,
+        user_factory):
+    """
+    Following the cursor should return every user exactly once, fetching
+    each page and the primary emails on it in a single query.
+    """
+    staff = user_factory(is_staff=True)
+    users = [staff] + user_factory.create_batch(4)
+    for user in users:
+        user.primary_email = email_factory(user=user)
+        user.save()
+
+    api_client.force_authenticate(user=staff)
+    url = reverse('account:registration') + '?page_size=2'
+    seen = []
+
+    while url:
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+        seen += response.data['results']
+        url = response.data['next']
+
+    assert [item['id'] for item in seen] == [str(user.id) for user in users]
+    assert [item['primary_email'] for item in seen] == [
+        user.primary_email.address for user in users
+    ]
 
 
 def test_get_serializer_class():
@@ -8,3 +73,39 @@ def test_get_serializer_class():
     view = views.RegistrationView()
 
     assert view.get_serializer_class() == serializers.RegistrationSerializer
+
+
+def test_get_serializer_class_list(rf):
+    """
+    Listing users should use the user serializer.
+    """
+    view = views.RegistrationView()
+    view.request = rf.get('/')
+
+    assert view.get_serializer_class() == serializers.UserSerializer
+
+
+def test_post_throttled(api_client, db, monkeypatch):
+    """
+    Once a client has exceeded the registration rate for an address,
+    further requests should be rejected with a ``Retry-After`` header.
+    """
+    monkeypatch.setattr(
+        throttling.SlidingWindowRateThrottle,
+        'THROTTLE_RATES',
+        {'registration': '10/min', 'registration-email': '1/min'},
+    )
+    data = {
+        'email': 'test@example.com',
+        'name': 'John Smith',
+        'password': 'MySuperSecretPassword',
+    }
+    url = reverse('account:registration')
+
+    with mock.patch('account.serializers.RegistrationSerializer.save'):
+        first = api_client.post(url, data)
+        second = api_client.post(url, data)
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(second['Retry-After']) > 0
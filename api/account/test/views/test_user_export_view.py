@@ -0,0 +1,63 @@
+import json
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+
+def test_get_csv(api_client, user_factory):
+    """
+    Staff users should receive a streamed CSV export by default.
+    """
+    staff = user_factory(is_staff=True)
+    user_factory.create_batch(2)
+    api_client.force_authenticate(user=staff)
+
+    response = api_client.get(reverse('account:user-export'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response['Content-Type'] == 'text/csv'
+
+    lines = b''.join(response.streaming_content).decode().splitlines()
+    assert len(lines) == 4
+
+
+def test_get_invalid_type(api_client, user_factory):
+    """
+    Requesting an unknown format should be rejected.
+    """
+    api_client.force_authenticate(user=user_factory(is_staff=True))
+
+    response = api_client.get(reverse('account:user-export'), {'type': 'xml'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_jsonl(api_client, user_factory):
+    """
+    Passing the ``jsonl`` type should stream one JSON object per user.
+    """
+    staff = user_factory(is_staff=True)
+    api_client.force_authenticate(user=staff)
+
+    response = api_client.get(
+        reverse('account:user-export'),
+        {'type': 'jsonl'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/x-ndjson'
+
+    lines = b''.join(response.streaming_content).decode().splitlines()
+    assert [json.loads(line)['id'] for line in lines] == [str(staff.id)]
+
+
+def test_get_non_staff(api_client, user_factory):
+    """
+    Users who are not staff should not be able to export users.
+    """
+    api_client.force_authenticate(user=user_factory())
+
+    response = api_client.get(reverse('account:user-export'))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
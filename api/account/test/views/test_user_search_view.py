@@ -0,0 +1,49 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from auth.serializers import EmailTokenObtainPairSerializer
+
+
+def test_get(api_client, email_factory, user_factory):
+    """
+    Authenticated users should be able to search for other users without
+    seeing their addresses.
+    """
+    user = user_factory(name='Jonathan')
+    email_factory(user=user)
+    api_client.force_authenticate(user=user_factory(name='Alice'))
+
+    response = api_client.get(reverse('account:user-search'), {'q': 'jon'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {'id': str(user.id), 'name': 'Jonathan', 'score': 1.0},
+    ]
+
+
+def test_get_anonymous(api_client, db):
+    """
+    Anonymous users should not be able to search for users.
+    """
+    response = api_client.get(reverse('account:user-search'), {'q': 'jon'})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_access_token(
+        api_client,
+        django_assert_num_queries,
+        user_factory):
+    """
+    Users authenticating with an access token should be authenticated
+    from the token's claims without looking them up.
+    """
+    user = user_factory()
+    token = EmailTokenObtainPairSerializer.get_token(user).access_token
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    with django_assert_num_queries(0):
+        response = api_client.get(reverse('account:user-search'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == []
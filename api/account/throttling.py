@@ -0,0 +1,199 @@
+"""
+Rate limiting for the account and authentication endpoints.
+
+The throttles use a sliding window counter: requests are counted in
+fixed windows, and the number of requests in the trailing window is
+estimated by weighting the previous window's count by how much of it
+still overlaps. This needs two counters per key no matter how many
+requests are made, unlike DRF's built in throttles which store the
+timestamp of every request.
+
+Counters are kept in Django's default cache, so a local memory cache
+limits each process individually while a shared cache limits all of
+them together.
+"""
+
+import hashlib
+
+from rest_framework import throttling
+
+from account import models
+
+
+class SlidingWindowRateThrottle(throttling.SimpleRateThrottle):
+    """
+    Base class for throttles that limit requests using a sliding window
+    counter.
+
+    Like DRF's ``ScopedRateThrottle``, the scope of the throttle is
+    taken from the ``throttle_scope`` attribute of the view being
+    accessed. Views without that attribute are not throttled.
+    """
+    scope_attr = 'throttle_scope'
+    scope_suffix = ''
+
+    def __init__(self):
+        # The rate can't be determined until we know which view is being
+        # accessed.
+        pass
+
+    def allow_request(self, request, view):
+        """
+        Determine if a request should be allowed.
+
+        Args:
+            request:
+                The request being made.
+            view:
+                The view being accessed.
+
+        Returns:
+            A boolean indicating if the request should be allowed.
+        """
+        view_scope = getattr(view, self.scope_attr, None)
+        if not view_scope:
+            return True
+
+        self.scope = f'{view_scope}{self.scope_suffix}'
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+
+        window = int(self.now // self.duration)
+        current_key = f'{self.key}_{window}'
+        previous_key = f'{self.key}_{window - 1}'
+
+        counts = self.cache.get_many([current_key, previous_key])
+        self.current_count = counts.get(current_key, 0)
+        self.previous_count = counts.get(previous_key, 0)
+        self.window_elapsed = self.now / self.duration - window
+
+        if self.estimated_count() >= self.num_requests:
+            return self.throttle_failure()
+
+        # Counters are kept for two windows so they can be used as the
+        # previous window's count once the current window ends.
+        if not self.cache.add(current_key, 1, timeout=self.duration * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                # The counter expired between the add and incr calls.
+                self.cache.set(current_key, 1, timeout=self.duration * 2)
+
+        return True
+
+    def estimated_count(self):
+        """
+        Estimate the number of requests made in the trailing window.
+
+        Returns:
+            The number of requests in the current window plus the
+            portion of the previous window's requests that still falls
+            within the trailing window.
+        """
+        overlap = 1 - self.window_elapsed
+
+        return self.previous_count * overlap + self.current_count
+
+    def wait(self):
+        """
+        Get the number of seconds until the next request will be
+        allowed.
+
+        Returns:
+            The number of seconds to wait, or ``None`` if requests are
+            never allowed.
+        """
+        if not self.num_requests:
+            return None
+
+        remaining = self.num_requests - self.current_count
+
+        if remaining > 0:
+            # The request will be allowed once enough of the previous
+            # window has slid out of the trailing window.
+            required_elapsed = 1 - remaining / self.previous_count
+            wait_windows = required_elapsed - self.window_elapsed
+        else:
+            # The current window is full, so we have to wait for it to
+            # become the previous window and slide out far enough.
+            required_elapsed = 1 - self.num_requests / self.current_count
+            wait_windows = 1 - self.window_elapsed + required_elapsed
+
+        return max(wait_windows, 0) * self.duration
+
+
+class EmailRateThrottle(SlidingWindowRateThrottle):
+    """
+    Throttle requests by the email address they are made for.
+
+    The scope of the throttle is the view's ``throttle_scope`` with an
+    ``-email`` suffix. Requests without an email address are not
+    throttled.
+    """
+    scope_suffix = '-email'
+
+    def get_cache_key(self, request, view):
+        """
+        Get the cache key for the email address the request is made for.
+
+        Args:
+            request:
+                The request being made.
+            view:
+                The view being accessed.
+
+        Returns:
+            A key derived from the canonical email address in the
+            request, or ``None`` if the request does not contain an
+            email address.
+        """
+        if not isinstance(request.data, dict):
+            return None
+
+        email = request.data.get('email')
+        if not isinstance(email, str) or email.count('@') != 1:
+            return None
+
+        # Addresses are hashed to keep the key a fixed length and to
+        # avoid storing them in the cache. The canonical form is used so
+        # that changing the case of an address doesn't evade the limit.
+        address = models.Email.canonicalize_address(email.strip())
+        ident = hashlib.sha256(address.encode()).hexdigest()
+
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': ident,
+        }
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    """
+    Throttle requests by the IP address of the client making them.
+    """
+
+    def get_cache_key(self, request, view):
+        """
+        Get the cache key for the client making the request.
+
+        Args:
+            request:
+                The request being made.
+            view:
+                The view being accessed.
+
+        Returns:
+            A key derived from the client's IP address.
+        """
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
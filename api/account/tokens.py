@@ -0,0 +1,116 @@
+"""
+Stateless email verification tokens.
+
+A signed token contains the ID of the email it verifies, the time it was
+created, and an HMAC of both keyed with the ``SECRET_KEY``. The HMAC also
+covers whether the email is verified, so a token stops working as soon
+as it has been used. Tokens are checked without storing them, which
+saves inserting an ``EmailVerification`` for each token sent and looking
+it up again when the token is used.
+
+Which kind of token is sent is controlled by the
+``EMAIL_VERIFICATION_TOKENS`` setting. Tokens of either kind are
+accepted regardless of the setting, so tokens already sent keep working
+when it changes.
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import base36_to_int, int_to_base36
+
+
+KEY_SALT = 'account.tokens.email-verification'
+
+
+def _hash(email, timestamp: int):
+    """
+    Get the HMAC of an email's current state and a timestamp.
+    """
+    value = f'{email.pk}{email.is_verified}{timestamp}'
+
+    return salted_hmac(KEY_SALT, value).hexdigest()[::2]
+
+
+def _now():
+    """
+    Get the current Unix timestamp.
+    """
+    return int(time.time())
+
+
+def check_token(email, token: str):
+    """
+    Check if a token is a valid, unexpired token for an email.
+
+    Args:
+        email:
+            The email the token should verify.
+        token:
+            The token to check.
+
+    Returns:
+        A boolean indicating if the token verifies the email.
+    """
+    try:
+        email_id, timestamp, _ = token.split('-')
+        timestamp = base36_to_int(timestamp)
+    except ValueError:
+        return False
+
+    if email_id != email.pk.hex:
+        return False
+
+    if _now() - timestamp > settings.EMAIL_VERIFICATION_TTL:
+        return False
+
+    return constant_time_compare(make_token(email, timestamp), token)
+
+
+def get_email_id(token: str):
+    """
+    Get the ID of the email a signed token was created for, without
+    checking the token.
+
+    Args:
+        token:
+            The token to get the email ID from.
+
+    Returns:
+        The ID of the email, or ``None`` if the token is not a signed
+        token.
+    """
+    email_id, separator, _ = token.partition('-')
+    if not separator:
+        return None
+
+    try:
+        return uuid.UUID(hex=email_id)
+    except ValueError:
+        return None
+
+
+def make_token(email, timestamp: int = None):
+    """
+    Create a signed token verifying an email.
+
+    Args:
+        email:
+            The email to create a token for.
+        timestamp:
+            The time the token was created at. Defaults to the current
+            time.
+
+    Returns:
+        The signed token.
+    """
+    if timestamp is None:
+        timestamp = _now()
+
+    return '-'.join((
+        email.pk.hex,
+        int_to_base36(timestamp),
+        _hash(email, timestamp),
+    ))
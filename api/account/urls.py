@@ -7,6 +7,12 @@ app_name = 'account'
 
 
 urlpatterns = [
+    path(
+        'emails/',
+        views.EmailListView.as_view(),
+        name='email-list',
+    ),
+
     path(
         'email-verification/',
         views.EmailVerificationView.as_view(),
@@ -18,4 +24,16 @@ urlpatterns = [
         views.RegistrationView.as_view(),
         name='registration',
     ),
+
+    path(
+        'users/export/',
+        views.UserExportView.as_view(),
+        name='user-export',
+    ),
+
+    path(
+        'users/search/',
+        views.UserSearchView.as_view(),
+        name='user-search',
+    ),
 ]
@@ -1,7 +1,35 @@
-from rest_framework import generics
+from django.http import StreamingHttpResponse
+from rest_framework import generics, permissions, views
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
-from account import serializers
+from account import (
+    export,
+    models,
+    pagination,
+    search,
+    serializers,
+    throttling,
+)
+from auth.authentication import StatelessJWTAuthentication
+
+
+class EmailListView(generics.ListAPIView):
+    """
+    get:
+    # List Email Addresses
+
+    List the email addresses owned by the requesting user, oldest first.
+    Results are paginated with a cursor; follow the `next` link to fetch
+    the following page.
+    """
+    pagination_class = pagination.TimeCreatedCursorPagination
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = serializers.EmailSerializer
+
+    def get_queryset(self):
+        return models.Email.objects.filter(user=self.request.user)
 
 
 class EmailVerificationView(generics.GenericAPIView):
@@ -13,6 +41,8 @@ class EmailVerificationView(generics.GenericAPIView):
     email and the token that was emailed to them.
     """
     serializer_class = serializers.EmailVerificationSerializer
+    throttle_classes = (throttling.IPRateThrottle,)
+    throttle_scope = 'email-verification'
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -22,8 +52,15 @@ class EmailVerificationView(generics.GenericAPIView):
         return Response(serializer.data)
 
 
-class RegistrationView(generics.CreateAPIView):
+class RegistrationView(generics.ListCreateAPIView):
     """
+    get:
+    # List Users
+
+    List every user, oldest first. Results are paginated with a cursor;
+    follow the `next` link to fetch the following page. Only staff users
+    may list users.
+
     post:
     # Register a New User
 
@@ -32,4 +69,98 @@ class RegistrationView(generics.CreateAPIView):
     to avoid leaking previously registered email addresses. The user can
     continue the registration flow using the email they receive.
     """
+    pagination_class = pagination.TimeCreatedCursorPagination
+    queryset = models.User.objects.select_related('primary_email')
     serializer_class = serializers.RegistrationSerializer
+    throttle_classes = (
+        throttling.IPRateThrottle,
+        throttling.EmailRateThrottle,
+    )
+    throttle_scope = 'registration'
+
+    def _is_list(self):
+        request = getattr(self, 'request', None)
+
+        return request is not None and request.method == 'GET'
+
+    def get_permissions(self):
+        if self._is_list():
+            return [permissions.IsAdminUser()]
+
+        return super().get_permissions()
+
+    def get_serializer_class(self):
+        if self._is_list():
+            return serializers.UserSerializer
+
+        return super().get_serializer_class()
+
+    def get_throttles(self):
+        # Listing users is restricted to staff, so it shouldn't use up
+        # the registration rate limit.
+        if self._is_list():
+            return []
+
+        return super().get_throttles()
+
+
+class UserExportView(views.APIView):
+    """
+    get:
+    # Export Users
+
+    Download every user and their email addresses. The `type` query
+    parameter selects the format, which may be `csv` (the default) or
+    `jsonl`. Only staff users may export users.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        file_format = request.query_params.get('type', 'csv')
+        if file_format not in export.EXPORTERS:
+            raise ValidationError({
+                'type': [
+                    f'Must be one of: {", ".join(sorted(export.EXPORTERS))}.'
+                ],
+            })
+
+        users = export.iter_users()
+        response = StreamingHttpResponse(
+            export.EXPORTERS[file_format](users),
+            content_type=export.CONTENT_TYPES[file_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="users.{file_format}"'
+        )
+
+        return response
+
+
+class UserSearchView(views.APIView):
+    """
+    get:
+    # Search for Users
+
+    Find users whose name or email address resembles the `q` query
+    parameter, best match first. At most 20 users are returned.
+    """
+    # Searching only requires the requester to be authenticated, so the
+    # claims in their token are trusted instead of looking them up.
+    authentication_classes = (
+        SessionAuthentication,
+        StatelessJWTAuthentication,
+    )
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        results = [
+            {'id': user.id, 'name': user.name, 'score': score}
+            for user, score in search.search_users(query)
+        ]
+        serializer = serializers.UserSearchResultSerializer(
+            results,
+            many=True,
+        )
+
+        return Response(serializer.data)
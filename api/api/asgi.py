@@ -0,0 +1,17 @@
+"""
+ASGI config for api project.
+
+It exposes the ASGI callable as a module-level variable named
+``application``. Requests are handled by the WSGI application in a
+thread pool whose size is set by the ``ASGI_THREADS`` setting.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+from api.handlers import ASGIHandler
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api.settings')
+
+application = ASGIHandler(get_wsgi_application())
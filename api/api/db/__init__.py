@@ -0,0 +1,4 @@
+"""
+Database backends extending Django's with connection health checks and,
+for PostgreSQL, an optional connection pool.
+"""
@@ -0,0 +1,42 @@
+from django.conf import settings
+
+from api.db import routers
+
+
+class ReplicaPinningMiddleware:
+    """
+    Middleware that pins a client's reads to the primary database for a
+    short time after it writes, so it isn't served stale data by a
+    replica.
+
+    The pin is stored in a cookie lasting ``DB_REPLICA_PIN_SECONDS``.
+    Requests from other clients are unaffected.
+    """
+    cookie_name = 'db_pinned'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DB_REPLICAS:
+            return self.get_response(request)
+
+        routers.reset()
+        if request.COOKIES.get(self.cookie_name):
+            routers.pin_to_primary()
+
+        try:
+            response = self.get_response(request)
+
+            if routers.has_written():
+                response.set_cookie(
+                    self.cookie_name,
+                    '1',
+                    httponly=True,
+                    max_age=settings.DB_REPLICA_PIN_SECONDS,
+                    samesite='Lax',
+                )
+        finally:
+            routers.reset()
+
+        return response
@@ -0,0 +1,55 @@
+class HealthCheckMixin:
+    """
+    Mixin for database wrappers that checks persistent connections are
+    still usable before reusing them.
+
+    With ``CONN_MAX_AGE`` set, a connection is kept open between
+    requests, during which time the database may have closed it. If the
+    ``CONN_HEALTH_CHECKS`` option is enabled, the first query of each
+    request is preceded by a check of the connection, and a new
+    connection is opened if it fails. Connections opened during the
+    request are not checked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.health_check_done = False
+
+    @property
+    def health_check_enabled(self):
+        return self.settings_dict.get('CONN_HEALTH_CHECKS', False)
+
+    def _cursor(self, name=None):
+        self.close_if_health_check_failed()
+
+        return super()._cursor(name)
+
+    def close_if_health_check_failed(self):
+        """
+        Close the current connection if it has not been checked since
+        the last request started and is no longer usable.
+        """
+        if (self.connection is None or
+                not self.health_check_enabled or
+                self.health_check_done):
+            return
+
+        if not self.is_usable():
+            self.close()
+
+        self.health_check_done = True
+
+    def close_if_unusable_or_obsolete(self):
+        # Django calls this at the start and end of each request, so the
+        # next query will check the connection again.
+        self.health_check_done = False
+
+        super().close_if_unusable_or_obsolete()
+
+    def connect(self):
+        super().connect()
+
+        # A new connection doesn't need to be checked. Pooled
+        # connections are checked by the pool as they are taken from it.
+        self.health_check_done = True
@@ -0,0 +1,193 @@
+"""
+PostgreSQL backend with connection health checks and an optional
+in-process connection pool.
+
+If the ``POOL_SIZE`` option of a database is non-zero, connections are
+taken from a pool shared by every thread in the process instead of being
+opened for each request. Closing a connection, which Django does at the
+end of each request when ``CONN_MAX_AGE`` is 0, returns it to the pool.
+Threads wait up to ``POOL_TIMEOUT`` seconds for a connection once every
+pooled connection is in use. Connections are checked as they are taken
+from the pool, and any the database has closed are replaced.
+"""
+
+import threading
+
+from django.db.backends.postgresql import base
+from psycopg2 import pool
+
+from api.db.mixins import HealthCheckMixin
+
+
+Database = base.Database
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """
+    Thread safe pool of connections that waits for a connection to be
+    returned when the pool is exhausted.
+    """
+
+    def __init__(self, size: int, timeout: float, conn_params: dict):
+        """
+        Args:
+            size:
+                The maximum number of connections to open.
+            timeout:
+                The number of seconds to wait for a connection when
+                every connection is in use.
+            conn_params:
+                The parameters to open connections with.
+        """
+        self.size = size
+        self.timeout = timeout
+
+        self._pool = pool.ThreadedConnectionPool(0, size, **conn_params)
+        self._slots = threading.BoundedSemaphore(size)
+
+    def get(self):
+        """
+        Get a usable connection from the pool, opening one if necessary.
+
+        Pooled connections that are no longer usable are closed and
+        replaced.
+
+        Returns:
+            An open connection.
+
+        Raises:
+            OperationalError:
+                If no connection was returned to the pool within the
+                timeout, or no usable connection could be found.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise Database.OperationalError(
+                f'No pooled connection became available within '
+                f'{self.timeout}s.'
+            )
+
+        try:
+            # Every idle connection may have been closed by the
+            # database, so once they have all been discarded the next
+            # connection is newly opened.
+            for _ in range(self.size + 1):
+                connection = self._pool.getconn()
+                if self.is_usable(connection):
+                    return connection
+
+                self._pool.putconn(connection, close=True)
+
+            raise Database.OperationalError(
+                'No usable pooled connection could be found.'
+            )
+        except Exception:
+            self._slots.release()
+
+            raise
+
+    @staticmethod
+    def is_usable(connection) -> bool:
+        """
+        Determine if a connection can still be used.
+
+        Args:
+            connection:
+                The connection to check.
+
+        Returns:
+            A boolean indicating if a trivial query succeeded on the
+            connection.
+        """
+        if connection.closed:
+            return False
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+
+            # Outside of autocommit mode the query opened a transaction,
+            # which would stop Django from configuring the connection.
+            connection.rollback()
+        except Database.Error:
+            return False
+
+        return True
+
+    def put(self, connection, close: bool = False):
+        """
+        Return a connection to the pool. Any open transaction is rolled
+        back.
+
+        Args:
+            connection:
+                The connection to return.
+            close:
+                A boolean indicating if the connection should be closed
+                rather than reused.
+        """
+        try:
+            self._pool.putconn(connection, close=close)
+        finally:
+            self._slots.release()
+
+
+class DatabaseWrapper(HealthCheckMixin, base.DatabaseWrapper):
+    """
+    PostgreSQL database wrapper supporting connection health checks and
+    pooling.
+    """
+
+    def _close(self):
+        connection_pool = _pools.get(self.alias)
+        if connection_pool is None or self.connection is None:
+            return super()._close()
+
+        # Connections that raised errors may be broken, so they aren't
+        # reused.
+        with self.wrap_database_errors:
+            connection_pool.put(self.connection, close=self.errors_occurred)
+
+    def _get_pool(self, conn_params):
+        """
+        Get the pool for this database, creating it if necessary.
+
+        Returns:
+            The process-wide connection pool for the database, or
+            ``None`` if pooling is disabled.
+        """
+        size = self.settings_dict.get('POOL_SIZE')
+        if not size:
+            return None
+
+        with _pools_lock:
+            if self.alias not in _pools:
+                _pools[self.alias] = ConnectionPool(
+                    conn_params=conn_params,
+                    size=size,
+                    timeout=self.settings_dict.get('POOL_TIMEOUT', 10),
+                )
+
+            return _pools[self.alias]
+
+    def get_new_connection(self, conn_params):
+        connection_pool = self._get_pool(conn_params)
+        if connection_pool is None:
+            return super().get_new_connection(conn_params)
+
+        connection = connection_pool.get()
+
+        # Mirror the isolation level handling of the parent method, which
+        # always opens a new connection.
+        options = self.settings_dict['OPTIONS']
+        try:
+            self.isolation_level = options['isolation_level']
+        except KeyError:
+            self.isolation_level = connection.isolation_level
+        else:
+            if self.isolation_level != connection.isolation_level:
+                connection.set_session(isolation_level=self.isolation_level)
+
+        return connection
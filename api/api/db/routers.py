@@ -0,0 +1,130 @@
+"""
+Routing of read queries to database replicas.
+
+Reads are spread across the aliases in the ``DB_REPLICAS`` setting, and
+everything else goes to the ``default`` database. Replicas lag behind
+the primary, so once a thread writes to the primary its reads are
+pinned there too. ``ReplicaPinningMiddleware`` clears the pin between
+requests and extends it to the client's following requests for a short
+time, so a client always sees its own writes.
+"""
+
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+_state = threading.local()
+
+
+def has_written():
+    """
+    Determine if the current thread has written to the primary database
+    since its state was last reset.
+
+    Returns:
+        A boolean indicating if a write has been made.
+    """
+    return getattr(_state, 'written', False)
+
+
+def is_pinned():
+    """
+    Determine if reads from the current thread must use the primary
+    database.
+
+    Returns:
+        A boolean indicating if the thread is pinned to the primary.
+    """
+    return getattr(_state, 'pinned', False)
+
+
+def pin_to_primary():
+    """
+    Send every following read from the current thread to the primary
+    database.
+    """
+    _state.pinned = True
+
+
+def reset():
+    """
+    Clear the current thread's pin and record of writes.
+    """
+    _state.pinned = False
+    _state.written = False
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads to replicas when it is safe to do so.
+
+    A replica that can't be connected to is skipped for
+    ``retry_interval`` seconds, during which reads fall back to the
+    other replicas or the primary.
+    """
+    retry_interval = 30
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._unavailable_until = {}
+
+    def _is_available(self, alias: str):
+        """
+        Determine if a replica can be read from, connecting to it if
+        necessary.
+        """
+        with self._lock:
+            if self._unavailable_until.get(alias, 0) > time.monotonic():
+                return False
+
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            with self._lock:
+                self._unavailable_until[alias] = (
+                    time.monotonic() + self.retry_interval
+                )
+
+            return False
+
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication.
+        return db not in settings.DB_REPLICAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DB_REPLICAS}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def db_for_read(self, model, **hints):
+        if not settings.DB_REPLICAS or is_pinned():
+            return DEFAULT_DB_ALIAS
+
+        # Reads made during a transaction on the primary must see the
+        # transaction's writes and the rows it has locked.
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        replicas = list(settings.DB_REPLICAS)
+        random.shuffle(replicas)
+
+        for alias in replicas:
+            if self._is_available(alias):
+                return alias
+
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _state.written = True
+        pin_to_primary()
+
+        return DEFAULT_DB_ALIAS
@@ -0,0 +1,9 @@
+from django.db.backends.sqlite3 import base
+
+from api.db.mixins import HealthCheckMixin
+
+
+class DatabaseWrapper(HealthCheckMixin, base.DatabaseWrapper):
+    """
+    SQLite database wrapper supporting connection health checks.
+    """
@@ -0,0 +1,233 @@
+"""
+An ASGI handler serving the WSGI application.
+
+Django 2.2 can't run views asynchronously, so ``ASGIHandler`` runs the
+WSGI application in a bounded thread pool instead. The request body is
+read and the response is sent by the event loop, so slow clients only
+occupy a thread while their request is actually being handled rather
+than for the whole time it takes to upload and download.
+"""
+
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+class ASGIHandler:
+    """
+    ASGI application that passes HTTP requests to a WSGI application.
+    """
+
+    def __init__(self, application, max_workers: int = None):
+        """
+        Args:
+            application:
+                The WSGI application to pass requests to.
+            max_workers:
+                The number of requests that may be handled at once.
+                Defaults to the ``ASGI_THREADS`` setting.
+        """
+        self.application = application
+        self.max_workers = max_workers
+
+        self._executor: ThreadPoolExecutor = None
+
+    async def __call__(self, scope, receive, send):
+        """
+        Handle an ASGI connection.
+
+        Args:
+            scope:
+                The details of the connection.
+            receive:
+                A coroutine function returning the next event from the
+                client.
+            send:
+                A coroutine function sending an event to the client.
+
+        Raises:
+            ValueError:
+                If the connection is not an HTTP request or lifespan
+                connection.
+        """
+        if scope['type'] == 'http':
+            await self.handle_http(scope, receive, send)
+        elif scope['type'] == 'lifespan':
+            await self.handle_lifespan(receive, send)
+        else:
+            raise ValueError(f"Unsupported connection type: {scope['type']}")
+
+    @property
+    def executor(self):
+        """
+        The thread pool that requests are handled in.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers or settings.ASGI_THREADS,
+                thread_name_prefix='asgi',
+            )
+
+        return self._executor
+
+    async def handle_http(self, scope, receive, send):
+        """
+        Handle an HTTP request by reading its body, calling the WSGI
+        application in the thread pool, and sending the response.
+        """
+        body = io.BytesIO()
+        more_body = True
+
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+            body.write(message.get('body', b''))
+            more_body = message.get('more_body', False)
+
+        body.seek(0)
+        environ = build_environ(scope, body)
+        # Called from a coroutine, this returns the running loop.
+        loop = asyncio.get_event_loop()
+
+        def send_from_thread(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        await loop.run_in_executor(
+            self.executor,
+            self.run_application,
+            environ,
+            send_from_thread,
+        )
+
+    async def handle_lifespan(self, receive, send):
+        """
+        Handle the server's startup and shutdown events. The thread pool
+        is shut down along with the server.
+        """
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                    self._executor = None
+
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def run_application(self, environ, send):
+        """
+        Call the WSGI application and send its response. This runs in
+        the thread pool.
+
+        Args:
+            environ:
+                The WSGI environment of the request.
+            send:
+                A function sending an ASGI event to the client from the
+                current thread.
+        """
+        response_start = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and response_start.get('sent'):
+                raise exc_info[1].with_traceback(exc_info[2])
+
+            response_start.update({
+                'headers': [
+                    (name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in headers
+                ],
+                'status': int(status.split(' ', 1)[0]),
+            })
+
+        def send_start():
+            if not response_start.get('sent'):
+                send({
+                    'headers': response_start['headers'],
+                    'status': response_start['status'],
+                    'type': 'http.response.start',
+                })
+                response_start['sent'] = True
+
+        response = self.application(environ, start_response)
+
+        try:
+            # Streaming responses are sent a chunk at a time rather than
+            # being buffered.
+            for chunk in response:
+                if chunk:
+                    send_start()
+                    send({
+                        'body': chunk,
+                        'more_body': True,
+                        'type': 'http.response.body',
+                    })
+        finally:
+            if hasattr(response, 'close'):
+                response.close()
+
+        send_start()
+        send({'body': b'', 'type': 'http.response.body'})
+
+
+def build_environ(scope, body):
+    """
+    Build the WSGI environment for an ASGI HTTP request.
+
+    Args:
+        scope:
+            The details of the request.
+        body:
+            A file-like object containing the request body.
+
+    Returns:
+        The WSGI environment of the request.
+    """
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode(
+            'latin-1'
+        ),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.errors': sys.stderr,
+        'wsgi.input': body,
+        'wsgi.multiprocess': True,
+        'wsgi.multithread': True,
+        'wsgi.run_once': False,
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.version': (1, 0),
+    }
+
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+
+        if name not in ('CONTENT_LENGTH', 'CONTENT_TYPE'):
+            name = f'HTTP_{name}'
+
+        # Repeated headers are combined as they would be by a WSGI
+        # server. HTTP/2 clients may split cookies across several
+        # headers, which must be joined as a single cookie list.
+        if name in environ:
+            separator = '; ' if name == 'HTTP_COOKIE' else ','
+            value = f'{environ[name]}{separator}{value}'
+
+        environ[name] = value
+
+    return environ
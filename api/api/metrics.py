@@ -0,0 +1,306 @@
+"""
+Per-request timing and query metrics.
+
+``MetricsMiddleware`` measures each request. While a request is being
+handled, code that does expensive work outside the database records the
+time it takes with ``timer``:
+
+    with metrics.timer('hash'):
+        ...
+
+Database queries are counted and timed automatically. Each request's
+measurements are reported in a ``Server-Timing`` header and a log line,
+and are aggregated into per-view histograms which ``metrics_view``
+exposes in the Prometheus text format.
+
+Measurements are aggregated per process, so each process serving
+requests must be scraped separately.
+"""
+
+import contextlib
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+
+
+# The timers recorded for each request, along with their descriptions.
+TIMERS = {
+    'db': 'Database',
+    'email': 'Email sending',
+    'hash': 'Password hashing',
+}
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+_local = threading.local()
+
+
+class RequestMetrics:
+    """
+    The measurements taken while handling a single request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.timings = dict.fromkeys(TIMERS, 0.0)
+
+
+def current():
+    """
+    Get the measurements for the request being handled by the current
+    thread.
+
+    Returns:
+        The request's measurements, or ``None`` if no request is being
+        measured.
+    """
+    return getattr(_local, 'metrics', None)
+
+
+@contextlib.contextmanager
+def measure_request():
+    """
+    Context manager collecting the measurements for a request handled by
+    the current thread.
+
+    Yields:
+        The request's measurements, which are filled in as the body of
+        the context manager runs.
+    """
+    _local.metrics = RequestMetrics()
+
+    try:
+        yield _local.metrics
+    finally:
+        _local.metrics = None
+
+
+def record(name: str, seconds: float):
+    """
+    Add time to one of the current request's timers. Nothing is
+    recorded outside of a request.
+
+    Args:
+        name:
+            The name of the timer, which must be a key of ``TIMERS``.
+        seconds:
+            The number of seconds to add.
+    """
+    metrics = current()
+    if metrics is not None:
+        metrics.timings[name] += seconds
+
+
+@contextlib.contextmanager
+def timer(name: str):
+    """
+    Context manager adding the time spent in its body to one of the
+    current request's timers.
+
+    Args:
+        name:
+            The name of the timer, which must be a key of ``TIMERS``.
+    """
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+class Histogram:
+    """
+    Thread safe histogram of observations, grouped by a set of labels.
+    """
+
+    def __init__(self, name: str, description: str, buckets):
+        """
+        Args:
+            name:
+                The name of the metric.
+            description:
+                A description of what is being measured.
+            buckets:
+                The upper bounds of the histogram's buckets, in
+                ascending order.
+        """
+        self.buckets = tuple(buckets)
+        self.description = description
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._series = defaultdict(
+            lambda: {'buckets': [0] * len(self.buckets), 'sum': 0, 'count': 0}
+        )
+
+    def clear(self):
+        """
+        Remove every observation.
+        """
+        with self._lock:
+            self._series.clear()
+
+    def observe(self, value: float, **labels):
+        """
+        Record an observation.
+
+        Args:
+            value:
+                The value observed.
+            **labels:
+                The labels identifying the series to add the
+                observation to.
+        """
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            series = self._series[key]
+            series['count'] += 1
+            series['sum'] += value
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['buckets'][index] += 1
+
+    def render(self):
+        """
+        Render the histogram in the Prometheus text format.
+
+        Returns:
+            The lines describing the histogram.
+        """
+        lines = [
+            f'# HELP {self.name} {self.description}',
+            f'# TYPE {self.name} histogram',
+        ]
+
+        with self._lock:
+            series = sorted(
+                (key, dict(value, buckets=list(value['buckets'])))
+                for key, value in self._series.items()
+            )
+
+        for key, values in series:
+            for bound, count in zip(self.buckets, values['buckets']):
+                labels = _format_labels(key + (('le', f'{bound:g}'),))
+                lines.append(f'{self.name}_bucket{labels} {count}')
+
+            labels = _format_labels(key + (('le', '+Inf'),))
+            lines.append(f'{self.name}_bucket{labels} {values["count"]}')
+
+            labels = _format_labels(key)
+            lines.append(f'{self.name}_sum{labels} {values["sum"]:g}')
+            lines.append(f'{self.name}_count{labels} {values["count"]}')
+
+        return lines
+
+
+def _format_labels(labels):
+    """
+    Format label pairs for the Prometheus text format.
+    """
+    if not labels:
+        return ''
+
+    pairs = ','.join(
+        '{}="{}"'.format(
+            name,
+            str(value)
+            .replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n'),
+        )
+        for name, value in labels
+    )
+
+    return f'{{{pairs}}}'
+
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'The time taken to handle each request.',
+    DURATION_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries',
+    'The number of database queries made by each request.',
+    QUERY_BUCKETS,
+)
+REQUEST_TIMINGS = {
+    name: Histogram(
+        f'http_request_{name}_seconds',
+        f'{description} time for each request.',
+        DURATION_BUCKETS,
+    )
+    for name, description in TIMERS.items()
+}
+
+HISTOGRAMS = (REQUEST_DURATION, REQUEST_QUERIES, *REQUEST_TIMINGS.values())
+
+_collectors = []
+
+
+def register_collector(collector):
+    """
+    Register a function providing additional metrics.
+
+    Args:
+        collector:
+            A function returning an iterable of tuples containing the
+            name, description, type, and value of each metric.
+    """
+    _collectors.append(collector)
+
+
+def render():
+    """
+    Render every metric in the Prometheus text format.
+
+    Returns:
+        The text describing the metrics.
+    """
+    lines = []
+
+    for histogram in HISTOGRAMS:
+        lines += histogram.render()
+
+    for collector in _collectors:
+        for name, description, metric_type, value in collector():
+            lines += [
+                f'# HELP {name} {description}',
+                f'# TYPE {name} {metric_type}',
+                f'{name} {value}',
+            ]
+
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    Serve the collected metrics in the Prometheus text format.
+
+    If the ``METRICS_TOKEN`` setting is set, requests must provide it as
+    a bearer token. Otherwise only staff users may view the metrics.
+    """
+    if settings.METRICS_TOKEN:
+        authorization = request.META.get('HTTP_AUTHORIZATION', '')
+        expected = f'Bearer {settings.METRICS_TOKEN}'
+
+        if not constant_time_compare(authorization, expected):
+            raise PermissionDenied
+    elif not request.user.is_staff:
+        raise PermissionDenied
+
+    return HttpResponse(
+        render(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
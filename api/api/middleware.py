@@ -0,0 +1,156 @@
+import contextlib
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from api import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """
+    Middleware measuring the time and database queries used by each
+    request.
+
+    The measurements are logged as JSON and aggregated into per-view
+    histograms. They are also added to the response in a
+    ``Server-Timing`` header for staff users, when debugging, or for
+    everyone if ``SERVER_TIMING_PUBLIC`` is enabled. The header isn't
+    sent to other clients since it reveals how their request was
+    handled, such as whether the address they registered with already
+    exists.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+
+        with contextlib.ExitStack() as stack:
+            request_metrics = stack.enter_context(metrics.measure_request())
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(self.time_query),
+                )
+
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - start
+        view = self.get_view_name(request)
+
+        metrics.REQUEST_DURATION.observe(duration, view=view)
+        metrics.REQUEST_QUERIES.observe(request_metrics.queries, view=view)
+        for name, seconds in request_metrics.timings.items():
+            metrics.REQUEST_TIMINGS[name].observe(seconds, view=view)
+
+        if self.should_send_server_timing(request):
+            response['Server-Timing'] = self.format_server_timing(
+                duration,
+                request_metrics,
+            )
+
+        logger.info(json.dumps({
+            'db_queries': request_metrics.queries,
+            'duration_ms': round(duration * 1000, 2),
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'view': view,
+            **{
+                f'{name}_ms': round(seconds * 1000, 2)
+                for name, seconds in request_metrics.timings.items()
+            },
+        }, sort_keys=True))
+
+        return response
+
+    @staticmethod
+    def format_server_timing(duration: float, request_metrics):
+        """
+        Build the value of the ``Server-Timing`` header for a request.
+
+        Args:
+            duration:
+                The number of seconds taken to handle the request.
+            request_metrics:
+                The measurements taken during the request.
+
+        Returns:
+            The header value, with durations in milliseconds.
+        """
+        entries = []
+        for name, seconds in request_metrics.timings.items():
+            description = metrics.TIMERS[name]
+            if name == 'db':
+                description += f' ({request_metrics.queries} queries)'
+
+            entries.append(
+                f'{name};dur={seconds * 1000:.2f};desc="{description}"'
+            )
+
+        entries.append(f'total;dur={duration * 1000:.2f}')
+
+        return ', '.join(entries)
+
+    @staticmethod
+    def get_view_name(request):
+        """
+        Get the name identifying the view that handled a request.
+
+        Args:
+            request:
+                The request that was handled.
+
+        Returns:
+            The URL name of the view, including its namespace, or the
+            view's import path for unnamed URLs. Requests that didn't
+            match a URL are grouped together.
+        """
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return '<unresolved>'
+
+        return match.view_name
+
+    @staticmethod
+    def should_send_server_timing(request) -> bool:
+        """
+        Determine if a response should include the ``Server-Timing``
+        header.
+
+        Args:
+            request:
+                The request that was handled.
+
+        Returns:
+            A boolean indicating if the header should be sent.
+        """
+        if settings.DEBUG or settings.SERVER_TIMING_PUBLIC:
+            return True
+
+        # Views using Django REST framework set the user they
+        # authenticated on the underlying request.
+        user = getattr(request, 'user', None)
+
+        return user is not None and user.is_staff
+
+    @staticmethod
+    def time_query(execute, sql, params, many, context):
+        """
+        Execute wrapper counting and timing each query.
+        """
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            request_metrics = metrics.current()
+            if request_metrics is not None:
+                request_metrics.queries += 1
+            metrics.record('db', time.perf_counter() - start)
@@ -50,9 +50,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'api.db.middleware.ReplicaPinningMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -79,6 +82,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'api.wsgi.application'
 
+# The number of requests the ASGI application handles at once. Requests
+# beyond this wait for a free thread without occupying one.
+ASGI_THREADS = int(os.environ.get('DJANGO_ASGI_THREADS', '10'))
+
 
 # Database
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
@@ -93,22 +100,104 @@ DB_PASSWORD = os.environ.get('DJANGO_DB_PASSWORD')
 DB_PORT = os.environ.get('DJANGO_DB_PORT', '5432')
 DB_USER = os.environ.get('DJANGO_DB_USER')
 
+# Connections are kept open for this many seconds so that requests don't
+# pay to set up a new connection. Setting this to 0 closes the
+# connection at the end of each request.
+DB_CONN_MAX_AGE = int(os.environ.get('DJANGO_DB_CONN_MAX_AGE', '60'))
+
+# Check that a persistent connection still works before the first query
+# of each request, replacing it if the database has closed it.
+DB_CONN_HEALTH_CHECKS = (
+    os.environ.get('DJANGO_DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true'
+)
+
+# The maximum number of connections each process keeps in its Postgres
+# connection pool, or 0 to disable pooling. Pooled connections are
+# returned to the pool at the end of each request, so persistent
+# connections are disabled when pooling is enabled.
+DB_POOL_SIZE = int(os.environ.get('DJANGO_DB_POOL_SIZE', '0'))
+DB_POOL_TIMEOUT = float(os.environ.get('DJANGO_DB_POOL_TIMEOUT', '10'))
+
+# Read replicas of the Postgres DB, given as a comma separated list of
+# hosts. Replicas use the same credentials as the primary unless they are
+# overridden. After a client writes to the primary, their reads are sent
+# to the primary for the given number of seconds so they see their own
+# writes despite replication lag.
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get('DJANGO_DB_REPLICA_HOSTS', '').split(',')
+    if host.strip()
+]
+DB_REPLICA_PASSWORD = os.environ.get('DJANGO_DB_REPLICA_PASSWORD')
+DB_REPLICA_PIN_SECONDS = int(
+    os.environ.get('DJANGO_DB_REPLICA_PIN_SECONDS', '10')
+)
+DB_REPLICA_PORT = os.environ.get('DJANGO_DB_REPLICA_PORT')
+DB_REPLICA_USER = os.environ.get('DJANGO_DB_REPLICA_USER')
+
 if all((DB_HOST, DB_USER, DB_PASSWORD, DB_PORT)):
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql_psycopg2',
+            'ENGINE': 'api.db.postgresql',
             'NAME': DB_NAME,
             'USER': DB_USER,
             'PASSWORD': DB_PASSWORD,
             'HOST': DB_HOST,
             'PORT': DB_PORT,
+            'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+            'CONN_MAX_AGE': 0 if DB_POOL_SIZE else DB_CONN_MAX_AGE,
+            'POOL_SIZE': DB_POOL_SIZE,
+            'POOL_TIMEOUT': DB_POOL_TIMEOUT,
         }
     }
+
+    for index, host in enumerate(DB_REPLICA_HOSTS, start=1):
+        DATABASES[f'replica_{index}'] = {
+            **DATABASES['default'],
+            'HOST': host,
+            'PASSWORD': DB_REPLICA_PASSWORD or DB_PASSWORD,
+            'PORT': DB_REPLICA_PORT or DB_PORT,
+            'USER': DB_REPLICA_USER or DB_USER,
+            # Tests should read the data they write to the primary.
+            'TEST': {'MIRROR': 'default'},
+        }
 else:
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
+            'ENGINE': 'api.db.sqlite3',
             'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+            'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        }
+    }
+
+DATABASE_ROUTERS = ['api.db.routers.ReplicaRouter']
+
+# The aliases of the databases that reads may be sent to.
+DB_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
+
+# Caching
+# https://docs.djangoproject.com/en/2.1/topics/cache/
+
+# By default each process uses its own local memory cache. Providing a
+# cache backend and location allows the cache, and anything relying on
+# it such as rate limiting, to be shared between processes.
+
+CACHE_BACKEND = os.environ.get('DJANGO_CACHE_BACKEND')
+CACHE_LOCATION = os.environ.get('DJANGO_CACHE_LOCATION')
+
+if CACHE_BACKEND:
+    CACHES = {
+        'default': {
+            'BACKEND': CACHE_BACKEND,
+            'LOCATION': CACHE_LOCATION,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         }
     }
 
@@ -131,6 +220,36 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/2.1/topics/auth/passwords/
+
+# The first hasher is used for new passwords. Passwords hashed with the
+# other are upgraded the next time the user logs in. Using argon2
+# requires the 'argon2-cffi' package.
+PASSWORD_HASHER = os.environ.get('DJANGO_PASSWORD_HASHER', 'pbkdf2').lower()
+if PASSWORD_HASHER == 'argon2':
+    PASSWORD_HASHERS = [
+        'account.hashers.Argon2PasswordHasher',
+        'account.hashers.PBKDF2PasswordHasher',
+    ]
+else:
+    PASSWORD_HASHERS = [
+        'account.hashers.PBKDF2PasswordHasher',
+        'account.hashers.Argon2PasswordHasher',
+    ]
+
+ARGON2_MEMORY_COST = int(os.environ.get('DJANGO_ARGON2_MEMORY_COST', '512'))
+ARGON2_PARALLELISM = int(os.environ.get('DJANGO_ARGON2_PARALLELISM', '2'))
+ARGON2_TIME_COST = int(os.environ.get('DJANGO_ARGON2_TIME_COST', '2'))
+
+PBKDF2_ITERATIONS = int(os.environ.get('DJANGO_PBKDF2_ITERATIONS', '150000'))
+
+# The number of threads used to hash passwords. If zero, passwords are
+# hashed in the thread handling the request.
+PASSWORD_HASHING_THREADS = int(
+    os.environ.get('DJANGO_PASSWORD_HASHING_THREADS', '0')
+)
+
 AUTH_USER_MODEL = 'account.User'
 
 # Use email authentication
@@ -174,12 +293,124 @@ DJANGO_SES_ENABLED = os.environ.get('DJANGO_SES_ENABLED', 'false').lower()
 if DJANGO_SES_ENABLED == 'true':
     EMAIL_BACKEND = 'django_ses.SESBackend'
 
+# The maximum number of emails the outbox worker sends per second. This
+# should match the sending rate of the SES account. A value of zero
+# disables throttling.
+EMAIL_MAX_SEND_RATE = float(os.environ.get('DJANGO_EMAIL_MAX_SEND_RATE', '14'))
+
+
+# Account Settings
+
+# The kind of token sent to verify email addresses. Either "signed" for
+# stateless tokens or "stored" for tokens saved as EmailVerification
+# instances. Both kinds are accepted regardless of this setting.
+EMAIL_VERIFICATION_TOKENS = os.environ.get(
+    'DJANGO_EMAIL_VERIFICATION_TOKENS',
+    'stored',
+)
+
+# The number of seconds an email verification token remains valid for.
+EMAIL_VERIFICATION_TTL = int(
+    os.environ.get('DJANGO_EMAIL_VERIFICATION_TTL', str(60 * 60 * 24))
+)
+
+# The number of seconds a user's permissions are cached for. Cached
+# permissions are invalidated when groups or permissions change, so this
+# only limits how long unused entries are kept.
+PERMISSION_CACHE_TTL = int(
+    os.environ.get('DJANGO_PERMISSION_CACHE_TTL', '300')
+)
+
+# The number of seconds the results of a user search are cached for.
+SEARCH_CACHE_TTL = int(os.environ.get('DJANGO_SEARCH_CACHE_TTL', '60'))
+
+# Generate time-ordered rather than random UUIDs for new users and
+# emails, which keeps inserts into their primary key indexes local.
+TIME_ORDERED_IDS = (
+    os.environ.get('DJANGO_TIME_ORDERED_IDS', 'true').lower() == 'true'
+)
+
+
+# The number of users to keep in each process's user cache, and the
+# number of seconds they are cached for. Entries are removed when a user
+# is modified, but only from the process that modified them and from the
+# shared cache, so the TTL should be kept short.
+USER_CACHE_SIZE = int(os.environ.get('DJANGO_USER_CACHE_SIZE', '1024'))
+USER_CACHE_TTL = int(os.environ.get('DJANGO_USER_CACHE_TTL', '30'))
+
+# Setting this to true also caches users in the default cache so that
+# processes can share lookups.
+USER_CACHE_SHARED = (
+    os.environ.get('DJANGO_USER_CACHE_SHARED', 'false').lower() == 'true'
+)
+
+
+# Metrics
+
+# Each request is logged as a line of JSON containing its timings.
+# Setting this to WARNING or higher disables those lines.
+REQUEST_LOG_LEVEL = os.environ.get('DJANGO_REQUEST_LOG_LEVEL', 'INFO')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api.middleware': {
+            'handlers': ['console'],
+            'level': REQUEST_LOG_LEVEL,
+            'propagate': False,
+        },
+    },
+}
+
+# A token that must be provided as a bearer token to scrape the metrics
+# endpoint. If not set, only staff users can view the metrics.
+METRICS_TOKEN = os.environ.get('DJANGO_METRICS_TOKEN')
+
+# Whether every response should include a Server-Timing header. The
+# header reveals how a request was handled, such as whether a password
+# was hashed, so by default it is only sent to staff users and when
+# debugging.
+SERVER_TIMING_PUBLIC = (
+    os.environ.get('DJANGO_SERVER_TIMING_PUBLIC', 'false').lower() == 'true'
+)
+
 
 # Django Rest Framework
 
+# The number of proxies in front of the application. This is used to
+# determine the client's IP address for rate limiting.
+num_proxies = os.environ.get('DJANGO_NUM_PROXIES')
+if num_proxies:
+    NUM_PROXIES = int(num_proxies)
+else:
+    NUM_PROXIES = None
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        'account.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'email-verification': os.environ.get(
+            'DJANGO_THROTTLE_EMAIL_VERIFICATION',
+            '20/hour',
+        ),
+        'registration': os.environ.get(
+            'DJANGO_THROTTLE_REGISTRATION',
+            '20/hour',
+        ),
+        'registration-email': os.environ.get(
+            'DJANGO_THROTTLE_REGISTRATION_EMAIL',
+            '5/hour',
+        ),
+        'token': os.environ.get('DJANGO_THROTTLE_TOKEN', '60/min'),
+        'token-email': os.environ.get('DJANGO_THROTTLE_TOKEN_EMAIL', '10/min'),
+    },
+    'NUM_PROXIES': NUM_PROXIES,
 }
@@ -0,0 +1,70 @@
+import pytest
+from django.db import connections
+
+from api.db import routers
+
+
+@pytest.fixture(autouse=True)
+def reset_routing():
+    """
+    Clear any pin left on the current thread by a previous test.
+    """
+    routers.reset()
+    yield
+    routers.reset()
+
+
+@pytest.fixture
+def replica(django_db_blocker, settings, tmp_path):
+    """
+    Fixture to configure a SQLite database as a replica.
+
+    Returns:
+        The alias of the replica.
+    """
+    yield from _add_database(
+        django_db_blocker,
+        settings,
+        'replica',
+        str(tmp_path / 'replica'),
+    )
+
+
+@pytest.fixture
+def unavailable_replica(django_db_blocker, settings, tmp_path):
+    """
+    Fixture to configure a replica that can't be connected to.
+
+    Returns:
+        The alias of the replica.
+    """
+    path = str(tmp_path / 'missing' / 'replica')
+
+    yield from _add_database(
+        django_db_blocker,
+        settings,
+        'unavailable_replica',
+        path,
+    )
+
+
+def _add_database(django_db_blocker, settings, alias, name):
+    """
+    Add a SQLite database as a replica for the duration of a test.
+
+    Connecting to replicas is allowed without wrapping the test in a
+    transaction, since an open transaction on the primary would send
+    every read to the primary.
+    """
+    connections.databases[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+    }
+    settings.DB_REPLICAS = [*settings.DB_REPLICAS, alias]
+
+    with django_db_blocker.unblock():
+        yield alias
+
+    connections[alias].close()
+    del connections[alias]
+    del connections.databases[alias]
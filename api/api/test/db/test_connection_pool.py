@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pytest
+
+
+psycopg2 = pytest.importorskip('psycopg2')
+
+from api.db.postgresql.base import ConnectionPool  # noqa: E402
+
+
+def make_connection(usable: bool = True):
+    """
+    Make a stand in for a pooled connection.
+
+    Args:
+        usable:
+            A boolean indicating if queries on the connection succeed.
+    """
+    connection = mock.MagicMock(closed=0)
+    if not usable:
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = psycopg2.OperationalError
+
+    return connection
+
+
+@pytest.fixture
+def connection_pool():
+    """
+    Fixture to get a pool of one connection whose underlying pool is
+    replaced by a mock.
+    """
+    connection_pool = ConnectionPool(conn_params={}, size=1, timeout=0)
+    connection_pool._pool = mock.Mock()
+
+    return connection_pool
+
+
+def test_get(connection_pool):
+    """
+    Usable connections should be returned from the pool.
+    """
+    connection = make_connection()
+    connection_pool._pool.getconn.return_value = connection
+
+    assert connection_pool.get() is connection
+    assert not connection_pool._pool.putconn.called
+
+
+def test_get_broken(connection_pool):
+    """
+    Broken connections should be closed and replaced.
+    """
+    broken = make_connection(usable=False)
+    connection = make_connection()
+    connection_pool._pool.getconn.side_effect = [broken, connection]
+
+    assert connection_pool.get() is connection
+    connection_pool._pool.putconn.assert_called_once_with(broken, close=True)
+
+
+def test_get_closed(connection_pool):
+    """
+    Connections closed by the database should be replaced without being
+    queried.
+    """
+    closed = make_connection()
+    closed.closed = 2
+    connection = make_connection()
+    connection_pool._pool.getconn.side_effect = [closed, connection]
+
+    assert connection_pool.get() is connection
+    assert not closed.cursor.called
+    connection_pool._pool.putconn.assert_called_once_with(closed, close=True)
+
+
+def test_get_no_usable_connection(connection_pool):
+    """
+    If no usable connection can be found, an error should be raised and
+    the connection's slot returned to the pool.
+    """
+    connection_pool._pool.getconn.side_effect = lambda: make_connection(
+        usable=False,
+    )
+
+    with pytest.raises(psycopg2.OperationalError):
+        connection_pool.get()
+
+    assert connection_pool._slots.acquire(timeout=0)
@@ -0,0 +1,94 @@
+from unittest import mock
+
+import pytest
+
+from api.db.mixins import HealthCheckMixin
+
+
+class StubDatabaseWrapper:
+    """
+    Minimal stand in for Django's database wrapper.
+    """
+
+    def __init__(self, settings_dict):
+        self.settings_dict = settings_dict
+        self.connection = None
+        self.is_usable = mock.Mock(return_value=True)
+
+    def _cursor(self, name=None):
+        if self.connection is None:
+            self.connect()
+
+        return mock.Mock()
+
+    def close(self):
+        self.connection = None
+
+    def close_if_unusable_or_obsolete(self):
+        pass
+
+    def connect(self):
+        self.connection = mock.Mock()
+
+
+class DatabaseWrapper(HealthCheckMixin, StubDatabaseWrapper):
+    pass
+
+
+@pytest.fixture
+def wrapper():
+    """
+    Fixture to get a wrapper with health checks enabled and an open
+    connection left over from a previous request.
+    """
+    wrapper = DatabaseWrapper({'CONN_HEALTH_CHECKS': True})
+    wrapper._cursor()
+    wrapper.close_if_unusable_or_obsolete()
+
+    return wrapper
+
+
+def test_cursor_checks_once_per_request(wrapper):
+    """
+    Only the first query of a request should check the connection.
+    """
+    wrapper._cursor()
+    wrapper._cursor()
+
+    assert wrapper.is_usable.call_count == 1
+
+
+def test_cursor_disabled(wrapper):
+    """
+    If health checks are disabled, connections should not be checked.
+    """
+    wrapper.settings_dict['CONN_HEALTH_CHECKS'] = False
+
+    wrapper._cursor()
+
+    assert wrapper.is_usable.call_count == 0
+
+
+def test_cursor_new_connection():
+    """
+    A connection opened during the request should not be checked.
+    """
+    wrapper = DatabaseWrapper({'CONN_HEALTH_CHECKS': True})
+
+    wrapper._cursor()
+    wrapper._cursor()
+
+    assert wrapper.is_usable.call_count == 0
+
+
+def test_cursor_unusable(wrapper):
+    """
+    If the connection is no longer usable, it should be replaced.
+    """
+    stale = wrapper.connection
+    wrapper.is_usable.return_value = False
+
+    wrapper._cursor()
+
+    assert wrapper.connection is not None
+    assert wrapper.connection is not stale
@@ -0,0 +1,70 @@
+from django.http import HttpResponse
+
+from api.db import routers
+from api.db.middleware import ReplicaPinningMiddleware
+
+
+def test_call_no_replicas(rf, settings):
+    """
+    Without replicas, no cookie should be set even if the request
+    writes.
+    """
+    settings.DB_REPLICAS = []
+
+    def view(request):
+        routers.ReplicaRouter().db_for_write(None)
+
+        return HttpResponse()
+
+    response = ReplicaPinningMiddleware(view)(rf.post('/'))
+
+    assert ReplicaPinningMiddleware.cookie_name not in response.cookies
+
+
+def test_call_pinned_by_cookie(replica, rf):
+    """
+    Requests carrying the cookie should read from the primary, and the
+    pin should be cleared afterwards.
+    """
+    pinned = []
+
+    def view(request):
+        pinned.append(routers.is_pinned())
+
+        return HttpResponse()
+
+    request = rf.get('/')
+    request.COOKIES[ReplicaPinningMiddleware.cookie_name] = '1'
+
+    ReplicaPinningMiddleware(view)(request)
+
+    assert pinned == [True]
+    assert not routers.is_pinned()
+
+
+def test_call_read_only(replica, rf):
+    """
+    Requests that don't write should not pin the client.
+    """
+    response = ReplicaPinningMiddleware(lambda request: HttpResponse())(
+        rf.get('/'),
+    )
+
+    assert ReplicaPinningMiddleware.cookie_name not in response.cookies
+
+
+def test_call_write(replica, rf, settings):
+    """
+    Requests that write should pin the client to the primary for the
+    configured time.
+    """
+    def view(request):
+        routers.ReplicaRouter().db_for_write(None)
+
+        return HttpResponse()
+
+    response = ReplicaPinningMiddleware(view)(rf.post('/'))
+
+    cookie = response.cookies[ReplicaPinningMiddleware.cookie_name]
+    assert cookie['max-age'] == settings.DB_REPLICA_PIN_SECONDS
+    assert not routers.has_written()
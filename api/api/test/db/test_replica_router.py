@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.db import transaction
+
+from account import models
+from api.db import routers
+
+
+def test_allow_migrate(replica):
+    """
+    Migrations should only be applied to the primary.
+    """
+    router = routers.ReplicaRouter()
+
+    assert router.allow_migrate('default', 'account')
+    assert not router.allow_migrate(replica, 'account')
+
+
+def test_db_for_read_no_replicas(settings):
+    """
+    Without replicas, reads should use the primary.
+    """
+    settings.DB_REPLICAS = []
+
+    assert routers.ReplicaRouter().db_for_read(models.User) == 'default'
+
+
+def test_db_for_read_pinned(replica):
+    """
+    After a write, reads from the same thread should use the primary.
+    """
+    router = routers.ReplicaRouter()
+
+    assert router.db_for_read(models.User) == replica
+    assert router.db_for_write(models.User) == 'default'
+    assert router.db_for_read(models.User) == 'default'
+    assert routers.has_written()
+
+
+def test_db_for_read_replica(replica):
+    """
+    Reads should be sent to an available replica.
+    """
+    assert routers.ReplicaRouter().db_for_read(models.User) == replica
+
+
+def test_db_for_read_transaction(replica, transactional_db):
+    """
+    Reads inside a transaction on the primary should use the primary.
+    """
+    router = routers.ReplicaRouter()
+
+    with transaction.atomic():
+        assert router.db_for_read(models.User) == 'default'
+
+
+def test_db_for_read_unavailable(unavailable_replica):
+    """
+    If a replica can't be connected to, reads should fall back to the
+    primary and the replica should not be retried until the retry
+    interval has passed.
+    """
+    router = routers.ReplicaRouter()
+
+    with mock.patch('api.db.routers.time.monotonic', return_value=100):
+        assert router.db_for_read(models.User) == 'default'
+
+    with mock.patch(
+            'django.db.backends.base.base.BaseDatabaseWrapper.connect',
+            autospec=True) as mock_connect:
+        with mock.patch(
+                'api.db.routers.time.monotonic',
+                return_value=100 + router.retry_interval - 1):
+            assert router.db_for_read(models.User) == 'default'
+
+    assert mock_connect.call_count == 0
+
+
+def test_db_for_read_unavailable_other_replica(replica, unavailable_replica):
+    """
+    If one replica is unavailable, reads should use the others.
+    """
+    router = routers.ReplicaRouter()
+
+    for _ in range(5):
+        assert router.db_for_read(models.User) == replica
@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+from django.core.handlers.wsgi import WSGIRequest
+
+from api.handlers import ASGIHandler
+
+
+def run(handler, scope, messages):
+    """
+    Call an ASGI handler with a series of messages from the client.
+
+    Returns:
+        The messages sent by the handler.
+    """
+    incoming = list(messages)
+    sent = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(handler(scope, receive, send))
+    finally:
+        loop.close()
+
+    return sent
+
+
+def http_scope(**kwargs):
+    return {
+        'headers': [],
+        'method': 'GET',
+        'path': '/',
+        'query_string': b'',
+        'type': 'http',
+        **kwargs,
+    }
+
+
+def test_call_http():
+    """
+    HTTP requests should be passed to the WSGI application and its
+    response sent back.
+    """
+    environs = []
+
+    def application(environ, start_response):
+        environs.append(dict(environ, body=environ['wsgi.input'].read()))
+        start_response('201 Created', [('Content-Type', 'text/plain')])
+
+        return [b'Hello, ', b'world']
+
+    scope = http_scope(
+        client=('10.0.0.1', 1234),
+        headers=[
+            (b'content-type', b'application/json'),
+            (b'x-forwarded-for', b'1.1.1.1'),
+            (b'x-forwarded-for', b'2.2.2.2'),
+        ],
+        method='POST',
+        path='/account/users/',
+        query_string=b'a=1',
+    )
+
+    sent = run(ASGIHandler(application, max_workers=1), scope, [
+        {'body': b'{"a":', 'more_body': True, 'type': 'http.request'},
+        {'body': b' 1}', 'type': 'http.request'},
+    ])
+
+    environ = environs[0]
+    assert environ['body'] == b'{"a": 1}'
+    assert environ['CONTENT_TYPE'] == 'application/json'
+    assert environ['HTTP_X_FORWARDED_FOR'] == '1.1.1.1,2.2.2.2'
+    assert environ['PATH_INFO'] == '/account/users/'
+    assert environ['QUERY_STRING'] == 'a=1'
+    assert environ['REMOTE_ADDR'] == '10.0.0.1'
+    assert environ['REQUEST_METHOD'] == 'POST'
+
+    assert sent[0] == {
+        'headers': [(b'content-type', b'text/plain')],
+        'status': 201,
+        'type': 'http.response.start',
+    }
+    body = b''.join(message['body'] for message in sent[1:])
+    assert body == b'Hello, world'
+    assert not sent[-1].get('more_body')
+
+
+def test_call_http_cookies():
+    """
+    Cookies split across several headers should be joined so that each
+    cookie can still be parsed.
+    """
+    requests = []
+
+    def application(environ, start_response):
+        requests.append(WSGIRequest(environ))
+        start_response('204 No Content', [])
+
+        return []
+
+    scope = http_scope(headers=[
+        (b'cookie', b'sessionid=abc'),
+        (b'cookie', b'csrftoken=def'),
+    ])
+
+    run(ASGIHandler(application, max_workers=1), scope, [
+        {'type': 'http.request'},
+    ])
+
+    assert requests[0].COOKIES == {'csrftoken': 'def', 'sessionid': 'abc'}
+
+
+def test_call_http_disconnect():
+    """
+    If the client disconnects before sending its request body, the WSGI
+    application should not be called.
+    """
+    def application(environ, start_response):
+        pytest.fail('The application should not be called.')
+
+    sent = run(ASGIHandler(application, max_workers=1), http_scope(), [
+        {'type': 'http.disconnect'},
+    ])
+
+    assert sent == []
+
+
+def test_call_http_empty_response():
+    """
+    A response without a body should still be started and finished.
+    """
+    def application(environ, start_response):
+        start_response('204 No Content', [])
+
+        return []
+
+    sent = run(ASGIHandler(application, max_workers=1), http_scope(), [
+        {'type': 'http.request'},
+    ])
+
+    assert sent == [
+        {'headers': [], 'status': 204, 'type': 'http.response.start'},
+        {'body': b'', 'type': 'http.response.body'},
+    ]
+
+
+def test_call_lifespan():
+    """
+    The thread pool should be shut down along with the server.
+    """
+    def application(environ, start_response):
+        start_response('200 OK', [])
+
+        return [b'']
+
+    handler = ASGIHandler(application, max_workers=1)
+    run(handler, http_scope(), [{'type': 'http.request'}])
+    assert handler._executor is not None
+
+    sent = run(handler, {'type': 'lifespan'}, [
+        {'type': 'lifespan.startup'},
+        {'type': 'lifespan.shutdown'},
+    ])
+
+    assert sent == [
+        {'type': 'lifespan.startup.complete'},
+        {'type': 'lifespan.shutdown.complete'},
+    ]
+    assert handler._executor is None
+
+
+def test_call_unsupported():
+    """
+    Connections other than HTTP requests should be rejected.
+    """
+    handler = ASGIHandler(lambda environ, start_response: [])
+
+    with pytest.raises(ValueError):
+        run(handler, {'type': 'websocket'}, [])
+
+
+def test_executor_default_size(settings):
+    """
+    The size of the thread pool should default to the ``ASGI_THREADS``
+    setting.
+    """
+    settings.ASGI_THREADS = 3
+    handler = ASGIHandler(lambda environ, start_response: [])
+
+    assert handler.executor._max_workers == 3
@@ -0,0 +1,40 @@
+from api import metrics
+
+
+def test_render():
+    """
+    Observations should be rendered as cumulative buckets per series.
+    """
+    histogram = metrics.Histogram('test_seconds', 'Test.', (0.1, 1))
+    histogram.observe(0.05, view='a')
+    histogram.observe(0.5, view='a')
+    histogram.observe(5, view='a')
+
+    assert histogram.render() == [
+        '# HELP test_seconds Test.',
+        '# TYPE test_seconds histogram',
+        'test_seconds_bucket{view="a",le="0.1"} 1',
+        'test_seconds_bucket{view="a",le="1"} 2',
+        'test_seconds_bucket{view="a",le="+Inf"} 3',
+        'test_seconds_sum{view="a"} 5.55',
+        'test_seconds_count{view="a"} 3',
+    ]
+
+
+def test_render_escapes_labels():
+    """
+    Quotes and backslashes in label values should be escaped.
+    """
+    histogram = metrics.Histogram('test', 'Test.', (1,))
+    histogram.observe(1, view='a"b\\c')
+
+    assert histogram.render()[-1] == 'test_count{view="a\\"b\\\\c"} 1'
+
+
+def test_render_empty():
+    """
+    A histogram without observations should only render its metadata.
+    """
+    histogram = metrics.Histogram('test', 'Test.', (1,))
+
+    assert histogram.render() == ['# HELP test Test.', '# TYPE test histogram']
@@ -0,0 +1,39 @@
+from rest_framework import status
+
+
+def test_get_anonymous(client, db):
+    """
+    Anonymous users should not be able to view the metrics.
+    """
+    response = client.get('/metrics/')
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_staff(client, user_factory):
+    """
+    Staff users should receive the metrics in the Prometheus format,
+    including metrics from registered collectors.
+    """
+    client.force_login(user_factory(is_staff=True))
+
+    response = client.get('/metrics/')
+    body = response.content.decode()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'account_user_cache_misses_total' in body
+
+
+def test_get_token(client, db, settings):
+    """
+    If a token is configured, it must be provided to view the metrics.
+    """
+    settings.METRICS_TOKEN = 'secret'
+
+    wrong = client.get('/metrics/', HTTP_AUTHORIZATION='Bearer wrong')
+    right = client.get('/metrics/', HTTP_AUTHORIZATION='Bearer secret')
+
+    assert wrong.status_code == status.HTTP_403_FORBIDDEN
+    assert right.status_code == status.HTTP_200_OK
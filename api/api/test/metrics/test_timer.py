@@ -0,0 +1,25 @@
+from api import metrics
+
+
+def test_timer():
+    """
+    Time spent in the timer should be added to the current request.
+    """
+    with metrics.measure_request() as request_metrics:
+        with metrics.timer('email'):
+            pass
+        with metrics.timer('email'):
+            pass
+
+    assert request_metrics.timings['email'] > 0
+    assert metrics.current() is None
+
+
+def test_timer_outside_request():
+    """
+    Timers used outside of a request should not fail.
+    """
+    with metrics.timer('email'):
+        pass
+
+    assert metrics.current() is None
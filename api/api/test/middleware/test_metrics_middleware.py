@@ -0,0 +1,81 @@
+import json
+import logging
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from api import metrics
+
+
+def test_call(api_client, caplog, monkeypatch, user_factory):
+    """
+    Each request should report its queries and timings in a header and
+    a log line, and be added to the histogram for its view.
+    """
+    metrics.REQUEST_QUERIES.clear()
+    api_client.force_authenticate(user=user_factory(is_staff=True))
+
+    # The request log isn't propagated to the root logger, where
+    # ``caplog`` listens.
+    monkeypatch.setattr(logging.getLogger('api.middleware'), 'propagate', True)
+
+    with caplog.at_level(logging.INFO, logger='api.middleware'):
+        response = api_client.get(reverse('account:registration'))
+
+    server_timing = response['Server-Timing']
+    assert 'db;dur=' in server_timing
+    assert 'hash;dur=' in server_timing
+    assert 'total;dur=' in server_timing
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record['db_queries'] >= 1
+    assert record['path'] == '/account/users/'
+    assert record['status'] == 200
+    assert record['view'] == 'account:registration'
+
+    assert (
+        'http_request_db_queries_count{view="account:registration"} 1'
+        in metrics.render()
+    )
+
+
+def test_call_anonymous(api_client, db, settings):
+    """
+    Responses to anonymous users should not reveal how their request was
+    handled.
+    """
+    settings.DEBUG = False
+    settings.SERVER_TIMING_PUBLIC = False
+
+    data = {
+        'email': 'test@example.com',
+        'name': 'John Smith',
+        'password': 'MySuperSecretPassword',
+    }
+
+    response = api_client.post(reverse('account:registration'), data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert 'Server-Timing' not in response
+
+
+def test_call_public(api_client, db, settings):
+    """
+    If enabled, responses to every user should include timings.
+    """
+    settings.SERVER_TIMING_PUBLIC = True
+
+    response = api_client.get(reverse('account:registration'))
+
+    assert 'total;dur=' in response['Server-Timing']
+
+
+def test_call_unresolved(client, db):
+    """
+    Requests that don't match a URL should be grouped together.
+    """
+    metrics.REQUEST_DURATION.clear()
+
+    client.get('/does-not-exist/')
+
+    assert 'view="<unresolved>"' in metrics.render()
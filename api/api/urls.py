@@ -17,9 +17,12 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework.documentation import include_docs_urls
 
+from api import metrics
+
 urlpatterns = [
     path('account/', include('account.urls', namespace='account')),
     path('admin/', admin.site.urls),
     path('auth/', include('auth.urls', namespace='auth')),
     path('docs/', include_docs_urls('UltiManager API')),
+    path('metrics/', metrics.metrics_view, name='metrics'),
 ]
@@ -0,0 +1,91 @@
+from django.utils.translation import ugettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from auth import denylist
+
+
+class TokenUser:
+    """
+    A lightweight, read-only user built from the claims embedded in an
+    access token by ``EmailTokenObtainPairSerializer``.
+    """
+    __slots__ = (
+        'id',
+        'is_active',
+        'is_staff',
+        'name',
+        'primary_email_id',
+        'token',
+    )
+
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, token):
+        """
+        Args:
+            token:
+                The validated token to build the user from.
+        """
+        self.id = token[api_settings.USER_ID_CLAIM]
+        self.is_active = token.get('is_active', True)
+        self.is_staff = token.get('is_staff', False)
+        self.name = token.get('name', '')
+        self.primary_email_id = token.get('primary_email_id')
+        self.token = token
+
+    def __eq__(self, other):
+        return isinstance(other, TokenUser) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def pk(self):
+        return self.id
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the claims in the access token
+    instead of looking up the user.
+
+    This avoids any per-request database access, at the cost of the
+    user's details being as old as the refresh token the access token
+    was minted from. Tokens can be revoked through ``auth.denylist``.
+    """
+
+    def get_user(self, validated_token):
+        """
+        Build a user from the claims in the provided token.
+
+        Args:
+            validated_token:
+                The validated token provided with the request.
+
+        Returns:
+            A ``TokenUser`` built from the token's claims.
+
+        Raises:
+            InvalidToken:
+                If the token does not identify a user, has been revoked,
+                or belongs to an inactive user.
+        """
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification'),
+            )
+
+        if denylist.is_revoked(validated_token):
+            raise InvalidToken(_('Token has been revoked'))
+
+        user = TokenUser(validated_token)
+        if not user.is_active:
+            raise InvalidToken(_('User is inactive'))
+
+        return user
@@ -0,0 +1,98 @@
+"""
+Revocation of JSON web tokens without a database lookup.
+
+Revoked token IDs, and users whose tokens were all revoked, are stored
+in Django's default cache until the revoked tokens would have expired
+anyway. Checking a token is a single cache lookup, and the denylist
+never holds more entries than there are unexpired revoked tokens.
+"""
+
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+
+JTI_KEY_FORMAT = 'token_denylist_jti_%s'
+USER_KEY_FORMAT = 'token_denylist_user_%s'
+
+# Claim recording the ID of the refresh token that a token was minted
+# from. Access tokens inherit it, so revoking a refresh token also
+# revokes every access token minted from it.
+REFRESH_JTI_CLAIM = 'refresh_jti'
+
+
+def is_revoked(token) -> bool:
+    """
+    Determine if a token has been revoked.
+
+    Args:
+        token:
+            The validated token to check.
+
+    Returns:
+        A boolean indicating if the token itself, the refresh token it
+        was minted from, or every token issued to its user before it,
+        has been revoked.
+    """
+    jti_keys = [JTI_KEY_FORMAT % token[api_settings.JTI_CLAIM]]
+    if token.get(REFRESH_JTI_CLAIM):
+        jti_keys.append(JTI_KEY_FORMAT % token[REFRESH_JTI_CLAIM])
+
+    user_key = USER_KEY_FORMAT % token.get(api_settings.USER_ID_CLAIM)
+
+    entries = cache.get_many(jti_keys + [user_key])
+    if any(key in entries for key in jti_keys):
+        return True
+
+    revoked_at = entries.get(user_key)
+
+    return revoked_at is not None and token.get('iat', 0) <= revoked_at
+
+
+def revoke_token(token):
+    """
+    Revoke a single token.
+
+    Revoking a refresh token also revokes the access tokens minted from
+    it, so its ID is kept until they would have expired too.
+
+    Args:
+        token:
+            The validated token to revoke.
+    """
+    remaining = token['exp'] - time.time()
+    if remaining <= 0:
+        return
+
+    if token.get(api_settings.TOKEN_TYPE_CLAIM) == 'refresh':
+        remaining += api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+
+    cache.set(
+        JTI_KEY_FORMAT % token[api_settings.JTI_CLAIM],
+        True,
+        timeout=int(remaining) + 1,
+    )
+
+
+def revoke_user(user_id):
+    """
+    Revoke every token issued to a user up to now.
+
+    Args:
+        user_id:
+            The ID of the user whose tokens should be revoked.
+    """
+    # Access tokens minted from a refresh token keep the refresh
+    # token's issue time, so every token issued up to now expires by
+    # the time the longest lived token would.
+    lifetime = max(
+        api_settings.ACCESS_TOKEN_LIFETIME,
+        api_settings.REFRESH_TOKEN_LIFETIME,
+    )
+
+    cache.set(
+        USER_KEY_FORMAT % user_id,
+        int(time.time()),
+        timeout=int(lifetime.total_seconds()) + 1,
+    )
@@ -1,4 +1,15 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.utils.translation import ugettext as _, ugettext_lazy
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+from rest_framework_simplejwt.utils import datetime_to_epoch
+
+from auth import denylist
 
 
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -7,3 +18,107 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     instead of the user model's ``USERNAME_FIELD`` attribute.
     """
     username_field = 'email'
+
+    @classmethod
+    def get_token(cls, user):
+        """
+        Get a refresh token for a user.
+
+        The claims needed to build a ``TokenUser`` are embedded in the
+        token so that requests authenticated with
+        ``StatelessJWTAuthentication`` don't have to look up the user.
+        Access tokens minted from the refresh token inherit the claims,
+        including the refresh token's ID so that revoking the refresh
+        token revokes them too.
+
+        The issue time is also embedded, since ``auth.denylist`` uses it
+        to revoke every token issued to a user before a given time, and
+        the versions of djangorestframework-simplejwt supporting Python
+        3.6 don't add it.
+
+        Args:
+            user:
+                The user to issue the token for.
+
+        Returns:
+            A refresh token for the user.
+        """
+        token = super().get_token(user)
+
+        token['iat'] = datetime_to_epoch(token.current_time)
+        token['is_active'] = user.is_active
+        token['is_staff'] = user.is_staff
+        token['name'] = user.name
+        token['primary_email_id'] = (
+            str(user.primary_email_id) if user.primary_email_id else None
+        )
+        token[denylist.REFRESH_JTI_CLAIM] = token[api_settings.JTI_CLAIM]
+
+        return token
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Serializer for refreshing a token that refuses revoked refresh
+    tokens.
+    """
+
+    def validate(self, attrs):
+        """
+        Mint a new access token if the refresh token has not been
+        revoked.
+
+        Args:
+            attrs:
+                The data received by the serializer.
+
+        Returns:
+            The new access token.
+
+        Raises:
+            TokenError:
+                If the refresh token is invalid, expired, or revoked.
+        """
+        if denylist.is_revoked(RefreshToken(attrs['refresh'])):
+            raise TokenError(_('Token has been revoked'))
+
+        return super().validate(attrs)
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    """
+    Serializer for revoking a token.
+    """
+    token = serializers.CharField(
+        help_text=ugettext_lazy('The access or refresh token to revoke.'),
+        write_only=True,
+    )
+
+    def validate_token(self, token):
+        """
+        Validate the provided token.
+
+        Args:
+            token:
+                The token received by the serializer.
+
+        Returns:
+            The decoded token.
+
+        Raises:
+            serializers.ValidationError:
+                If the token is invalid or expired.
+        """
+        try:
+            return UntypedToken(token)
+        except TokenError:
+            raise serializers.ValidationError(
+                code='invalid_token',
+                detail=_('The provided token is invalid or expired.'),
+            )
+
+    def save(self):
+        """
+        Revoke the provided token.
+        """
+        denylist.revoke_token(self.validated_data['token'])
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from auth import authentication, denylist, serializers
+
+
+@pytest.fixture
+def jwt_auth() -> authentication.StatelessJWTAuthentication:
+    """
+    Fixture to get an instance of the authentication class.
+    """
+    return authentication.StatelessJWTAuthentication()
+
+
+def get_access_token(user):
+    """
+    Get an access token for a user as issued by the token endpoint.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(user)
+
+    return refresh.access_token
+
+
+def test_get_user(django_assert_num_queries, jwt_auth, user_factory):
+    """
+    The user should be built from the token's claims without querying
+    the database.
+    """
+    user = user_factory(is_staff=True)
+    token = get_access_token(user)
+
+    with django_assert_num_queries(0):
+        token_user = jwt_auth.get_user(token)
+
+    assert token_user.id == str(user.id)
+    assert token_user.pk == token_user.id
+    assert token_user.is_active
+    assert token_user.is_authenticated
+    assert token_user.is_staff
+    assert token_user.name == user.name
+    assert str(token_user) == user.name
+
+
+def test_get_user_inactive_claim(jwt_auth, user_factory):
+    """
+    Tokens claiming the user is inactive should be rejected.
+    """
+    token = get_access_token(user_factory())
+    token['is_active'] = False
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_revoked_token(jwt_auth, user_factory):
+    """
+    Revoked tokens should be rejected.
+    """
+    token = get_access_token(user_factory())
+    denylist.revoke_token(token)
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_issued_after_revocation(
+        jwt_auth,
+        monkeypatch,
+        user_factory):
+    """
+    Tokens issued after a user's tokens were revoked should be accepted.
+    """
+    user = user_factory()
+    revoked_at = time.time() - 60
+    with monkeypatch.context() as patch:
+        patch.setattr(denylist.time, 'time', lambda: revoked_at)
+        denylist.revoke_user(user.pk)
+
+    token = get_access_token(user)
+
+    assert 'iat' in token
+    assert jwt_auth.get_user(token).id == str(user.id)
+
+
+def test_get_user_refresh_token_revoked(jwt_auth, user_factory):
+    """
+    Access tokens minted from a revoked refresh token should be
+    rejected.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(
+        user_factory(),
+    )
+    token = refresh.access_token
+    denylist.revoke_token(refresh)
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_deactivated(jwt_auth, user_factory):
+    """
+    Deactivating a user should revoke the tokens already issued to them.
+    """
+    user = user_factory()
+    token = get_access_token(user)
+
+    user.is_active = False
+    user.save()
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_staff_changed(jwt_auth, user_factory):
+    """
+    Changing a user's staff status should revoke the tokens already
+    issued to them, since their tokens claim the old status.
+    """
+    user = user_factory(is_staff=True)
+    token = get_access_token(user)
+
+    user.is_staff = False
+    user.save()
+
+    with pytest.raises(InvalidToken):
+        jwt_auth.get_user(token)
+
+
+def test_get_user_unrelated_change(jwt_auth, user_factory):
+    """
+    Saving a user without changing their active or staff status should
+    not revoke their tokens.
+    """
+    user = user_factory()
+    token = get_access_token(user)
+
+    user.name = 'New Name'
+    user.save()
+
+    assert jwt_auth.get_user(token).id == str(user.id)
+
+
+def test_token_user_slots(jwt_auth, user_factory):
+    """
+    Token users should not have an instance dictionary.
+    """
+    token_user = jwt_auth.get_user(get_access_token(user_factory()))
+
+    assert not hasattr(token_user, '__dict__')
@@ -0,0 +1,35 @@
+from account import models
+from auth import serializers
+
+
+def test_get_token_claims(user_factory):
+    """
+    The token should contain the claims needed to build a user without
+    querying the database, and access tokens should inherit them.
+    """
+    user = user_factory(is_staff=True)
+    user.primary_email = models.Email.objects.create(
+        address='test@example.com',
+        user=user,
+    )
+    user.save()
+
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(user)
+    access = refresh.access_token
+
+    for token in (refresh, access):
+        assert token['is_active'] is True
+        assert token['is_staff'] is True
+        assert token['name'] == user.name
+        assert token['primary_email_id'] == str(user.primary_email_id)
+
+
+def test_get_token_no_primary_email(user_factory):
+    """
+    Users without a primary email should have a null claim.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(
+        user_factory(),
+    )
+
+    assert refresh['primary_email_id'] is None
@@ -0,0 +1,72 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from auth import authentication, denylist, serializers
+
+
+def test_post(api_client, user_factory):
+    """
+    Sending a valid refresh token should return a new access token.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(
+        user_factory(),
+    )
+
+    url = reverse('auth:token-refresh')
+    response = api_client.post(url, {'refresh': str(refresh)})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'access' in response.data
+
+
+def test_post_revoked_token(api_client, user_factory):
+    """
+    Sending a revoked refresh token should not return an access token.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(
+        user_factory(),
+    )
+    denylist.revoke_token(refresh)
+
+    url = reverse('auth:token-refresh')
+    response = api_client.post(url, {'refresh': str(refresh)})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert 'access' not in response.data
+
+
+def test_post_revoked_user(api_client, user_factory):
+    """
+    Refresh tokens issued to a user before their tokens were all revoked
+    should not be refreshable.
+    """
+    user = user_factory()
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(user)
+    denylist.revoke_user(user.pk)
+
+    url = reverse('auth:token-refresh')
+    response = api_client.post(url, {'refresh': str(refresh)})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_revoke_refreshed_access_token(api_client, user_factory):
+    """
+    Revoking a refresh token should revoke the access tokens already
+    minted from it.
+    """
+    refresh = serializers.EmailTokenObtainPairSerializer.get_token(
+        user_factory(),
+    )
+
+    url = reverse('auth:token-refresh')
+    response = api_client.post(url, {'refresh': str(refresh)})
+    access = authentication.StatelessJWTAuthentication().get_validated_token(
+        response.data['access'],
+    )
+
+    assert not denylist.is_revoked(access)
+
+    denylist.revoke_token(refresh)
+
+    assert denylist.is_revoked(access)
@@ -0,0 +1,28 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from auth import denylist
+
+
+def test_post_invalid_token(api_client, db):
+    """
+    Sending an invalid token should return a 400 response.
+    """
+    url = reverse('auth:token-revoke')
+    response = api_client.post(url, {'token': 'not-a-token'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_post_valid_token(api_client, user_factory):
+    """
+    Sending a valid token should add it to the denylist.
+    """
+    token = RefreshToken.for_user(user_factory()).access_token
+
+    url = reverse('auth:token-revoke')
+    response = api_client.post(url, {'token': str(token)})
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert denylist.is_revoked(token)
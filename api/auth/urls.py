@@ -1,5 +1,4 @@
 from django.urls import path
-from rest_framework_simplejwt.views import token_refresh
 
 from auth import views
 
@@ -15,7 +14,12 @@ urlpatterns = [
     ),
     path(
         'token/refresh/',
-        token_refresh,
+        views.RevocableTokenRefreshView.as_view(),
         name='token-refresh',
     ),
+    path(
+        'token/revoke/',
+        views.TokenRevokeView.as_view(),
+        name='token-revoke',
+    ),
 ]
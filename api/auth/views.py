@@ -1,5 +1,11 @@
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework_simplejwt.views import (
+    TokenObtainPairView,
+    TokenRefreshView,
+)
 
+from account import throttling
 from auth import serializers
 
 
@@ -9,3 +15,35 @@ class EmailTokenObtainPairView(TokenObtainPairView):
     serializer.
     """
     serializer_class = serializers.EmailTokenObtainPairSerializer
+    throttle_classes = (
+        throttling.IPRateThrottle,
+        throttling.EmailRateThrottle,
+    )
+    throttle_scope = 'token'
+
+
+class RevocableTokenRefreshView(TokenRefreshView):
+    """
+    Custom view to refresh a token that refuses revoked refresh tokens.
+    """
+    serializer_class = serializers.RevocableTokenRefreshSerializer
+
+
+class TokenRevokeView(generics.GenericAPIView):
+    """
+    post:
+    # Revoke a Token
+
+    Revoke an access or refresh token so that it can no longer be used
+    with endpoints that authenticate using token claims alone.
+    """
+    authentication_classes = ()
+    permission_classes = ()
+    serializer_class = serializers.TokenRevokeSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -4,8 +4,11 @@ from typing import Type
 import factory
 
 import pytest
+from django.core.cache import caches
 from rest_framework import test
 
+from account import caching
+
 
 class UserFactory(factory.django.DjangoModelFactory):
     """
@@ -46,6 +49,20 @@ def api_client() -> test.APIClient:
     return test.APIClient()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Fixture that clears every cache after each test so that cached
+    values, such as rate limiting counters, don't leak between tests.
+    """
+    yield
+
+    for cache in caches.all():
+        cache.clear()
+
+    caching.get_user_cache().clear()
+
+
 @pytest.fixture
 def env():
     """